@@ -0,0 +1,104 @@
+# =============================================================================
+# Benchmark: Numba-accelerated backend vs the odeint + NumPy path
+# =============================================================================
+# Purpose: Times starts (integration + metrics) four ways: odeint on the
+#          reference dynamics as in v4.0.0, odeint on the compiled
+#          right-hand sides (solver='odeint'), the JIT-compiled RK4 +
+#          metrics kernels one start at a time (solver='numba'), and
+#          --batch starts per accelerated_batch call (inertia spread over
+#          +0..20%, as in a Monte Carlo study). Reports starts per second,
+#          the speedup and the largest speed error against a
+#          tight-tolerance odeint reference. Requires Numba.
+#
+# Usage:
+#   python benchmarks/bench_accelerated.py
+#   python benchmarks/bench_accelerated.py --repeats 50 --time-points 300 --batch 1000
+# =============================================================================
+
+import argparse
+import sys
+import time as timer
+import warnings
+from pathlib import Path
+
+import numpy as np
+from scipy.integrate import odeint
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from vfd_simulation import DEFAULT_CONFIG, calculate_metrics, simulate_start
+from vfd_simulation.accelerated import HAVE_NUMBA, accelerated_batch
+from vfd_simulation.solvers import start_dynamics, start_ramp_time, start_rhs
+
+def reference_start(method, config):
+    # The v4.0.0 code path
+    ramp_time = start_ramp_time(method, config)
+    time = np.linspace(0, ramp_time, config.time_points)
+    omega_rad = odeint(start_dynamics(method), [0], time,
+                       args=(config.load_torque, config.load_type, ramp_time, config))[:, 0]
+    calculate_metrics(time, omega_rad, method, ramp_time, config=config)
+    return time, omega_rad
+
+def best_of(func, repeats):
+    best = float('inf')
+    for _ in range(repeats):
+        start = timer.perf_counter()
+        result = func()
+        best = min(best, timer.perf_counter() - start)
+    return best, result
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the Numba backend')
+    parser.add_argument('--repeats', type=int, default=20)
+    parser.add_argument('--time-points', type=int, default=DEFAULT_CONFIG.time_points)
+    parser.add_argument('--batch', type=int, default=200, help='starts per accelerated_batch call')
+    # Constant-power starts are left out by default: odeint fails on their
+    # load step, so neither its timing nor its solution is meaningful
+    parser.add_argument('--load-types', nargs='+', default=['constant_torque', 'fan_pump'])
+    args = parser.parse_args()
+    warnings.simplefilter('ignore')
+
+    if not HAVE_NUMBA:
+        print("Numba is not installed; solver='numba' falls back to odeint.")
+        return
+
+    start = timer.perf_counter()
+    simulate_start('vfd', DEFAULT_CONFIG.replace(solver='numba'))
+    accelerated_batch('vfd', [DEFAULT_CONFIG])
+    print(f"First call (JIT compile or cache load): {timer.perf_counter() - start:.2f} s\n")
+
+    print(f"{'Start':<32}{'Path':<22}{'ms/start':>10}{'starts/s':>10}{'vs v4.0.0':>11}"
+          f"{'vs odeint':>11}{'Max err (rad/s)':>17}")
+    print("-" * 113)
+    for load_type in args.load_types:
+        config = DEFAULT_CONFIG.replace(load_type=load_type, time_points=args.time_points)
+        for method in ('vfd', 'soft_starter'):
+            time = np.linspace(0, start_ramp_time(method, config), config.time_points)
+            exact = odeint(start_rhs(method, config), [0], time,
+                           rtol=1e-12, atol=1e-12, mxstep=100000)[:, 0]
+
+            # Row 0 of the batch is config itself
+            batch = [config.replace(inertia=config.inertia * scale)
+                     for scale in np.linspace(1.0, 1.2, args.batch)]
+            paths = {
+                'v4.0.0 odeint': (1, lambda: reference_start(method, config)[1]),
+                'odeint': (1, lambda: simulate_start(method, config).omega_rad),
+                'numba': (1, lambda: simulate_start(method, config.replace(solver='numba')).omega_rad),
+                f'numba batch x{args.batch}': (args.batch,
+                                               lambda: accelerated_batch(method, batch)[1][0]),
+            }
+            seconds = {}
+            for name, (starts, run) in paths.items():
+                # A batch call runs many starts: fewer repeats
+                repeats = args.repeats if starts == 1 else max(args.repeats // 4, 3)
+                elapsed, omega_rad = best_of(run, repeats)
+                seconds[name] = elapsed / starts
+                error = np.max(np.abs(omega_rad - exact))
+                print(f"{method + ' / ' + load_type:<32}{name:<22}{seconds[name] * 1000:>10.3f}"
+                      f"{1 / seconds[name]:>10,.0f}"
+                      f"{seconds['v4.0.0 odeint'] / seconds[name]:>10.1f}x"
+                      f"{seconds.get('odeint', seconds[name]) / seconds[name]:>10.1f}x"
+                      f"{error:>17.2e}")
+
+if __name__ == '__main__':
+    main()
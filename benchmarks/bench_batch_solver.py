@@ -0,0 +1,82 @@
+# =============================================================================
+# Benchmark: batched multi-scenario solver vs looping odeint
+# =============================================================================
+# Purpose: Times simulate_batch (vfd_simulation/batch.py) against one odeint call per
+#          scenario using the scalar v4 dynamics, on random mixes of inertia,
+#          load factor, ramp time, load type and start method.
+#
+# Usage:
+#   python benchmarks/bench_batch_solver.py
+#   python benchmarks/bench_batch_solver.py --sizes 100 1000 --loop-max 200
+# =============================================================================
+
+import argparse
+import sys
+import time as timer
+import warnings
+from pathlib import Path
+
+import numpy as np
+from scipy.integrate import odeint
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from vfd_simulation import DEFAULT_CONFIG, models
+from vfd_simulation.batch import simulate_batch
+
+def random_scenarios(n, seed=0):
+    # Constant-power loads are left out: their load step at 10% speed can
+    # stall the scalar solver, which would dominate the loop timing
+    rng = np.random.default_rng(seed)
+    method = rng.choice(['vfd', 'soft_starter'], n)
+    return {
+        'inertia': rng.uniform(80, 250, n),
+        'load_factor': rng.uniform(0.3, 0.9, n),
+        'ramp_time': np.where(method == 'vfd', rng.uniform(10, 40, n), rng.uniform(10, 30, n)),
+        'load_type': rng.choice(['constant_torque', 'fan_pump'], n),
+        'method': method,
+    }
+
+def solve_loop(scenarios, rows):
+    # One odeint call per scenario, the way the scripts run a single start
+    omega = []
+    for i in rows:
+        config = DEFAULT_CONFIG.replace(inertia=scenarios['inertia'][i])
+        dynamics = (models.vfd_motor_dynamics if scenarios['method'][i] == 'vfd'
+                    else models.soft_start_motor_dynamics)
+        ramp_time = scenarios['ramp_time'][i]
+        time = np.linspace(0, ramp_time, config.time_points)
+        args = (config.rated_torque * scenarios['load_factor'][i], scenarios['load_type'][i],
+                ramp_time, config)
+        omega.append(odeint(dynamics, [0], time, args=args)[:, 0])
+    return np.array(omega)
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the batched solver')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 100, 1000, 10000])
+    parser.add_argument('--loop-max', type=int, default=500,
+                        help='largest scenario count solved with the loop; larger counts are extrapolated')
+    args = parser.parse_args()
+    warnings.simplefilter('ignore')
+
+    print(f"{'Scenarios':>10}{'Loop (s)':>12}{'Batch (s)':>12}{'ms/scenario':>14}{'Speedup':>10}{'Max rel err':>14}")
+    print("-" * 72)
+    for n in args.sizes:
+        scenarios = random_scenarios(n)
+
+        start = timer.perf_counter()
+        _, omega_batch = simulate_batch(**scenarios)
+        t_batch = timer.perf_counter() - start
+
+        rows = np.arange(min(n, args.loop_max))
+        start = timer.perf_counter()
+        omega_loop = solve_loop(scenarios, rows)
+        t_loop = (timer.perf_counter() - start) * n / rows.size
+        loop_label = f'{t_loop:.2f}' if rows.size == n else f'~{t_loop:.1f}'
+
+        err = np.max(np.abs(omega_batch[rows] - omega_loop)) / np.max(np.abs(omega_loop))
+        print(f"{n:>10,}{loop_label:>12}{t_batch:>12.3f}{t_batch / n * 1000:>14.3f}"
+              f"{t_loop / t_batch:>9.0f}x{err:>14.1e}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,146 @@
+# =============================================================================
+# Benchmark: vectorized calculate_metrics vs the original per-sample loop
+# =============================================================================
+# Purpose: Times the array-based calculate_metrics in vfd_simulation_v4.py
+#          against the v4.0.0 per-sample loop (kept below as the reference)
+#          and checks that both produce the same numbers.
+#
+# Usage:
+#   python benchmarks/bench_calculate_metrics.py
+#   python benchmarks/bench_calculate_metrics.py --sizes 1000 100000 --loop-max 100000
+# =============================================================================
+
+import argparse
+import sys
+import time as timer
+from pathlib import Path
+
+import numpy as np
+from scipy.integrate import odeint
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from vfd_simulation import DEFAULT_CONFIG as config
+from vfd_simulation import calculate_metrics, models
+
+# =============================================================================
+# REFERENCE IMPLEMENTATION (v4.0.0 loop)
+# =============================================================================
+
+def calculate_metrics_loop(time, omega_rad, method='vfd', ramp_time=30):
+    n_points = len(time)
+    current = np.zeros(n_points)
+    torque = np.zeros(n_points)
+    slip = np.zeros(n_points)
+    power_in = np.zeros(n_points)
+    power_out = np.zeros(n_points)
+    efficiency = np.zeros(n_points)
+    load_torque_array = np.zeros(n_points)
+    voltage_array = np.zeros(n_points)
+
+    for i, t in enumerate(time):
+        if method == 'vfd':
+            freq = models.vfd_freq_func(t, ramp_time, config)
+            if freq < 0.5:
+                continue
+            sync_speed_rad = (120 * freq / config.poles) * (2 * np.pi / 60)
+            voltage_array[i] = models.vfd_voltage_func(freq, config)
+        else:
+            sync_speed_rad = config.sync_speed_rad
+            freq = config.base_freq
+            voltage_array[i] = models.soft_start_voltage_func(t, ramp_time, config)
+
+        s = (sync_speed_rad - omega_rad[i]) / sync_speed_rad if sync_speed_rad > 0 else 1.0
+        s = np.clip(s, 0, 1.0)
+        slip[i] = s * 100
+
+        a, b, c = 2.5, 0.15, 0.08
+        torque_ratio = (a * s) / (s**2 + b * s + c)
+
+        if method == 'vfd':
+            freq_ratio = freq / config.base_freq
+            torque[i] = config.rated_torque * torque_ratio * freq_ratio
+            if freq < config.base_freq * 0.15:
+                boost = 1 + config.v_boost * (1 - freq / (config.base_freq * 0.15))
+                torque[i] *= boost
+        else:
+            voltage_ratio = voltage_array[i] / config.voltage
+            torque[i] = config.rated_torque * torque_ratio * (voltage_ratio ** 2)
+
+        speed_ratio = omega_rad[i] / config.sync_speed_rad if config.sync_speed_rad > 0 else 0
+        load_torque_array[i] = models.get_load_torque(speed_ratio, config.load_torque, config.load_type)
+
+        torque_component = config.fla * (torque[i] / config.rated_torque)
+        magnetizing_component = config.fla * 0.3
+        current[i] = np.sqrt(torque_component**2 + magnetizing_component**2)
+
+        if method == 'soft_starter' and t < ramp_time:
+            voltage_ratio = voltage_array[i] / config.voltage
+            if voltage_ratio > 0.3:
+                current[i] *= (1.2 / voltage_ratio)
+
+        power_out[i] = (omega_rad[i] * load_torque_array[i]) / 1000
+        power_in[i] = (np.sqrt(3) * voltage_array[i] * current[i] * config.power_factor) / 1000
+
+        if power_in[i] > 0:
+            efficiency[i] = (power_out[i] / power_in[i]) * 100
+
+    return current, torque, slip, load_torque_array, power_in, power_out, efficiency, voltage_array
+
+# =============================================================================
+# BENCHMARK
+# =============================================================================
+
+def reference_trajectory(method, ramp_time, n_points):
+    # Solve once on the default grid and resample, so every size sees the same start
+    base_time = np.linspace(0, ramp_time, config.time_points)
+    dynamics = models.vfd_motor_dynamics if method == 'vfd' else models.soft_start_motor_dynamics
+    omega = odeint(dynamics, [0], base_time, args=(config.load_torque, config.load_type, ramp_time, config))[:, 0]
+    time = np.linspace(0, ramp_time, n_points)
+    return time, np.interp(time, base_time, omega)
+
+def best_of(func, repeats):
+    best = float('inf')
+    for _ in range(repeats):
+        start = timer.perf_counter()
+        result = func()
+        best = min(best, timer.perf_counter() - start)
+    return best, result
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark calculate_metrics')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 100000, 10000000])
+    parser.add_argument('--loop-max', type=int, default=100000,
+                        help='largest size timed with the loop; larger sizes are extrapolated')
+    parser.add_argument('--repeats', type=int, default=3)
+    args = parser.parse_args()
+
+    cases = [('vfd', config.vfd_ramp_time), ('soft_starter', config.soft_start_ramp_time)]
+
+    print(f"{'Method':<14}{'Samples':>12}{'Loop (s)':>14}{'Vector (s)':>14}{'Speedup':>10}{'Max rel err':>14}")
+    print("-" * 78)
+    for method, ramp_time in cases:
+        for n_points in args.sizes:
+            time, omega = reference_trajectory(method, ramp_time, n_points)
+            t_vec, vec = best_of(lambda: calculate_metrics(time, omega, method, ramp_time),
+                                 args.repeats)
+
+            if n_points <= args.loop_max:
+                t_loop, ref = best_of(lambda: calculate_metrics_loop(time, omega, method, ramp_time), 1)
+                loop_label = f'{t_loop:.4f}'
+                err = max(np.max(np.abs(v - r) / np.maximum(np.abs(r), 1e-12))
+                          for v, r in zip(vec, ref))
+                err_label = f'{err:.1e}'
+            else:
+                # Per-sample cost is flat, so scale from a loop-max sized run
+                sub = slice(None, None, max(1, n_points // args.loop_max))
+                t_sub, _ = best_of(lambda: calculate_metrics_loop(time[sub], omega[sub], method, ramp_time), 1)
+                t_loop = t_sub * n_points / len(time[sub])
+                loop_label = f'~{t_loop:.1f}'
+                err_label = 'n/a'
+
+            print(f"{method:<14}{n_points:>12,}{loop_label:>14}{t_vec:>14.4f}"
+                  f"{t_loop / t_vec:>9.0f}x{err_label:>14}")
+
+if __name__ == '__main__':
+    main()
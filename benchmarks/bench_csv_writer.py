@@ -0,0 +1,130 @@
+# =============================================================================
+# Benchmark: bulk CSV writer vs per-row writerow loop
+# =============================================================================
+# Purpose: Times write_comparison_csv (vfd_simulation/report.py), which
+#          formats whole chunks of rows at once, against the v4.0.0 loop that
+#          calls writer.writerow() with f-strings for every sample, and checks
+#          that both produce the same bytes.
+#
+# Usage:
+#   python benchmarks/bench_csv_writer.py
+#   python benchmarks/bench_csv_writer.py --sizes 10000 1000000 --loop-max 100000
+# =============================================================================
+
+import argparse
+import csv
+import sys
+import tempfile
+import time as timer
+import warnings
+from dataclasses import replace
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from vfd_simulation import simulate
+from vfd_simulation.report import write_comparison_csv
+from vfd_simulation.simulation import StartTrajectory
+
+# =============================================================================
+# REFERENCE IMPLEMENTATION (v4.0.0 loop)
+# =============================================================================
+
+def write_comparison_csv_loop(result, filename):
+    config, vfd, ss = result.config, result.vfd, result.soft_starter
+    vfd_omega_rpm = vfd.omega_rpm
+    ss_omega_rpm = ss.omega_rpm
+
+    with open(filename, 'w', newline='') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(['VFD vs Soft Starter Comparison - Motor Startup Simulation'])
+        writer.writerow(['Generated:', datetime.now().strftime("%Y-%m-%d %H:%M:%S")])
+        writer.writerow(['Motor Rating:', f'{config.power_hp} HP ({config.power_kw:.1f} kW)'])
+        writer.writerow(['Load Type:', config.load_type])
+        writer.writerow([])
+
+        # VFD Data
+        writer.writerow(['VFD DATA'])
+        writer.writerow(['Time (s)', 'Speed (RPM)', 'Current (A)', 'Torque (Nm)',
+                        'Slip (%)', 'Power In (kW)', 'Power Out (kW)', 'Efficiency (%)'])
+        for i in range(len(vfd.time)):
+            writer.writerow([f'{vfd.time[i]:.3f}', f'{vfd_omega_rpm[i]:.1f}',
+                           f'{vfd.current[i]:.1f}', f'{vfd.torque[i]:.1f}',
+                           f'{vfd.slip[i]:.2f}', f'{vfd.power_in[i]:.2f}',
+                           f'{vfd.power_out[i]:.2f}', f'{vfd.efficiency[i]:.1f}'])
+
+        writer.writerow([])
+        writer.writerow(['SOFT STARTER DATA'])
+        writer.writerow(['Time (s)', 'Speed (RPM)', 'Current (A)', 'Torque (Nm)',
+                        'Slip (%)', 'Power In (kW)', 'Power Out (kW)', 'Efficiency (%)'])
+        for i in range(len(ss.time)):
+            writer.writerow([f'{ss.time[i]:.3f}', f'{ss_omega_rpm[i]:.1f}',
+                           f'{ss.current[i]:.1f}', f'{ss.torque[i]:.1f}',
+                           f'{ss.slip[i]:.2f}', f'{ss.power_in[i]:.2f}',
+                           f'{ss.power_out[i]:.2f}', f'{ss.efficiency[i]:.1f}'])
+
+# =============================================================================
+# BENCHMARK
+# =============================================================================
+
+def resample(trajectory, n_points):
+    # Interpolate every column onto n_points samples, so every size writes
+    # the same start
+    time = np.linspace(trajectory.time[0], trajectory.time[-1], n_points)
+    columns = {name: np.interp(time, trajectory.time, getattr(trajectory, name))
+               for name in ('omega_rad', 'current', 'torque', 'slip', 'load_torque',
+                            'power_in', 'power_out', 'efficiency', 'voltage')}
+    return StartTrajectory(time=time, **columns)
+
+def data_bytes(filename):
+    # File contents without the timestamp line
+    lines = Path(filename).read_bytes().split(b'\r\n')
+    return b'\r\n'.join(line for line in lines if not line.startswith(b'Generated:'))
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the CSV writer')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 1000000])
+    parser.add_argument('--loop-max', type=int, default=1000000,
+                        help='largest size timed with the loop; larger sizes are extrapolated')
+    args = parser.parse_args()
+    warnings.simplefilter('ignore')
+
+    base = simulate()
+    workdir = Path(tempfile.mkdtemp())
+
+    print(f"{'Samples':>12}{'Loop (s)':>12}{'Bulk (s)':>12}{'Speedup':>10}{'File (MB)':>12}{'Identical':>11}")
+    print("-" * 69)
+    for n_points in args.sizes:
+        result = replace(base, vfd=resample(base.vfd, n_points),
+                         soft_starter=resample(base.soft_starter, n_points))
+        bulk_file, loop_file = workdir / 'bulk.csv', workdir / 'loop.csv'
+
+        start = timer.perf_counter()
+        write_comparison_csv(result, bulk_file)
+        t_bulk = timer.perf_counter() - start
+
+        if n_points <= args.loop_max:
+            start = timer.perf_counter()
+            write_comparison_csv_loop(result, loop_file)
+            t_loop = timer.perf_counter() - start
+            loop_label = f'{t_loop:.3f}'
+            identical = 'yes' if data_bytes(bulk_file) == data_bytes(loop_file) else 'NO'
+        else:
+            small = min(n_points, 100000)
+            small_result = replace(base, vfd=resample(base.vfd, small),
+                                   soft_starter=resample(base.soft_starter, small))
+            start = timer.perf_counter()
+            write_comparison_csv_loop(small_result, loop_file)
+            t_loop = (timer.perf_counter() - start) * n_points / small
+            loop_label = f'~{t_loop:.2f}'
+            identical = '-'
+
+        size_mb = bulk_file.stat().st_size / 1e6
+        print(f"{n_points:>12,}{loop_label:>12}{t_bulk:>12.3f}{t_loop / t_bulk:>9.1f}x"
+              f"{size_mb:>12.1f}{identical:>11}")
+
+if __name__ == '__main__':
+    main()
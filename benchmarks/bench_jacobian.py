@@ -0,0 +1,73 @@
+# =============================================================================
+# Benchmark: analytic vs finite-difference Jacobian in odeint
+# =============================================================================
+# Purpose: Integrates each start with odeint twice, once with the analytic
+#          Jacobians from vfd_simulation/models.py passed as Dfun and once
+#          letting LSODA estimate them by finite differences, and reports
+#          RHS and Jacobian evaluations, steps, wall time and the largest
+#          speed difference between the two runs.
+#
+# Usage:
+#   python benchmarks/bench_jacobian.py
+#   python benchmarks/bench_jacobian.py --repeats 20 --load-types fan_pump
+# =============================================================================
+
+import argparse
+import sys
+import time as timer
+import warnings
+from pathlib import Path
+
+import numpy as np
+from scipy.integrate import odeint
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from vfd_simulation import DEFAULT_CONFIG, LOAD_TYPES
+from vfd_simulation.solvers import start_dynamics, start_jacobian, start_ramp_time
+
+def run_odeint(method, config, jacobian):
+    ramp_time = start_ramp_time(method, config)
+    time = np.linspace(0, ramp_time, config.time_points)
+    solution, info = odeint(start_dynamics(method), [0], time,
+                            args=(config.load_torque, config.load_type, ramp_time, config),
+                            Dfun=start_jacobian(method) if jacobian else None,
+                            full_output=True)
+    return solution[:, 0], info
+
+def best_of(func, repeats):
+    best = float('inf')
+    for _ in range(repeats):
+        start = timer.perf_counter()
+        result = func()
+        best = min(best, timer.perf_counter() - start)
+    return best, result
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the analytic Jacobians')
+    parser.add_argument('--repeats', type=int, default=10)
+    parser.add_argument('--load-types', nargs='+', default=list(LOAD_TYPES))
+    args = parser.parse_args()
+    warnings.simplefilter('ignore')
+
+    print(f"{'Start':<32}{'Jacobian':<10}{'RHS calls':>10}{'Jac calls':>10}{'Steps':>8}"
+          f"{'Time (ms)':>11}{'Speedup':>9}{'Max diff (rad/s)':>18}")
+    print("-" * 108)
+    for load_type in args.load_types:
+        config = DEFAULT_CONFIG.replace(load_type=load_type)
+        for method in ('vfd', 'soft_starter'):
+            t_fd, (omega_fd, info_fd) = best_of(lambda: run_odeint(method, config, False), args.repeats)
+            t_an, (omega_an, info_an) = best_of(lambda: run_odeint(method, config, True), args.repeats)
+            label = f'{method} / {load_type}'
+            for name, seconds, info in (('finite', t_fd, info_fd), ('analytic', t_an, info_an)):
+                if info['message'] != 'Integration successful.':
+                    # The counters are not filled in when LSODA gives up
+                    print(f"{label:<32}{name:<10}{'failed: ' + info['message']}")
+                    continue
+                speedup = f'{t_fd / seconds:>8.2f}x' if name == 'analytic' else f"{'':>9}"
+                diff = f'{np.max(np.abs(omega_an - omega_fd)):>18.2e}' if name == 'analytic' else ''
+                print(f"{label:<32}{name:<10}{info['nfe'][-1]:>10}{info['nje'][-1]:>10}"
+                      f"{info['nst'][-1]:>8}{seconds * 1000:>11.1f}{speedup}{diff}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+# =============================================================================
+# Benchmark: exact vs tabulated torque-slip and load curves
+# =============================================================================
+# Purpose: For each lookup tolerance, reports the table sizes, RHS
+#          evaluations per second and calculate_metrics time against exact
+#          evaluation, and the largest deviation of the RHS (over random
+#          speed/time points), speed and current (over a whole odeint
+#          start) from the exact model.
+#
+# Usage:
+#   python benchmarks/bench_lookup.py
+#   python benchmarks/bench_lookup.py --tolerances 1e-3 1e-6 --load-types fan_pump
+# =============================================================================
+
+import argparse
+import sys
+import time as timer
+import warnings
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from vfd_simulation import DEFAULT_CONFIG
+from vfd_simulation.metrics import calculate_metrics
+from vfd_simulation.models import load_factor_table, torque_ratio_table
+from vfd_simulation.simulation import simulate_start
+from vfd_simulation.solvers import start_ramp_time, start_rhs
+
+def best_of(func, repeats):
+    best = float('inf')
+    for _ in range(repeats):
+        start = timer.perf_counter()
+        result = func()
+        best = min(best, timer.perf_counter() - start)
+    return best, result
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the torque/load lookup tables')
+    parser.add_argument('--tolerances', nargs='+', type=float, default=[1e-2, 1e-4, 1e-6])
+    parser.add_argument('--points', type=int, default=20000,
+                        help='RHS evaluations per timing')
+    parser.add_argument('--repeats', type=int, default=5)
+    # Constant-power odeint starts fail on the 10% load step, so their
+    # speed and current are not comparable
+    parser.add_argument('--load-types', nargs='+', default=['constant_torque', 'fan_pump'])
+    args = parser.parse_args()
+    warnings.simplefilter('ignore')
+    rng = np.random.default_rng(0)
+
+    print(f"{'Start':<30}{'Tolerance':>10}{'Table pts':>11}{'RHS speedup':>13}{'Metrics speedup':>17}"
+          f"{'RHS err (rad/s2)':>18}{'Speed err (rad/s)':>19}{'Current err (A)':>17}")
+    print("-" * 135)
+    for load_type in args.load_types:
+        exact = DEFAULT_CONFIG.replace(load_type=load_type)
+        for method in ('vfd', 'soft_starter'):
+            ramp_time = start_ramp_time(method, exact)
+            exact_rhs = start_rhs(method, exact)
+            reference = simulate_start(method, exact)
+            states = [[omega] for omega in rng.uniform(-0.1, 1.1, args.points) * exact.sync_speed_rad]
+            points = list(zip(states, rng.uniform(0, 1.5 * ramp_time, args.points).tolist()))
+            t_rhs, exact_values = best_of(lambda: [exact_rhs(y, t) for y, t in points], args.repeats)
+            t_metrics, _ = best_of(lambda: calculate_metrics(reference.time, reference.omega_rad, method,
+                                                             ramp_time, config=exact), args.repeats)
+
+            for tolerance in args.tolerances:
+                config = exact.replace(lookup_tolerance=tolerance)
+                table_points = (torque_ratio_table(tolerance).intervals
+                                + load_factor_table(load_type, tolerance).intervals + 2)
+                rhs = start_rhs(method, config)
+                t_table, values = best_of(lambda: [rhs(y, t) for y, t in points], args.repeats)
+                t_table_metrics, _ = best_of(lambda: calculate_metrics(
+                    reference.time, reference.omega_rad, method, ramp_time, config=config), args.repeats)
+                rhs_error = np.max(np.abs(np.subtract(values, exact_values)))
+                tabulated = simulate_start(method, config)
+                speed_error = np.max(np.abs(tabulated.omega_rad - reference.omega_rad))
+                current_error = np.max(np.abs(tabulated.current - reference.current))
+
+                print(f"{method + ' / ' + load_type:<30}{tolerance:>10.0e}{table_points:>11,}"
+                      f"{t_rhs / t_table:>12.2f}x{t_metrics / t_table_metrics:>16.2f}x"
+                      f"{rhs_error:>18.2e}{speed_error:>19.2e}{current_error:>17.2e}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+# =============================================================================
+# Benchmark: per-step latency of the fixed-step real-time motor model
+# =============================================================================
+# Purpose: Times every single step of a VFD start (p50/p99/max per step) for
+#          RealtimeMotor's RK4 and exponential kernels, against one RK4 step
+#          built from vfd_motor_dynamics in Python and against one odeint
+#          call per step over [t, t + dt] (the adaptive solver driven step
+#          by step). Also reports the Python heap growth over the timed run
+#          (tracemalloc peak) and the largest speed difference from a
+#          reference odeint start.
+#
+# Usage:
+#   python benchmarks/bench_realtime.py
+#   python benchmarks/bench_realtime.py --rate 10000 --steps 50000
+# =============================================================================
+
+import argparse
+import sys
+import time as timer
+import tracemalloc
+import warnings
+from pathlib import Path
+
+import numpy as np
+from scipy.integrate import odeint
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from vfd_simulation import DEFAULT_CONFIG, simulate_start
+from vfd_simulation.models import vfd_freq_func, vfd_motor_dynamics
+from vfd_simulation.realtime import HAVE_NUMBA, I_FREQ, S_OMEGA, RealtimeMotor
+
+def realtime_stepper(integrator, config, dt):
+    motor = RealtimeMotor('vfd', config, integrator)
+    motor.warm_up()
+    inputs, state = motor.inputs, motor.state
+
+    def step(k):
+        inputs[I_FREQ] = vfd_freq_func((k + 0.5) * dt, config.vfd_ramp_time, config)
+        motor.step(dt)
+        return state[S_OMEGA]
+    return step
+
+def python_rk4_stepper(config, dt):
+    state = [0.0]
+    args = (config.load_torque, config.load_type, config.vfd_ramp_time, config)
+
+    def step(k):
+        t = k * dt
+        omega_rad = state[0]
+        k1 = vfd_motor_dynamics([omega_rad], t, *args)[0]
+        k2 = vfd_motor_dynamics([omega_rad + 0.5 * dt * k1], t + 0.5 * dt, *args)[0]
+        k3 = vfd_motor_dynamics([omega_rad + 0.5 * dt * k2], t + 0.5 * dt, *args)[0]
+        k4 = vfd_motor_dynamics([omega_rad + dt * k3], t + dt, *args)[0]
+        state[0] = omega_rad + dt / 6 * (k1 + 2 * k2 + 2 * k3 + k4)
+        return state[0]
+    return step
+
+def odeint_stepper(config, dt):
+    state = np.zeros(1)
+    args = (config.load_torque, config.load_type, config.vfd_ramp_time, config)
+
+    def step(k):
+        state[:] = odeint(vfd_motor_dynamics, state, [k * dt, (k + 1) * dt], args=args)[-1]
+        return state[0]
+    return step
+
+def measure(step, steps, dt):
+    # Per-step latency (ns) and speed trajectory; then the heap peak over a
+    # second, untimed run of the same steps
+    latency = np.empty(steps, dtype=np.int64)
+    omega = np.empty(steps + 1)
+    omega[0] = 0.0
+    clock = timer.perf_counter_ns
+    for k in range(steps):
+        start = clock()
+        omega[k + 1] = step(k)
+        latency[k] = clock() - start
+
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline = tracemalloc.get_traced_memory()[0]
+    for k in range(steps):
+        step(k)
+    peak = tracemalloc.get_traced_memory()[1] - baseline
+    tracemalloc.stop()
+    return latency / 1000, omega, peak
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark real-time step latency')
+    parser.add_argument('--rate', type=float, default=1000, help='step rate, Hz')
+    parser.add_argument('--steps', type=int, default=None,
+                        help='steps per run (default: one VFD ramp)')
+    parser.add_argument('--odeint-steps', type=int, default=5000,
+                        help='steps for the (slow) per-step odeint run')
+    args = parser.parse_args()
+    warnings.simplefilter('ignore')
+    config = DEFAULT_CONFIG
+    dt = 1 / args.rate
+    steps = args.steps or int(round(config.vfd_ramp_time / dt))
+    reference = simulate_start('vfd', config)
+
+    print(f"VFD start, dt = {dt * 1e6:.0f} us ({args.rate:,.0f} Hz), "
+          f"Numba: {'yes' if HAVE_NUMBA else 'no (kernels run as Python)'}")
+    print(f"{'Stepper':<34}{'Steps':>8}{'p50 (us)':>10}{'p99 (us)':>10}{'max (us)':>10}"
+          f"{'Heap peak (B)':>15}{'Speed err (rad/s)':>19}")
+    print("-" * 106)
+    runs = (
+        ('RealtimeMotor rk4', realtime_stepper('rk4', config, dt), steps),
+        ('RealtimeMotor exponential', realtime_stepper('exponential', config, dt), steps),
+        ('vfd_motor_dynamics RK4 (Python)', python_rk4_stepper(config, dt), steps),
+        ('vfd_motor_dynamics odeint/step', odeint_stepper(config, dt), min(steps, args.odeint_steps)),
+    )
+    for name, step, count in runs:
+        latency, omega, peak = measure(step, count, dt)
+        time = np.arange(count + 1) * dt
+        covered = reference.time <= time[-1]
+        error = np.max(np.abs(np.interp(reference.time[covered], time, omega)
+                              - reference.omega_rad[covered]))
+        p50, p99 = np.percentile(latency, [50, 99])
+        print(f"{name:<34}{count:>8,}{p50:>10.2f}{p99:>10.2f}{latency.max():>10.1f}"
+              f"{peak:>15,}{error:>19.2e}")
+
+if __name__ == '__main__':
+    main()
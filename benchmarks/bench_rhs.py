@@ -0,0 +1,84 @@
+# =============================================================================
+# Benchmark: reference vs compiled ODE right-hand sides
+# =============================================================================
+# Purpose: Measures RHS evaluations per second of the reference dynamics
+#          (vfd_motor_dynamics / soft_start_motor_dynamics, which re-resolve
+#          the load type and call np.clip on every evaluation) against the
+#          compiled closures from make_vfd_dynamics / make_soft_start_dynamics,
+#          on the (speed, time) points of a real start. Also times a whole
+#          odeint start with each and checks the results are identical.
+#          Constant-power starts fail on the 10% load step, so their odeint
+#          output is not reproducible and is reported as failed.
+#
+# Usage:
+#   python benchmarks/bench_rhs.py
+#   python benchmarks/bench_rhs.py --points 5000 --load-types fan_pump
+# =============================================================================
+
+import argparse
+import sys
+import time as timer
+import warnings
+from pathlib import Path
+
+import numpy as np
+from scipy.integrate import odeint
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from vfd_simulation import DEFAULT_CONFIG, LOAD_TYPES
+from vfd_simulation.solvers import solve_odeint, start_dynamics, start_ramp_time, start_rhs
+
+def best_of(func, repeats):
+    best = float('inf')
+    for _ in range(repeats):
+        start = timer.perf_counter()
+        result = func()
+        best = min(best, timer.perf_counter() - start)
+    return best, result
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the ODE right-hand sides')
+    parser.add_argument('--points', type=int, default=20000,
+                        help='RHS evaluations per timing')
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--load-types', nargs='+', default=list(LOAD_TYPES))
+    args = parser.parse_args()
+    warnings.simplefilter('ignore')
+
+    print(f"{'Start':<32}{'Reference (calls/s)':>21}{'Compiled (calls/s)':>20}{'Speedup':>9}"
+          f"{'odeint ref (ms)':>17}{'odeint compiled (ms)':>22}{'Identical':>11}")
+    print("-" * 132)
+    for load_type in args.load_types:
+        config = DEFAULT_CONFIG.replace(load_type=load_type)
+        for method in ('vfd', 'soft_starter'):
+            ramp_time = start_ramp_time(method, config)
+            rhs_args = (config.load_torque, config.load_type, ramp_time, config)
+            dynamics, rhs = start_dynamics(method), start_rhs(method, config)
+
+            # Evaluate both on the points of an actual start
+            time, omega_rad = solve_odeint(method, config.replace(time_points=args.points))
+            states = [[omega] for omega in omega_rad.tolist()]
+            points = list(zip(states, time.tolist()))
+
+            t_ref, ref = best_of(lambda: [dynamics(y, t, *rhs_args)[0] for y, t in points], args.repeats)
+            t_new, new = best_of(lambda: [rhs(y, t) for y, t in points], args.repeats)
+            grid = np.linspace(0, ramp_time, config.time_points)
+            t_ode_ref, (omega_ref, info) = best_of(
+                lambda: odeint(dynamics, [0], grid, args=rhs_args, full_output=True), args.repeats)
+            t_ode_new, (omega_new, _) = best_of(
+                lambda: odeint(rhs, [0], grid, full_output=True), args.repeats)
+
+            if ref != new:
+                identical = 'NO'
+            elif info['message'] != 'Integration successful.':
+                identical = 'RHS only'  # odeint failed
+            else:
+                identical = 'yes' if np.array_equal(omega_ref, omega_new) else 'NO'
+
+            print(f"{method + ' / ' + load_type:<32}{len(points) / t_ref:>21,.0f}{len(points) / t_new:>20,.0f}"
+                  f"{t_ref / t_new:>8.1f}x{t_ode_ref * 1000:>17.1f}{t_ode_new * 1000:>22.1f}"
+                  f"{identical:>11}")
+
+if __name__ == '__main__':
+    main()
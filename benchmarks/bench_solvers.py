@@ -0,0 +1,77 @@
+# =============================================================================
+# Benchmark: odeint vs solve_ivp backends
+# =============================================================================
+# Purpose: Times one start with each backend and measures its speed error
+#          against a tight-tolerance odeint reference, for the VFD and soft
+#          starter on each load type. solve_ivp runs twice: over the full
+#          ramp like odeint, and with terminal events so the start ends as
+#          soon as it completes (or stalls).
+#
+# Usage:
+#   python benchmarks/bench_solvers.py
+#   python benchmarks/bench_solvers.py --repeats 10 --load-types fan_pump
+# =============================================================================
+
+import argparse
+import sys
+import time as timer
+import warnings
+from pathlib import Path
+
+import numpy as np
+from scipy.integrate import odeint
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from vfd_simulation import DEFAULT_CONFIG
+from vfd_simulation.solvers import (
+    solve_ivp_events, solve_odeint, start_dynamics, start_ramp_time,
+)
+
+def reference_speed(method, config, time):
+    ramp_time = start_ramp_time(method, config)
+    args = (config.load_torque, config.load_type, ramp_time, config)
+    return odeint(start_dynamics(method), [0], time, args=args,
+                  rtol=1e-12, atol=1e-12, mxstep=100000)[:, 0]
+
+def best_of(func, repeats):
+    best = float('inf')
+    for _ in range(repeats):
+        start = timer.perf_counter()
+        result = func()
+        best = min(best, timer.perf_counter() - start)
+    return best, result
+
+BACKENDS = ('odeint', 'solve_ivp', 'solve_ivp + events')
+
+def run_backend(backend, method, config):
+    # Returns (time, omega_rad, end_reason)
+    if backend == 'odeint':
+        return solve_odeint(method, config) + ('completed',)
+    time, omega_rad, _, _, end_reason = solve_ivp_events(
+        method, config, use_events=(backend == 'solve_ivp + events'))
+    return time, omega_rad, end_reason
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare the ODE solver backends')
+    parser.add_argument('--repeats', type=int, default=5)
+    # Constant-power loads are left out by default: their load step at 10%
+    # speed makes every backend chatter, which dominates the timing
+    parser.add_argument('--load-types', nargs='+', default=['constant_torque', 'fan_pump'])
+    args = parser.parse_args()
+    warnings.simplefilter('ignore')
+
+    print(f"{'Start':<32}{'Backend':<20}{'Time (ms)':>10}{'End (s)':>9}{'Ended by':>15}{'Max err (rad/s)':>17}")
+    print("-" * 103)
+    for load_type in args.load_types:
+        config = DEFAULT_CONFIG.replace(load_type=load_type)
+        for method in ('vfd', 'soft_starter'):
+            for backend in BACKENDS:
+                seconds, (time, omega_rad, end_reason) = \
+                    best_of(lambda: run_backend(backend, method, config), args.repeats)
+                error = np.max(np.abs(omega_rad - reference_speed(method, config, time)))
+                print(f"{method + ' / ' + load_type:<32}{backend:<20}{seconds * 1000:>10.1f}"
+                      f"{time[-1]:>9.2f}{end_reason:>15}{error:>17.2e}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+# =============================================================================
+# Benchmark: headless vs plotting start-up time
+# =============================================================================
+# Purpose: Runs the CLI end to end in a fresh interpreter with and without
+#          --headless, so the matplotlib import and dashboard construction
+#          are included in the timing, and breaks the plotting run down into
+#          its phases in-process.
+#
+# Usage:
+#   python benchmarks/bench_startup.py
+#   python benchmarks/bench_startup.py --model v3 --repeats 10
+# =============================================================================
+
+import argparse
+import os
+import subprocess
+import sys
+import time as timer
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+def run_cli(model, headless, repeats):
+    # Best-of wall time for `python -m vfd_simulation` in a new process. The
+    # Agg backend makes plt.show() a no-op so the run ends after the figure
+    # has been built.
+    cmd = [sys.executable, '-W', 'ignore', '-m', 'vfd_simulation', '--model', model, '--no-csv']
+    if headless:
+        cmd.append('--headless')
+    env = dict(os.environ, MPLBACKEND='Agg')
+    best = float('inf')
+    for _ in range(repeats):
+        start = timer.perf_counter()
+        subprocess.run(cmd, cwd=ROOT, env=env, check=True, stdout=subprocess.DEVNULL)
+        best = min(best, timer.perf_counter() - start)
+    return best
+
+def phase_times(model):
+    # Time each phase once, in the order the CLI runs them
+    sys.path.insert(0, str(ROOT))
+    phases = []
+
+    start = timer.perf_counter()
+    from vfd_simulation import DEFAULT_CONFIG, simulate
+    from vfd_simulation.legacy import simulate_v2, simulate_v3
+    phases.append(('import vfd_simulation', timer.perf_counter() - start))
+
+    start = timer.perf_counter()
+    result = {'v2': simulate_v2, 'v3': simulate_v3, 'v4': simulate}[model]()
+    phases.append(('simulate', timer.perf_counter() - start))
+
+    start = timer.perf_counter()
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    from vfd_simulation import plotting
+    phases.append(('import matplotlib.pyplot', timer.perf_counter() - start))
+
+    start = timer.perf_counter()
+    if model == 'v4':
+        fig = plotting.plot_comparison(result)
+    elif model == 'v3':
+        fig = plotting.plot_vfd_dol(result)
+    else:
+        fig = plotting.plot_vfd_start(DEFAULT_CONFIG, result)
+    fig.canvas.draw()
+    plt.close(fig)
+    phases.append(('build + draw figure', timer.perf_counter() - start))
+    return phases
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark headless start-up time')
+    parser.add_argument('--model', choices=('v2', 'v3', 'v4'), default='v4')
+    parser.add_argument('--repeats', type=int, default=5)
+    args = parser.parse_args()
+
+    with_plots = run_cli(args.model, False, args.repeats)
+    headless = run_cli(args.model, True, args.repeats)
+
+    print(f"{'Run':<28}{'Wall time (s)':>14}")
+    print("-" * 42)
+    print(f"{'CLI with dashboard':<28}{with_plots:>14.3f}")
+    print(f"{'CLI --headless':<28}{headless:>14.3f}")
+    print(f"{'Saving':<28}{with_plots - headless:>14.3f}  ({(1 - headless / with_plots) * 100:.0f}%)")
+    print()
+    print(f"{'Phase (dashboard run)':<28}{'Wall time (s)':>14}")
+    print("-" * 42)
+    for name, seconds in phase_times(args.model):
+        print(f"{name:<28}{seconds:>14.3f}")
+
+if __name__ == '__main__':
+    main()
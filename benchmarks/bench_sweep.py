@@ -0,0 +1,53 @@
+# =============================================================================
+# Benchmark: parameter sweep scaling with worker count
+# =============================================================================
+# Purpose: Times the same sweep grid with 1, 2, 4, ... worker processes up to
+#          the core count and reports speedup and parallel efficiency.
+#
+# Usage:
+#   python benchmarks/bench_sweep.py
+#   python benchmarks/bench_sweep.py --scenarios 512 --workers 1 2 4 8 16
+# =============================================================================
+
+import argparse
+import os
+import sys
+import time as timer
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from vfd_simulation.sweep import expand_grid, run_sweep
+
+def main():
+    cores = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description='Benchmark sweep scaling')
+    parser.add_argument('--scenarios', type=int, default=256)
+    parser.add_argument('--workers', type=int, nargs='+',
+                        default=[2**i for i in range(cores.bit_length()) if 2**i <= cores])
+    args = parser.parse_args()
+
+    # Square-ish grid over inertia and VFD ramp time
+    side = int(np.ceil(np.sqrt(args.scenarios)))
+    configs = expand_grid({
+        'inertia': list(np.linspace(80, 250, side)),
+        'vfd_ramp_time': list(np.linspace(10, 40, side)),
+    })[:args.scenarios]
+
+    print(f"{len(configs)} scenarios, {cores} cores")
+    print(f"{'Workers':>8}{'Time (s)':>12}{'Scenarios/s':>14}{'Speedup':>10}{'Efficiency':>12}")
+    print("-" * 56)
+    baseline = None
+    for workers in sorted(set(args.workers) | {1}):
+        start = timer.perf_counter()
+        run_sweep(configs, workers)
+        elapsed = timer.perf_counter() - start
+        baseline = baseline or elapsed  # workers=1 runs first
+        speedup = baseline / elapsed
+        print(f"{workers:>8}{elapsed:>12.2f}{len(configs) / elapsed:>14.1f}"
+              f"{speedup:>9.1f}x{speedup / workers * 100:>11.0f}%")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+# =============================================================================
+# Benchmark: tariff engine on a year of 15-minute intervals
+# =============================================================================
+# Purpose: Times billing a year of 15-minute interval energy for a fleet of
+#          motors under the example time-of-use tariff (calendar binning,
+#          energy charges, monthly and on-peak demand charges), against a
+#          per-motor Python loop over the same intervals as a reference,
+#          and checks that both agree.
+#
+# Usage:
+#   python benchmarks/bench_tariff.py
+#   python benchmarks/bench_tariff.py --motors 100 500 1000
+# =============================================================================
+
+import argparse
+import sys
+import time as timer
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from vfd_simulation.tariff import EXAMPLE_TOU_TARIFF, apply_tariff, tariff_calendar
+
+INTERVALS = 365 * 96
+
+def reference_bill(tariff, interval_kwh):
+    # Interval by interval, one motor at a time
+    calendar = tariff_calendar(tariff, interval_kwh.shape[1])
+    month_ends = list(calendar.month_starts[1:]) + [interval_kwh.shape[1]]
+    totals = []
+    for row in interval_kwh:
+        total = 0.0
+        for start, end in zip(calendar.month_starts, month_ends):
+            peak = 0.0
+            period_peaks = {}
+            for k in range(start, end):
+                period = tariff.periods[calendar.period[k]]
+                demand = row[k] / tariff.interval_hours
+                total += row[k] * period.energy_rate
+                peak = max(peak, demand)
+                period_peaks[period] = max(period_peaks.get(period, 0.0), demand)
+            total += tariff.demand_rate * peak
+            total += sum(period.demand_rate * value for period, value in period_peaks.items())
+        totals.append(total)
+    return np.array(totals)
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the tariff engine')
+    parser.add_argument('--motors', nargs='+', type=int, default=[10, 100, 500])
+    parser.add_argument('--reference-motors', type=int, default=2,
+                        help='motors billed by the Python reference loop')
+    args = parser.parse_args()
+    rng = np.random.default_rng(0)
+    tariff = EXAMPLE_TOU_TARIFF
+
+    start = timer.perf_counter()
+    tariff_calendar.cache_clear()
+    tariff_calendar(tariff, INTERVALS)
+    print(f"Calendar ({INTERVALS:,} intervals): {(timer.perf_counter() - start) * 1e3:.1f} ms")
+
+    sample = rng.uniform(0, 150, (args.reference_motors, INTERVALS))
+    start = timer.perf_counter()
+    reference = reference_bill(tariff, sample)
+    t_reference = (timer.perf_counter() - start) / args.reference_motors
+    error = np.max(np.abs(apply_tariff(tariff, sample).total_cost - reference))
+    print(f"Python reference: {t_reference:.2f} s per motor (max difference ${error:.2e})\n")
+
+    print(f"{'Motors':>8}{'Time (s)':>11}{'Per motor (ms)':>16}{'Speedup':>10}")
+    print("-" * 45)
+    for motors in args.motors:
+        interval_kwh = rng.uniform(0, 150, (motors, INTERVALS))
+        start = timer.perf_counter()
+        apply_tariff(tariff, interval_kwh)
+        elapsed = timer.perf_counter() - start
+        print(f"{motors:>8,}{elapsed:>11.3f}{elapsed / motors * 1e3:>16.3f}"
+              f"{t_reference * motors / elapsed:>9.0f}x")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,304 @@
+# =============================================================================
+# Benchmark suite: per-phase timings of the v2/v3/v4 pipelines
+# =============================================================================
+# Purpose: Runs each model's pipeline phase by phase and times every phase
+#          separately, at several TIME_POINTS sizes and scenario counts:
+#            solve    odeint integration of the start(s)
+#            metrics  calculate_metrics (v4) / calculate_vfd_metrics and the
+#                     DOL start (v2/v3 post-processing)
+#            energy   trapezoidal start energy
+#            csv      write_comparison_csv / write_vfd_dol_csv (v2 has none)
+#            figure   dashboard construction and one Agg draw
+#          A scenario count of N runs the pipeline for N starts with inertia
+#          spread over +-25% of the configured value. Each phase reports the
+#          best total over --repeats runs.
+#
+#          Results are written as JSON together with the git commit, library
+#          versions and platform, so runs from different commits can be
+#          compared: --compare flags every phase that got slower than
+#          --threshold times the baseline and exits with status 1.
+#
+# Usage:
+#   python benchmarks/run_benchmarks.py
+#   python benchmarks/run_benchmarks.py --output bench.json
+#   python benchmarks/run_benchmarks.py --quick --compare baseline.json
+#   python benchmarks/run_benchmarks.py --models v4 --time-points 1000 10000 --scenarios 1 20
+# =============================================================================
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time as timer
+import warnings
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import scipy
+from scipy.integrate import odeint
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+
+from vfd_simulation import DEFAULT_CONFIG, SimulationResult, StartTrajectory, calculate_costs
+from vfd_simulation import plotting, report
+from vfd_simulation.legacy import (
+    VfdDolResult, calculate_vfd_metrics, simulate_dol_start, v2_motor_dynamics,
+)
+from vfd_simulation.metrics import calculate_metrics, trapezoid
+from vfd_simulation.models import make_vfd_dynamics, vfd_motor_jacobian
+from vfd_simulation.solvers import solve_odeint, start_ramp_time
+
+MODELS = ('v2', 'v3', 'v4')
+PHASES = ('solve', 'metrics', 'energy', 'csv', 'figure')
+INERTIA_SPREAD = 0.25
+
+# =============================================================================
+# PIPELINES
+# =============================================================================
+# Each pipeline runs one scenario and adds the time of each phase to `times`
+
+class PhaseTimer:
+    def __init__(self, times):
+        self.times = times
+
+    def __call__(self, phase):
+        self.phase = phase
+        return self
+
+    def __enter__(self):
+        self.start = timer.perf_counter()
+
+    def __exit__(self, *exc):
+        self.times[self.phase] = self.times.get(self.phase, 0.0) + timer.perf_counter() - self.start
+
+
+def _vfd_trajectory(time, omega_rad, config):
+    freq, slip, torque, load, current, power_out, power_in, efficiency = \
+        calculate_vfd_metrics(time, omega_rad, config.vfd_ramp_time, config)
+    return StartTrajectory(time, omega_rad, current, torque, slip, load_torque=load,
+                           power_in=power_in, power_out=power_out,
+                           efficiency=efficiency, frequency=freq)
+
+
+def _draw(fig):
+    fig.canvas.draw()
+    plt.close(fig)
+
+
+def run_v4(config, phase, csv_filename, figure):
+    with phase('solve'):
+        solutions = {method: solve_odeint(method, config) for method in ('vfd', 'soft_starter')}
+    with phase('metrics'):
+        starts = {}
+        for method, (time, omega_rad) in solutions.items():
+            metrics = calculate_metrics(time, omega_rad, method, start_ramp_time(method, config),
+                                        config=config)
+            starts[method] = StartTrajectory(time, omega_rad, *metrics)
+    with phase('energy'):
+        for start in starts.values():
+            start.energy_kj
+    result = SimulationResult(config, starts['vfd'], starts['soft_starter'],
+                              calculate_costs(config, starts['vfd'], starts['soft_starter']))
+    with phase('csv'):
+        report.write_comparison_csv(result, csv_filename)
+    if figure:
+        with phase('figure'):
+            _draw(plotting.plot_comparison(result))
+
+
+def run_v3(config, phase, csv_filename, figure):
+    with phase('solve'):
+        time = np.linspace(0, config.vfd_ramp_time, config.time_points)
+        args = (config.load_torque, config.load_type, config.vfd_ramp_time, config)
+        solution = odeint(make_vfd_dynamics(*args), [0], time,
+                          Dfun=lambda y, t: vfd_motor_jacobian(y, t, *args))
+    with phase('metrics'):
+        result = VfdDolResult(config, _vfd_trajectory(time, solution[:, 0], config),
+                              *simulate_dol_start(config))
+    with phase('energy'):
+        result.vfd.energy_kj
+        result.dol_energy_kj
+    with phase('csv'):
+        report.write_vfd_dol_csv(result, csv_filename)
+    if figure:
+        with phase('figure'):
+            _draw(plotting.plot_vfd_dol(result))
+
+
+def run_v2(config, phase, csv_filename, figure):
+    with phase('solve'):
+        time = np.linspace(0, config.vfd_ramp_time, config.time_points)
+        solution = odeint(v2_motor_dynamics, [0], time,
+                          args=(config.load_torque, config.vfd_ramp_time, config))
+    with phase('metrics'):
+        vfd = _vfd_trajectory(time, solution[:, 0], config)
+        vfd.power_out = (vfd.torque * vfd.omega_rad) / 1000
+    with phase('energy'):
+        trapezoid(vfd.power_out, vfd.time)
+    if figure:
+        with phase('figure'):
+            _draw(plotting.plot_vfd_start(config, vfd))
+
+
+PIPELINES = {'v2': run_v2, 'v3': run_v3, 'v4': run_v4}
+
+# =============================================================================
+# SUITE
+# =============================================================================
+
+def scenario_configs(time_points, scenarios, config=DEFAULT_CONFIG):
+    scales = np.linspace(1 - INERTIA_SPREAD, 1 + INERTIA_SPREAD, scenarios) if scenarios > 1 else [1.0]
+    return [config.replace(time_points=time_points, inertia=config.inertia * scale)
+            for scale in scales]
+
+
+def time_pipeline(model, configs, repeats, figure, workdir):
+    # Best-of-repeats total per phase over all scenarios
+    best = {}
+    csv_filename = str(Path(workdir) / f'{model}.csv')
+    for _ in range(repeats):
+        times = {}
+        phase = PhaseTimer(times)
+        for config in configs:
+            PIPELINES[model](config, phase, csv_filename, figure)
+        for name, seconds in times.items():
+            best[name] = min(best.get(name, float('inf')), seconds)
+    return best
+
+
+def run_suite(models, time_points, scenarios, repeats, figure=True):
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for model in models:
+            # Untimed warm-up: imports, first-call caches, font loading
+            time_pipeline(model, scenario_configs(min(time_points), 1), 1, figure, workdir)
+            for points in time_points:
+                for count in scenarios:
+                    best = time_pipeline(model, scenario_configs(points, count), repeats,
+                                         figure, workdir)
+                    for name in PHASES:
+                        if name in best:
+                            results.append({'model': model, 'time_points': points,
+                                            'scenarios': count, 'phase': name,
+                                            'seconds': best[name]})
+                    total = sum(best.values())
+                    print(f"{model:<6}{points:>8,}{count:>10,}"
+                          + ''.join(f"{best[name] * 1e3:>10.1f}" if name in best else f"{'-':>10}"
+                                    for name in PHASES)
+                          + f"{total * 1e3:>11.1f}")
+    return results
+
+# =============================================================================
+# RESULTS
+# =============================================================================
+
+def git_commit():
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=ROOT, capture_output=True,
+                                text=True, check=True).stdout.strip()
+        dirty = bool(subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'],
+                                    cwd=ROOT, capture_output=True, text=True).stdout.strip())
+    except (OSError, subprocess.CalledProcessError):
+        return None, None
+    return commit, dirty
+
+
+def environment(args):
+    commit, dirty = git_commit()
+    return {
+        'commit': commit,
+        'dirty': dirty,
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'scipy': scipy.__version__,
+        'matplotlib': matplotlib.__version__,
+        'platform': platform.platform(),
+        'processor': platform.processor() or platform.machine(),
+        'repeats': args.repeats,
+    }
+
+
+def _key(row):
+    return row['model'], row['time_points'], row['scenarios'], row['phase']
+
+
+def compare(results, baseline, threshold, min_time):
+    # Phases slower than threshold x baseline; phases that take less than
+    # min_time in both runs are too short to time reliably and are skipped
+    previous = {_key(row): row['seconds'] for row in baseline['results']}
+    regressions = []
+    print(f"\nAgainst {baseline['environment'].get('commit') or 'baseline'} "
+          f"(threshold {threshold:.2f}x)")
+    print(f"{'Model':<6}{'Points':>8}{'Scenarios':>10}  {'Phase':<9}{'Before (ms)':>12}"
+          f"{'After (ms)':>12}{'Ratio':>8}")
+    print("-" * 67)
+    for row in results:
+        before = previous.get(_key(row))
+        if before is None:
+            continue
+        ratio = row['seconds'] / before if before > 0 else float('inf')
+        flag = ''
+        if ratio > threshold and max(before, row['seconds']) >= min_time:
+            regressions.append(row)
+            flag = '  REGRESSION'
+        print(f"{row['model']:<6}{row['time_points']:>8,}{row['scenarios']:>10,}  "
+              f"{row['phase']:<9}{before * 1e3:>12.1f}{row['seconds'] * 1e3:>12.1f}"
+              f"{ratio:>7.2f}x{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Time each phase of the v2/v3/v4 pipelines')
+    parser.add_argument('--models', nargs='+', choices=MODELS, default=list(MODELS))
+    parser.add_argument('--time-points', nargs='+', type=int, default=[500, 1000, 5000])
+    parser.add_argument('--scenarios', nargs='+', type=int, default=[1, 10])
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument('--no-figure', action='store_false', dest='figure',
+                        help='skip the figure phase')
+    parser.add_argument('--quick', action='store_true',
+                        help='1000 points, 1 scenario, 2 repeats')
+    parser.add_argument('--output', metavar='FILENAME',
+                        help='JSON results file (default: bench_<commit>.json)')
+    parser.add_argument('--compare', metavar='FILENAME',
+                        help='baseline JSON results to check for regressions')
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help='slowdown ratio reported as a regression')
+    parser.add_argument('--min-time', type=float, default=0.005,
+                        help='phases faster than this (s) are never flagged')
+    args = parser.parse_args()
+    if args.quick:
+        args.time_points, args.scenarios, args.repeats = [1000], [1], 2
+    warnings.simplefilter('ignore')
+
+    print("Best time per phase (ms), summed over scenarios")
+    print(f"{'Model':<6}{'Points':>8}{'Scenarios':>10}" + ''.join(f"{name:>10}" for name in PHASES)
+          + f"{'total':>11}")
+    print("-" * 85)
+    results = run_suite(args.models, args.time_points, args.scenarios, args.repeats, args.figure)
+
+    env = environment(args)
+    output = args.output or f"bench_{(env['commit'] or 'nogit')[:10]}.json"
+    with open(output, 'w') as f:
+        json.dump({'environment': env, 'results': results}, f, indent=2)
+    print(f"\nResults written to {output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold, args.min_time)
+        if regressions:
+            print(f"\n{len(regressions)} phase(s) slower than {args.threshold:.2f}x baseline")
+            sys.exit(1)
+        print("\nNo regressions")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,40 @@
+# =============================================================================
+# VFD-Motor-Simulation: Test Configuration
+# =============================================================================
+# Run from the repository root:
+#   python -m pytest -q
+# =============================================================================
+
+import sys
+import warnings
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from vfd_simulation import DEFAULT_CONFIG, simulate  # noqa: E402
+
+# Loads the equivalence tests run on; constant_power stalls (see README)
+LOADS = ('constant_torque', 'fan_pump')
+METHODS = ('vfd', 'soft_starter')
+
+
+def _simulate(config):
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        return simulate(config)
+
+
+@pytest.fixture(scope='session')
+def default_result():
+    # The v4 comparison with the default configuration, shared by all tests
+    return _simulate(DEFAULT_CONFIG)
+
+
+@pytest.fixture(scope='session', params=LOADS)
+def reference(request):
+    # (config, simulate(config)) with the default odeint solver, per load
+    config = DEFAULT_CONFIG.replace(load_type=request.param)
+    return config, _simulate(config)
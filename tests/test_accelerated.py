@@ -0,0 +1,75 @@
+# =============================================================================
+# Numba backend against the odeint path (accelerated.py)
+# =============================================================================
+
+import numpy as np
+import pytest
+
+from vfd_simulation import DEFAULT_CONFIG, simulate_start
+from vfd_simulation.accelerated import (
+    HAVE_NUMBA, METRICS, N_PARAMETERS, _metrics, _parameter_tuple, accelerated_batch,
+    accelerated_start, start_parameters,
+)
+from vfd_simulation.metrics import trapezoid
+
+from conftest import METHODS
+
+
+@pytest.mark.parametrize('method', METHODS)
+def test_start_matches_odeint(reference, method):
+    config, result = reference
+    expected = getattr(result, method)
+    time, omega_rad, metrics = accelerated_start(method, config)
+    np.testing.assert_array_equal(time, expected.time)
+    np.testing.assert_allclose(omega_rad, expected.omega_rad, rtol=0, atol=2e-4)
+    current, power_in = metrics[METRICS.index('current')], metrics[METRICS.index('power_in')]
+    np.testing.assert_allclose(current.max(), expected.peak_current, rtol=1e-5)
+    np.testing.assert_allclose(trapezoid(power_in, time), expected.energy_kj, rtol=1e-5)
+    np.testing.assert_allclose(metrics[METRICS.index('slip')][-1], expected.slip[-1], atol=1e-4)
+
+
+@pytest.mark.parametrize('method', METHODS)
+def test_metrics_kernel_matches_calculate_metrics(reference, method):
+    # Same speed in, same metrics out
+    config, result = reference
+    expected = getattr(result, method)
+    metrics = np.empty((len(METRICS), len(expected.time)))
+    _metrics(expected.time, expected.omega_rad, start_parameters(method, config), metrics)
+    for row, name in enumerate(METRICS):
+        np.testing.assert_allclose(metrics[row], getattr(expected, name), rtol=1e-12,
+                                   atol=1e-9, err_msg=name)
+
+
+def test_numba_solver_setting(reference):
+    config, _ = reference
+    trajectory = simulate_start('vfd', config.replace(solver='numba'))
+    _, omega_rad, _ = accelerated_start('vfd', config)
+    if HAVE_NUMBA:
+        np.testing.assert_array_equal(trajectory.omega_rad, omega_rad)
+    else:
+        np.testing.assert_allclose(trajectory.omega_rad, omega_rad, atol=2e-4)
+
+
+@pytest.mark.parametrize('method', METHODS)
+def test_batch_rows_match_single_starts(reference, method):
+    # An odd count covers both the paired starts and the last single one
+    config, _ = reference
+    configs = [config.replace(inertia=config.inertia * scale, load_torque_factor=factor)
+               for scale, factor in zip((1.0, 0.8, 1.3), (0.75, 0.5, 0.9))]
+    time, omega_rad, metrics = accelerated_batch(method, configs)
+    for row, scenario in enumerate(configs):
+        expected = accelerated_start(method, scenario)
+        np.testing.assert_array_equal(time[row], expected[0])
+        np.testing.assert_array_equal(omega_rad[row], expected[1])
+        np.testing.assert_array_equal(metrics[row], expected[2])
+
+
+def test_batch_needs_one_grid():
+    with pytest.raises(ValueError, match='time_points'):
+        accelerated_batch('vfd', [DEFAULT_CONFIG, DEFAULT_CONFIG.replace(time_points=500)])
+
+
+def test_parameter_tuple_covers_layout():
+    # The batch kernel's row -> tuple conversion must track N_PARAMETERS
+    row = np.arange(N_PARAMETERS, dtype=float)
+    assert _parameter_tuple(row) == tuple(row)
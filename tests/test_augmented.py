@@ -0,0 +1,59 @@
+# =============================================================================
+# Augmented-state totals against simulate (augmented.py)
+# =============================================================================
+
+import warnings
+
+import numpy as np
+import pytest
+
+from vfd_simulation import DEFAULT_CONFIG, simulate_start
+from vfd_simulation.augmented import start_totals
+from vfd_simulation.metrics import trapezoid
+
+from conftest import METHODS
+
+
+@pytest.fixture(scope='module', params=METHODS)
+def fine_start(request, reference):
+    # simulate_start on a grid fine enough for its trapezoid totals to be
+    # within ~1e-5 of the exact ones
+    config, _ = reference
+    config = config.replace(time_points=40_000)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        return request.param, config, simulate_start(request.param, config)
+
+
+def test_totals_match_trapezoid(fine_start):
+    method, config, trajectory = fine_start
+    totals = start_totals(method, config)
+    time = trajectory.time
+    mechanical_kw = trajectory.omega_rad * trajectory.load_torque / 1000
+    np.testing.assert_allclose(totals.duration, time[-1])
+    np.testing.assert_allclose(totals.final_omega_rad, trajectory.omega_rad[-1], atol=2e-5)
+    np.testing.assert_allclose(totals.energy_in_kj, trapezoid(trajectory.power_in, time),
+                               rtol=5e-5)
+    np.testing.assert_allclose(totals.i2t, trapezoid(trajectory.current**2, time), rtol=5e-5)
+    np.testing.assert_allclose(totals.mechanical_energy_kj, trapezoid(mechanical_kw, time),
+                               rtol=5e-5)
+    assert totals.loss_kj > 0
+
+
+@pytest.mark.parametrize('method', METHODS)
+def test_energy_states_trajectory(reference, method):
+    # The speed state is the ordinary start; the totals match start_totals
+    config, result = reference
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        trajectory = simulate_start(method, config.replace(energy_states=True))
+    expected = getattr(result, method)
+    np.testing.assert_allclose(trajectory.omega_rad, expected.omega_rad, rtol=0, atol=1e-4)
+    totals = start_totals(method, config)
+    np.testing.assert_allclose(trajectory.totals.energy_in_kj, totals.energy_in_kj, rtol=1e-5)
+    np.testing.assert_allclose(trajectory.energy_kj, totals.energy_in_kj, rtol=1e-5)
+
+
+def test_failed_segment_raises():
+    with pytest.raises(RuntimeError, match='odeint failed'):
+        start_totals('vfd', DEFAULT_CONFIG.replace(load_type='constant_power'))
@@ -0,0 +1,50 @@
+# =============================================================================
+# Batched solver against simulate (batch.py)
+# =============================================================================
+
+import numpy as np
+import pytest
+
+from vfd_simulation.batch import batch_metrics, scenario_codes, simulate_batch
+
+from conftest import METHODS
+
+OUTPUTS = ('current', 'torque', 'slip', 'load_torque', 'power_in', 'power_out',
+           'efficiency', 'voltage')
+
+
+def test_batch_matches_simulate(reference):
+    # Both methods in one call, at tolerances close to odeint's
+    config, result = reference
+    time, omega_rad = simulate_batch(method=list(METHODS), rtol=1e-8, atol=1e-8, config=config)
+    for row, method in enumerate(METHODS):
+        expected = getattr(result, method)
+        np.testing.assert_allclose(time[row], expected.time, rtol=1e-12)
+        np.testing.assert_allclose(omega_rad[row], expected.omega_rad, rtol=0, atol=5e-5)
+
+
+def test_scenarios_are_independent(reference):
+    config, _ = reference
+    _, alone = simulate_batch(config=config)
+    _, batched = simulate_batch(inertia=[config.inertia, 2 * config.inertia],
+                                load_factor=[config.load_torque_factor, 0.5], config=config)
+    np.testing.assert_allclose(batched[0], alone[0], rtol=0, atol=2e-3)
+
+
+@pytest.mark.parametrize('method', METHODS)
+def test_batch_metrics_match_trajectory(reference, method):
+    # Same speed in, same metrics out
+    config, result = reference
+    expected = getattr(result, method)
+    outputs = batch_metrics(expected.time[np.newaxis], expected.omega_rad[np.newaxis],
+                            method=method, config=config)
+    for name, output in zip(OUTPUTS, outputs):
+        np.testing.assert_allclose(output[0], getattr(expected, name), rtol=1e-12,
+                                   atol=1e-9, err_msg=name)
+
+
+def test_unknown_names_raise():
+    with pytest.raises(ValueError, match="unknown load type 'pump'"):
+        scenario_codes(['fan_pump', 'pump'], ('constant_torque', 'fan_pump'), 2, 'load type')
+    with pytest.raises(ValueError, match='unknown method'):
+        simulate_batch(method='direct_online')
@@ -0,0 +1,62 @@
+# =============================================================================
+# Result cache (cache.py)
+# =============================================================================
+
+import gc
+import weakref
+
+import numpy as np
+
+from vfd_simulation import DEFAULT_CONFIG
+from vfd_simulation.cache import ResultCache, config_key
+
+from conftest import METHODS
+
+
+def test_round_trip(tmp_path, default_result):
+    cache = ResultCache(tmp_path)
+    assert cache.get(DEFAULT_CONFIG) is None
+    cache.put(default_result)
+    cached = cache.get(DEFAULT_CONFIG)
+    for method in METHODS:
+        expected, trajectory = getattr(default_result, method), getattr(cached, method)
+        for name in ('time', 'omega_rad', 'current', 'power_in'):
+            np.testing.assert_array_equal(getattr(trajectory, name), getattr(expected, name))
+    assert cached.costs == default_result.costs
+    assert (cache.session.hits, cache.session.misses) == (1, 1)
+
+
+def test_key():
+    key = config_key(DEFAULT_CONFIG)
+    # Costs are recomputed on a hit, so they do not split entries
+    assert config_key(DEFAULT_CONFIG.replace(energy_cost_per_kwh=0.2)) == key
+    assert config_key(DEFAULT_CONFIG.replace(inertia=DEFAULT_CONFIG.inertia + 1)) != key
+    assert config_key(DEFAULT_CONFIG.replace(load_type='fan_pump')) != key
+
+
+def test_truncated_entry_is_a_miss(tmp_path, default_result):
+    cache = ResultCache(tmp_path)
+    cache.put(default_result)
+    path, _ = cache.entries()[0]
+    path.write_bytes(path.read_bytes()[:1000])
+    assert cache.get(DEFAULT_CONFIG) is None
+    assert not path.exists()
+    assert cache.session.misses == 1
+    assert cache.simulate(DEFAULT_CONFIG).config == DEFAULT_CONFIG
+
+
+def test_stats_saved_on_close(tmp_path):
+    with ResultCache(tmp_path) as cache:
+        cache.get(DEFAULT_CONFIG)
+    assert ResultCache(tmp_path).stats().misses == 1
+
+
+def test_dropped_cache_saves_stats(tmp_path):
+    cache = ResultCache(tmp_path)
+    cache.get(DEFAULT_CONFIG)
+    reference = weakref.ref(cache)
+    del cache
+    gc.collect()
+    # Nothing (such as an exit handler) keeps the cache alive
+    assert reference() is None
+    assert ResultCache(tmp_path).stats().misses == 1
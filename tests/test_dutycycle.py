@@ -0,0 +1,80 @@
+# =============================================================================
+# Duty-cycle accumulation (dutycycle.py)
+# =============================================================================
+
+import dataclasses
+
+import numpy as np
+import pytest
+
+from vfd_simulation import DEFAULT_CONFIG
+from vfd_simulation.dutycycle import DutyCycleAccumulator, main
+
+# kJ per start, so the accumulator does not simulate the starts
+START_KJ = 10_000.0
+
+
+def _profile():
+    # Three runs of an hour at varying speed, the second starting on sample
+    # 7200 (a chunk boundary below)
+    speed = np.zeros(4 * 3600)
+    speed[100:3000] = 0.9
+    speed[7200:9000] = np.linspace(0.6, 1.0, 1800)
+    speed[9000:13000] = 0.7
+    return speed, np.full(speed.size, DEFAULT_CONFIG.load_torque_factor)
+
+
+def _accumulate(speed, load, boundaries, time_step=1.0):
+    accumulator = DutyCycleAccumulator(DEFAULT_CONFIG, time_step, START_KJ, START_KJ)
+    for chunk_speed, chunk_load in zip(np.split(speed, boundaries), np.split(load, boundaries)):
+        accumulator.update(chunk_speed, chunk_load)
+    return accumulator
+
+
+def test_chunking_does_not_change_the_result():
+    speed, load = _profile()
+    whole = _accumulate(speed, load, [])
+    chunked = _accumulate(speed, load, [1, 2999, 3000, 7200, 8000, 8001, 12_345])
+    assert whole.starts == chunked.starts == 2
+    assert np.concatenate(chunked.start_samples).tolist() == [100, 7200]
+    expected, actual = dataclasses.asdict(whole.summary()), dataclasses.asdict(chunked.summary())
+    for field, value in expected.items():
+        assert actual[field] == pytest.approx(value, rel=1e-12), field
+
+
+def test_run_across_chunk_boundary_is_one_start():
+    speed, load = np.full(100, 0.8), np.full(100, 0.75)
+    accumulator = _accumulate(speed, load, [10, 50])
+    assert accumulator.starts == 1
+    assert accumulator.running_samples == 100
+
+
+@pytest.mark.parametrize('time_step', (1.0, 7.0))
+def test_interval_binning(time_step):
+    # Energy lands in the demand interval of each sample, also when the time
+    # step does not divide the interval
+    speed, load = _profile()
+    accumulator = _accumulate(speed, load, [5000], time_step)
+    interval = accumulator.tariff.interval
+    power = np.where(speed > 0, accumulator.efficiency_map.lookup('power_in', speed, load), 0.0)
+    power *= 1 + DEFAULT_CONFIG.vfd_continuous_loss_pct
+    index = (np.arange(speed.size) * time_step // interval).astype(np.intp)
+    expected = np.bincount(index, power) * time_step / 3600
+    np.testing.assert_allclose(accumulator.vfd_intervals[:expected.size], expected, rtol=1e-12)
+    assert not accumulator.vfd_intervals[expected.size:].any()
+    summary = accumulator.summary()
+    assert summary.vfd_energy_kwh == pytest.approx(expected.sum() + 2 * START_KJ / 3600)
+    assert summary.hours == pytest.approx(speed.size * time_step / 3600)
+
+
+def test_command_line_profiles(tmp_path, capsys):
+    profile = tmp_path / 'profile.npy'
+    main(['--synthetic-days', '1', '--seed', '3', '--write-synthetic', str(profile)])
+    from_npy = main([str(profile), '--chunk-size', '5000'])
+    csv_profile = tmp_path / 'profile.csv'
+    np.savetxt(csv_profile, np.load(profile), delimiter=',', header='speed,load', comments='')
+    from_csv = main([str(csv_profile), '--chunk-size', '7000'])
+    assert 'VFD premium payback' in capsys.readouterr().out
+    assert from_npy.samples == from_csv.samples == 86400
+    assert from_csv.starts == from_npy.starts > 0
+    assert from_csv.vfd_energy_kwh == pytest.approx(from_npy.vfd_energy_kwh, rel=1e-6)
@@ -0,0 +1,47 @@
+# =============================================================================
+# Columnar export round trips (export.py)
+# =============================================================================
+
+import numpy as np
+import pytest
+
+from vfd_simulation.export import TRAJECTORIES, TRAJECTORY_COLUMNS, read_columns, write_columns
+
+
+def _expected(result, prefix, name):
+    trajectory = getattr(result, TRAJECTORIES[prefix])
+    return np.asarray(getattr(trajectory, TRAJECTORY_COLUMNS[name]), dtype=float)
+
+
+def _check_round_trip(result, filename, dtype, **compare):
+    write_columns(result, filename, dtype=dtype)
+    columns, metadata = read_columns(filename)
+    assert metadata['config']['inertia'] == result.config.inertia
+    assert metadata['costs']['payback_years'] == result.costs.payback_years
+    assert len(columns) == len(TRAJECTORIES) * len(TRAJECTORY_COLUMNS)
+    for prefix in TRAJECTORIES:
+        for name in TRAJECTORY_COLUMNS:
+            column = columns[f'{prefix}_{name}']
+            assert column.dtype == dtype
+            np.testing.assert_allclose(column, _expected(result, prefix, name), **compare)
+
+
+def test_npz_default_is_lossless(default_result, tmp_path):
+    _check_round_trip(default_result, tmp_path / 'run.npz', np.float64, rtol=0, atol=0)
+
+
+def test_npz_float32_option(default_result, tmp_path):
+    _check_round_trip(default_result, tmp_path / 'run.npz', np.float32, rtol=1e-6, atol=1e-4)
+
+
+@pytest.mark.parametrize('suffix', ['.parquet', '.arrow'])
+def test_pyarrow_formats(default_result, tmp_path, suffix):
+    pytest.importorskip('pyarrow')
+    _check_round_trip(default_result, tmp_path / f'run{suffix}', np.float64, rtol=0, atol=0)
+
+
+def test_pyarrow_formats_need_pyarrow(default_result, tmp_path, monkeypatch):
+    from vfd_simulation import export
+    monkeypatch.setattr(export, 'pa', None)
+    with pytest.raises(ImportError, match='pyarrow'):
+        write_columns(default_result, tmp_path / 'run.parquet')
@@ -0,0 +1,55 @@
+# =============================================================================
+# Fleet simulation on a shared bus (fleet.py)
+# =============================================================================
+
+import numpy as np
+import pytest
+
+from vfd_simulation import DEFAULT_CONFIG
+from vfd_simulation.fleet import Motor, main, simulate_fleet
+
+from conftest import METHODS
+
+
+def _motor(method, start_time=0.0, **overrides):
+    return Motor(DEFAULT_CONFIG.power_hp, DEFAULT_CONFIG.inertia, method, start_time, **overrides)
+
+
+@pytest.mark.parametrize('method', METHODS)
+def test_single_motor_matches_simulate(default_result, method):
+    expected = getattr(default_result, method)
+    result = simulate_fleet([_motor(method)], time=expected.time)
+    np.testing.assert_allclose(result.omega_rad[0], expected.omega_rad, rtol=1e-3, atol=1e-2)
+    assert result.peak_current == pytest.approx(expected.peak_current, rel=1e-3)
+    assert result.failed == []
+
+
+def test_start_time_shifts_the_motor():
+    time = np.linspace(0, 40, 401)
+    result = simulate_fleet([_motor('vfd'), _motor('soft_starter', 5.0)], time=time)
+    alone = simulate_fleet([_motor('soft_starter')], time=time - 5.0)
+    assert np.all(result.current[1, time < 5.0] == 0)
+    np.testing.assert_allclose(result.current[1, time >= 5.0], alone.current[0, time >= 5.0],
+                               rtol=1e-3, atol=1e-2)
+    np.testing.assert_allclose(result.bus_current, result.current.sum(axis=0))
+
+
+def test_failed_motor_is_nan():
+    # The constant-power stall fails only its own motor
+    stalled = _motor('soft_starter', 5.0, load_type='constant_power', name='stalled')
+    result = simulate_fleet([_motor('vfd'), stalled])
+    assert result.failed == [stalled]
+    assert np.isnan(result.current[1]).all()
+    alone = simulate_fleet([_motor('vfd')], time=result.time)
+    np.testing.assert_allclose(result.bus_current, alone.bus_current, rtol=1e-3, atol=1e-2)
+
+
+def test_command_line(tmp_path, capsys):
+    motors = tmp_path / 'motors.csv'
+    motors.write_text('name,power_hp,inertia,method,start_time\n'
+                      'pump,200,30,vfd,0\nfan,150,20,soft_starter,8\n')
+    bus = tmp_path / 'bus.csv'
+    result = main([str(motors), '--csv', str(bus)])
+    assert [motor.name for motor in result.motors] == ['pump', 'fan']
+    assert 'Peak Bus Current' in capsys.readouterr().out
+    assert len(bus.read_text().splitlines()) == result.time.size + 1
@@ -0,0 +1,66 @@
+# =============================================================================
+# Lookup-table curves (models.py, config.lookup_tolerance)
+# =============================================================================
+
+import numpy as np
+import pytest
+
+from vfd_simulation import DEFAULT_CONFIG, LOAD_TYPES
+from vfd_simulation.models import (
+    TORQUE_A, TORQUE_B, TORQUE_C, get_load_torque_array, get_load_torque_table_array,
+    load_factor_table, make_soft_start_dynamics, make_soft_start_table_dynamics,
+    make_vfd_dynamics, make_vfd_table_dynamics, torque_ratio_table,
+)
+
+from conftest import METHODS, _simulate
+
+TOLERANCES = (1e-2, 1e-4, 1e-6)
+# Much denser than the quarter points checked while building the tables
+CHECK = np.linspace(0.0, 1.0, 1_000_003)
+
+
+@pytest.mark.parametrize('tolerance', TOLERANCES)
+def test_torque_ratio_within_tolerance(tolerance):
+    table = torque_ratio_table(tolerance)
+    exact = (TORQUE_A * CHECK) / (CHECK**2 + TORQUE_B * CHECK + TORQUE_C)
+    assert np.max(np.abs(table(CHECK) - exact)) <= tolerance
+    assert table.max_error <= tolerance
+
+
+@pytest.mark.parametrize('load_type', LOAD_TYPES)
+@pytest.mark.parametrize('tolerance', TOLERANCES)
+def test_load_torque_within_tolerance(tolerance, load_type):
+    base_torque = DEFAULT_CONFIG.load_torque
+    error = np.abs(get_load_torque_table_array(CHECK, base_torque, load_type, tolerance)
+                   - get_load_torque_array(CHECK, base_torque, load_type))
+    assert np.max(error) <= base_torque * tolerance
+    assert load_factor_table(load_type, tolerance).max_error <= tolerance
+
+
+@pytest.mark.parametrize('load_type', LOAD_TYPES)
+@pytest.mark.parametrize('method', METHODS)
+def test_table_rhs_within_tolerance(method, load_type):
+    # Torque within tolerance x rated torque (times the VFD boost), load
+    # within tolerance x load torque
+    tolerance = 1e-4
+    config = DEFAULT_CONFIG.replace(load_type=load_type, lookup_tolerance=tolerance)
+    if method == 'vfd':
+        make, make_table, ramp_time = make_vfd_dynamics, make_vfd_table_dynamics, config.vfd_ramp_time
+    else:
+        make, make_table, ramp_time = (make_soft_start_dynamics, make_soft_start_table_dynamics,
+                                       config.soft_start_ramp_time)
+    args = (config.load_torque, load_type, ramp_time, config)
+    rhs, table_rhs = make(*args), make_table(*args)
+    bound = (config.rated_torque * (1 + config.v_boost) + config.load_torque) * tolerance / config.inertia
+    for t in np.linspace(0.0, 1.5 * ramp_time, 31):
+        for omega_rad in np.linspace(0.0, 1.05, 211) * config.sync_speed_rad:
+            assert abs(table_rhs([omega_rad], t) - rhs([omega_rad], t)) <= bound, (t, omega_rad)
+
+
+@pytest.mark.parametrize('method', METHODS)
+def test_start_with_tables(reference, method):
+    config, result = reference
+    expected = getattr(result, method)
+    actual = getattr(_simulate(config.replace(lookup_tolerance=1e-6)), method)
+    np.testing.assert_allclose(actual.omega_rad, expected.omega_rad, rtol=1e-4, atol=1e-3)
+    assert actual.peak_current == pytest.approx(expected.peak_current, rel=1e-4)
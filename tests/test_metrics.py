@@ -0,0 +1,44 @@
+# =============================================================================
+# Vectorized calculate_metrics against the v4.0.0 per-sample loop (metrics.py)
+# =============================================================================
+
+import numpy as np
+import pytest
+
+from benchmarks.bench_calculate_metrics import calculate_metrics_loop
+from vfd_simulation import DEFAULT_CONFIG, calculate_metrics
+
+from conftest import METHODS
+
+
+def _trajectories(result, method):
+    # The simulated start, and a synthetic speed sweep past synchronous speed
+    # (slip clipped at 0)
+    trajectory = getattr(result, method)
+    time = trajectory.time
+    yield time, trajectory.omega_rad
+    yield time, np.linspace(0, 1.05 * DEFAULT_CONFIG.sync_speed_rad, time.size)
+
+
+@pytest.mark.parametrize('method', METHODS)
+def test_matches_loop(default_result, method):
+    ramp_time = getattr(default_result, method).time[-1]
+    for time, omega_rad in _trajectories(default_result, method):
+        vectorized = calculate_metrics(time, omega_rad, method, ramp_time)
+        loop = calculate_metrics_loop(time, omega_rad, method, ramp_time)
+        for row, (value, expected) in enumerate(zip(vectorized, loop)):
+            np.testing.assert_allclose(value, expected, rtol=1e-12, atol=1e-12, err_msg=row)
+
+
+def test_vfd_inactive_below_half_hertz(default_result):
+    # The drive produces no output below 0.5 Hz: every metric is zero there
+    time = default_result.vfd.time
+    ramp_time = time[-1]
+    inactive = DEFAULT_CONFIG.base_freq * time / ramp_time < 0.5
+    assert 0 < inactive.sum() < time.size
+    omega_rad = np.full(time.size, 1.0)
+    vectorized = calculate_metrics(time, omega_rad, 'vfd', ramp_time)
+    loop = calculate_metrics_loop(time, omega_rad, 'vfd', ramp_time)
+    for value, expected in zip(vectorized, loop):
+        np.testing.assert_array_equal(value[inactive], 0.0)
+        np.testing.assert_allclose(value, expected, rtol=1e-12, atol=1e-12)
@@ -0,0 +1,58 @@
+# =============================================================================
+# Motor dynamics: Jacobians and compiled right-hand sides (models.py)
+# =============================================================================
+
+import numpy as np
+import pytest
+
+from vfd_simulation import DEFAULT_CONFIG, LOAD_TYPES
+from vfd_simulation.models import (
+    make_soft_start_dynamics, make_vfd_dynamics, soft_start_motor_dynamics,
+    soft_start_motor_jacobian, vfd_motor_dynamics, vfd_motor_jacobian,
+)
+
+from conftest import LOADS
+
+DYNAMICS = {
+    'vfd': (vfd_motor_dynamics, vfd_motor_jacobian, make_vfd_dynamics,
+            DEFAULT_CONFIG.vfd_ramp_time),
+    'soft_starter': (soft_start_motor_dynamics, soft_start_motor_jacobian,
+                     make_soft_start_dynamics, DEFAULT_CONFIG.soft_start_ramp_time),
+}
+# Points across the ramp and past its end, clear of the branch corners
+TIME_FRACTIONS = (0.01, 0.1, 0.37, 0.75, 1.3)
+SPEED_FRACTIONS = (0.02, 0.2, 0.5, 0.8, 0.93, 0.99)
+
+
+def _points(ramp_time):
+    for time_fraction in TIME_FRACTIONS:
+        for speed_fraction in SPEED_FRACTIONS:
+            yield time_fraction * ramp_time, speed_fraction * DEFAULT_CONFIG.sync_speed_rad
+
+
+@pytest.mark.parametrize('load_type', LOADS)
+@pytest.mark.parametrize('method', DYNAMICS)
+def test_jacobian_matches_finite_differences(method, load_type):
+    dynamics, jacobian, _, ramp_time = DYNAMICS[method]
+    args = (DEFAULT_CONFIG.load_torque, load_type, ramp_time, DEFAULT_CONFIG)
+    step = 1e-4
+    for t, omega_rad in _points(ramp_time):
+        expected = (dynamics([omega_rad + step], t, *args)[0]
+                    - dynamics([omega_rad - step], t, *args)[0]) / (2 * step)
+        actual = jacobian([omega_rad], t, *args)[0][0]
+        assert actual == pytest.approx(expected, rel=1e-5, abs=1e-9), (t, omega_rad)
+
+
+@pytest.mark.parametrize('load_type', LOAD_TYPES)
+@pytest.mark.parametrize('method', DYNAMICS)
+def test_compiled_rhs_matches_reference(method, load_type):
+    # Same operations in the same order: equal to the last bit, including the
+    # clipped slip and speed ranges and the constant-power step
+    dynamics, _, make, ramp_time = DYNAMICS[method]
+    args = (DEFAULT_CONFIG.load_torque, load_type, ramp_time, DEFAULT_CONFIG)
+    rhs = make(*args)
+    times = np.linspace(0.0, 1.5 * ramp_time, 61)
+    speeds = np.linspace(-0.1, 1.1, 121) * DEFAULT_CONFIG.sync_speed_rad
+    for t in times:
+        for omega_rad in speeds:
+            assert rhs([omega_rad], t) == dynamics([omega_rad], t, *args)[0], (t, omega_rad)
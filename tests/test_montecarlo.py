@@ -0,0 +1,40 @@
+# =============================================================================
+# Monte Carlo statistics (montecarlo.py)
+# =============================================================================
+
+import math
+
+import numpy as np
+import pytest
+
+from vfd_simulation.montecarlo import (
+    REPORT_COLUMNS, exceedance_probability, percentile_table, print_monte_carlo_summary,
+)
+
+
+def _results(values):
+    return {column: np.array(values, dtype=float) for column in REPORT_COLUMNS}
+
+
+def test_failed_samples_left_out():
+    values = [1.0, 2.0, 3.0, 4.0, np.nan, np.nan]
+    row = percentile_table(_results(values), (50,))['vfd_peak_current']
+    assert row['mean'] == pytest.approx(2.5)
+    assert row['std'] == pytest.approx(np.std([1, 2, 3, 4], ddof=1))
+    assert row['P50'] == pytest.approx(2.5)
+    probability, half_width = exceedance_probability(np.array(values), 2.5)
+    assert probability == pytest.approx(0.5)
+    assert half_width == pytest.approx(1.96 * math.sqrt(0.25 / 4))
+
+
+def test_all_failed():
+    row = percentile_table(_results([np.nan, np.nan]), (50,))['ss_energy_kj']
+    assert all(math.isnan(value) for value in row.values())
+    assert all(math.isnan(value) for value in exceedance_probability(np.array([np.nan]), 1.0))
+
+
+def test_summary_reports_failed_samples(capsys):
+    print_monte_carlo_summary(_results([1000.0, 2000.0, np.nan]), 3, 1500.0)
+    output = capsys.readouterr().out
+    assert '1 samples failed to integrate' in output
+    assert 'peak current > 1500 A) = 0.5000' in output
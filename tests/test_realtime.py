@@ -0,0 +1,65 @@
+# =============================================================================
+# Fixed-step real-time motor (realtime.py)
+# =============================================================================
+
+import numpy as np
+import pytest
+
+from vfd_simulation.models import soft_start_voltage_array, vfd_freq_array
+from vfd_simulation.realtime import (
+    I_FREQ, I_VOLTAGE_RATIO, INTEGRATORS, O_CURRENT, O_POWER_IN, S_OMEGA, S_TIME, RealtimeMotor,
+)
+from vfd_simulation.solvers import start_ramp_time
+
+from conftest import METHODS
+
+STEPS = {'rk4': 1e-3, 'exponential': 1e-4}
+
+
+def _ramp_inputs(method, time, config):
+    ramp_time = start_ramp_time(method, config)
+    return vfd_freq_array(time, ramp_time, config), \
+        soft_start_voltage_array(time, ramp_time, config) / config.voltage
+
+
+@pytest.mark.parametrize('integrator', INTEGRATORS)
+@pytest.mark.parametrize('method', METHODS)
+def test_step_follows_odeint(reference, method, integrator):
+    # Driven along the built-in ramps (inputs at each step's midpoint), the
+    # fixed-step motor tracks the odeint start
+    config, result = reference
+    expected = getattr(result, method)
+    dt = STEPS[integrator]
+    n_steps = int(round(start_ramp_time(method, config) / dt))
+    freq, voltage_ratio = _ramp_inputs(method, (np.arange(n_steps) + 0.5) * dt, config)
+
+    motor = RealtimeMotor(method, config, integrator)
+    omega_rad = np.zeros(n_steps + 1)
+    for k in range(n_steps):
+        motor.inputs[I_FREQ] = freq[k]
+        motor.inputs[I_VOLTAGE_RATIO] = voltage_ratio[k]
+        omega_rad[k + 1] = motor.step(dt)[S_OMEGA]
+    assert motor.state[S_TIME] == pytest.approx(n_steps * dt)
+    np.testing.assert_allclose(np.interp(expected.time, np.arange(n_steps + 1) * dt, omega_rad),
+                               expected.omega_rad, atol=1e-3)
+    assert omega_rad[-1] == pytest.approx(expected.omega_rad[-1], abs=1e-5)
+
+
+@pytest.mark.parametrize('method', METHODS)
+def test_outputs_match_metrics(reference, method):
+    config, result = reference
+    expected = getattr(result, method)
+    freq, voltage_ratio = _ramp_inputs(method, expected.time, config)
+    motor = RealtimeMotor(method, config)
+    for k in range(0, expected.time.size, 37):
+        motor.reset(expected.omega_rad[k])
+        motor.inputs[I_FREQ] = freq[k]
+        motor.inputs[I_VOLTAGE_RATIO] = voltage_ratio[k]
+        motor.step(0.0)
+        assert motor.outputs[O_CURRENT] == pytest.approx(expected.current[k], rel=1e-9, abs=1e-9)
+        assert motor.outputs[O_POWER_IN] == pytest.approx(expected.power_in[k], rel=1e-9, abs=1e-9)
+
+
+def test_unknown_integrator():
+    with pytest.raises(ValueError):
+        RealtimeMotor('vfd', integrator='euler')
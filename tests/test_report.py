@@ -0,0 +1,67 @@
+# =============================================================================
+# CSV export (report.py)
+# =============================================================================
+
+import csv
+import io
+
+import numpy as np
+
+from vfd_simulation.report import write_comparison_csv, write_csv_block
+
+FORMATS = ['%.3f', '%.1f', '%.1f', '%.1f', '%.2f', '%.2f', '%.2f', '%.1f']
+DIGITS = [3, 1, 1, 1, 2, 2, 2, 1]
+COLUMNS = ('time', 'omega_rpm', 'current', 'torque', 'slip', 'power_in', 'power_out',
+           'efficiency')
+
+
+def _row_writer(columns, digits):
+    # The per-sample csv.writer of f-strings that write_csv_block replaced
+    output = io.StringIO(newline='')
+    writer = csv.writer(output)
+    for row in zip(*columns):
+        writer.writerow([f'{value:.{places}f}' for value, places in zip(row, digits)])
+    return output.getvalue()
+
+
+def _block(columns, chunk_rows):
+    output = io.StringIO(newline='')
+    write_csv_block(output, columns, FORMATS, chunk_rows)
+    return output.getvalue()
+
+
+def test_bulk_block_matches_row_writer(default_result):
+    # Identical bytes for identical data, including values on rounding ties
+    # and across chunk boundaries
+    rng = np.random.default_rng(7)
+    columns = [rng.normal(0, 1e3, 1001) for _ in FORMATS]
+    columns[0][:4] = [0.0005, 0.0015, -0.0025, 2.675]
+    assert _block(columns, 97) == _row_writer(columns, DIGITS)
+
+    trajectory = [getattr(default_result.vfd, name) for name in COLUMNS]
+    assert _block(trajectory, 300) == _row_writer(trajectory, DIGITS)
+
+
+def _data_blocks(filename):
+    # {'VFD DATA': rows, 'SOFT STARTER DATA': rows} as float arrays
+    blocks, current = {}, None
+    with open(filename, newline='') as csvfile:
+        for row in csv.reader(csvfile):
+            if len(row) == 1 and row[0].endswith('DATA'):
+                current = blocks[row[0]] = []
+            elif current is not None and row and row[0][0] in '-0123456789':
+                current.append([float(value) for value in row])
+    return {name: np.array(rows) for name, rows in blocks.items()}
+
+
+def test_comparison_csv_within_printed_precision(default_result, tmp_path):
+    filename = tmp_path / 'comparison.csv'
+    write_comparison_csv(default_result, filename)
+    blocks = _data_blocks(filename)
+    for block, trajectory in (('VFD DATA', default_result.vfd),
+                              ('SOFT STARTER DATA', default_result.soft_starter)):
+        rows = blocks[block]
+        assert rows.shape == (len(trajectory.time), len(COLUMNS))
+        for i, (name, places) in enumerate(zip(COLUMNS, DIGITS)):
+            np.testing.assert_allclose(rows[:, i], getattr(trajectory, name),
+                                       rtol=0, atol=0.5 * 10.0**-places + 1e-9)
@@ -0,0 +1,64 @@
+# =============================================================================
+# Start-sequence optimizer (sequencing.py)
+# =============================================================================
+
+import numpy as np
+import pytest
+
+from vfd_simulation.fleet import Motor, read_motors, simulate_fleet
+from vfd_simulation.sequencing import (
+    main, optimize_sequence, peak_currents, schedule_indices, start_curves,
+)
+
+SEQUENCE_TIME = 40.0
+MOTORS = [
+    Motor(300, 60, 'soft_starter', name='compressor'),
+    Motor(200, 30, 'vfd', name='pump'),
+    Motor(150, 20, 'soft_starter', ramp_time=10.0, name='fan'),
+]
+
+
+@pytest.fixture(scope='module')
+def curves():
+    return start_curves(MOTORS, SEQUENCE_TIME)
+
+
+def test_schedule_matches_fleet_run(curves):
+    # Shifting the cached curves gives the bus current of a full fleet run
+    start_times, ramp_times = np.array([0.0, 5.0, 12.0]), np.array([15.0, 20.0, 10.0])
+    peak = peak_currents(curves, *schedule_indices(curves, start_times, ramp_times))[0]
+    motors = [Motor(motor.power_hp, motor.inertia, motor.method, start, ramp_time=ramp)
+              for motor, start, ramp in zip(MOTORS, start_times, ramp_times)]
+    fleet = simulate_fleet(motors, time=curves.time)
+    assert peak == pytest.approx(fleet.peak_current, rel=1e-3)
+
+
+def test_optimized_schedule(curves):
+    schedule = optimize_sequence(MOTORS, SEQUENCE_TIME, restarts=0, curves=curves)
+    assert np.all(schedule.start_times + schedule.ramp_times <= SEQUENCE_TIME + 1e-9)
+    assert schedule.ramp_times[2] == 10.0
+    rescored = peak_currents(curves, *schedule_indices(curves, schedule.start_times,
+                                                       schedule.ramp_times))[0]
+    assert rescored == pytest.approx(schedule.peak_current)
+    # Better than starting everything at once on the shortest ramps
+    together = peak_currents(curves, np.zeros(3, dtype=np.intp), np.zeros(3, dtype=np.intp))[0]
+    assert schedule.peak_current < together
+
+
+def test_motor_that_cannot_be_integrated():
+    with pytest.raises(ValueError, match='stalled'):
+        start_curves([Motor(100, 10, 'soft_starter', load_type='constant_power',
+                            ramp_time=10.0, name='stalled')], SEQUENCE_TIME)
+
+
+def test_command_line(tmp_path, capsys):
+    motors = tmp_path / 'motors.csv'
+    motors.write_text('name,power_hp,inertia,method,ramp_time\n'
+                      'pump,200,30,vfd,\nfan,150,20,soft_starter,10\n')
+    schedule_csv = tmp_path / 'schedule.csv'
+    schedule = main([str(motors), '--sequence-time', '40', '--restarts', '0',
+                     '--csv', str(schedule_csv)])
+    assert 'Peak Bus Current' in capsys.readouterr().out
+    scheduled = read_motors(schedule_csv)
+    assert [motor.start_time for motor in scheduled] == pytest.approx(schedule.start_times)
+    assert [motor.ramp_time for motor in scheduled] == pytest.approx(schedule.ramp_times)
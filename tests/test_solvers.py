@@ -0,0 +1,42 @@
+# =============================================================================
+# solve_ivp terminal events (solvers.py)
+# =============================================================================
+
+import pytest
+
+from vfd_simulation import DEFAULT_CONFIG
+from vfd_simulation.solvers import HORIZON_FACTOR, solve_ivp_events, start_ramp_time
+
+from conftest import LOADS, METHODS
+
+
+@pytest.mark.parametrize('method', METHODS)
+def test_reaches_speed(reference, method):
+    config, _ = reference
+    time, omega_rad, _, event_times, end_reason = solve_ivp_events(method, config)
+    assert end_reason == 'reached_speed'
+    assert event_times['stall'] is None
+    assert omega_rad[-1] == pytest.approx(config.sync_speed_rad * (1 - config.speed_tolerance))
+    assert time[-1] == pytest.approx(event_times['reached_speed'])
+
+
+@pytest.mark.parametrize('load_type', LOADS)
+@pytest.mark.parametrize('method', METHODS)
+def test_running_point_is_not_a_stall(method, load_type):
+    # Without the speed event the start settles at its running speed and
+    # runs to the horizon
+    config = DEFAULT_CONFIG.replace(load_type=load_type, speed_tolerance=None)
+    time, omega_rad, _, event_times, end_reason = solve_ivp_events(method, config)
+    assert end_reason == 'timeout'
+    assert event_times['stall'] is None
+    assert time[-1] == pytest.approx(HORIZON_FACTOR * start_ramp_time(method, config))
+    assert omega_rad[-1] > 0.96 * config.sync_speed_rad
+
+
+@pytest.mark.parametrize('method', METHODS)
+def test_constant_power_stalls(method):
+    config = DEFAULT_CONFIG.replace(load_type='constant_power')
+    _, omega_rad, _, event_times, end_reason = solve_ivp_events(method, config)
+    assert end_reason == 'stall'
+    assert event_times['stall'] is not None
+    assert omega_rad[-1] < 0.2 * config.sync_speed_rad
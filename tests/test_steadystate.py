@@ -0,0 +1,70 @@
+# =============================================================================
+# Steady-state operating points and efficiency map (steadystate.py)
+# =============================================================================
+
+import numpy as np
+import pytest
+
+from vfd_simulation import DEFAULT_CONFIG
+from vfd_simulation.models import get_load_torque_array
+from vfd_simulation.steadystate import (
+    BREAKDOWN_SLIP, efficiency_map, solve_operating_point, solve_slip,
+)
+
+from conftest import LOADS, METHODS, _simulate
+
+SETPOINTS = np.linspace(0.05, 1.0, 20)[:, np.newaxis]
+LOAD_FACTORS = np.linspace(0.0, 1.2, 13)[np.newaxis, :]
+
+
+def test_default_slip():
+    slip = solve_slip(1.0, DEFAULT_CONFIG.load_torque_factor)[0]
+    assert float(slip) == pytest.approx(0.0289, abs=1e-4)
+
+
+@pytest.mark.parametrize('load_type', LOADS)
+def test_torque_balance(load_type):
+    # Electromagnetic torque equals load plus damping, on the stable side of
+    # the torque-slip curve
+    config = DEFAULT_CONFIG.replace(load_type=load_type)
+    point = solve_operating_point(SETPOINTS, LOAD_FACTORS, config=config)
+    running = ~point.stalled
+    omega_rad = point.speed_ratio * config.sync_speed_rad
+    load = get_load_torque_array(point.speed_ratio, config.rated_torque * LOAD_FACTORS, load_type)
+    np.testing.assert_allclose(point.torque[running],
+                               (load + config.damping * omega_rad)[running], rtol=1e-9)
+    assert np.all(point.slip[running] < BREAKDOWN_SLIP)
+
+
+def test_stalled_and_idle_points():
+    point = solve_operating_point(np.array([0.0, 0.5, 1.0]), np.array([0.75, 5.0, 0.75]))
+    assert point.stalled.tolist() == [False, True, False]
+    assert point.power_in[0] == 0 and point.current[0] == 0
+    assert np.isnan(point.power_in[1])
+
+
+@pytest.mark.parametrize('load_type', LOADS)
+@pytest.mark.parametrize('method', METHODS)
+def test_start_settles_at_operating_point(method, load_type):
+    # Full output is setpoint 1 for both starters
+    config = DEFAULT_CONFIG.replace(load_type=load_type, solver='solve_ivp', speed_tolerance=None)
+    start = getattr(_simulate(config), method)
+    point = solve_operating_point(1.0, config.load_torque_factor, config=config)
+    assert start.slip[-1] / 100 == pytest.approx(float(point.slip), rel=1e-3)
+    assert start.current[-1] == pytest.approx(float(point.current), rel=1e-4)
+    assert start.power_in[-1] == pytest.approx(float(point.power_in), rel=1e-4)
+
+
+def test_efficiency_map_lookup():
+    energy_map = efficiency_map(DEFAULT_CONFIG)
+    assert efficiency_map(DEFAULT_CONFIG) is energy_map
+    speed, load = energy_map.speed_setpoints[150], energy_map.load_factors[60]
+    exact = solve_operating_point(speed, load)
+    assert energy_map.lookup('power_in', speed, load) == pytest.approx(float(exact.power_in))
+
+    # Between grid points, bilinear interpolation stays close to the solution
+    speed, load = np.linspace(0.3, 1.0, 50), np.linspace(0.1, 1.2, 50)
+    exact = solve_operating_point(speed, load)
+    power_in, efficiency = energy_map.lookup(('power_in', 'efficiency'), speed, load)
+    np.testing.assert_allclose(power_in, exact.power_in, rtol=1e-3)
+    np.testing.assert_allclose(efficiency, exact.efficiency, atol=0.1)
@@ -0,0 +1,62 @@
+# =============================================================================
+# Summary-only streaming mode against simulate (streaming.py)
+# =============================================================================
+
+import dataclasses
+import math
+import warnings
+
+import numpy as np
+import pytest
+
+from vfd_simulation import DEFAULT_CONFIG, simulate
+from vfd_simulation.streaming import summarize_scenario, summarize_start
+
+from conftest import METHODS
+
+
+def _kpis(trajectory):
+    return {
+        'peak_current': trajectory.peak_current,
+        'final_slip': trajectory.slip[-1],
+        'final_omega_rad': trajectory.omega_rad[-1],
+        'energy_kj': trajectory.energy_kj,
+    }
+
+
+@pytest.mark.parametrize('method', METHODS)
+def test_summary_matches_odeint(reference, method):
+    config, result = reference
+    summary = summarize_start(method, config)
+    expected = _kpis(getattr(result, method))
+    np.testing.assert_allclose(summary.peak_current, expected['peak_current'], rtol=1e-5)
+    np.testing.assert_allclose(summary.energy_kj, expected['energy_kj'], rtol=1e-5)
+    np.testing.assert_allclose(summary.final_slip, expected['final_slip'], atol=1e-4)
+    np.testing.assert_allclose(summary.final_omega_rad, expected['final_omega_rad'], atol=2e-4)
+
+
+def test_summary_matches_numba_arrays(reference):
+    # The accumulators see the samples simulate(solver='numba') stores
+    config, _ = reference
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        result = simulate(config.replace(solver='numba'))
+    summary = summarize_scenario(config)
+    for method in METHODS:
+        trajectory = getattr(result, method)
+        start = getattr(summary, method)
+        for name, value in _kpis(trajectory).items():
+            np.testing.assert_allclose(getattr(start, name), value, rtol=1e-12, err_msg=name)
+        peak = np.argmax(trajectory.current)
+        assert start.peak_current_time == pytest.approx(trajectory.time[peak], rel=1e-12)
+    np.testing.assert_allclose(summary.costs.payback_years, result.costs.payback_years,
+                               rtol=1e-6)
+
+
+@pytest.mark.parametrize('method', METHODS)
+def test_stalled_start_is_nan(reference, method):
+    config, _ = reference
+    assert not summarize_start(method, config).stalled
+    summary = summarize_start(method, DEFAULT_CONFIG.replace(load_type='constant_power'))
+    assert summary.stalled
+    assert all(math.isnan(value) for value in dataclasses.astuple(summary))
@@ -0,0 +1,38 @@
+# =============================================================================
+# Parameter sweeps (sweep.py)
+# =============================================================================
+
+import math
+
+import pytest
+
+from vfd_simulation import DEFAULT_CONFIG, LOAD_TYPES
+from vfd_simulation.sweep import (
+    STREAMING_COLUMNS, SUMMARY_COLUMNS, parse_spec, stream_summary, summarize,
+)
+
+
+@pytest.mark.parametrize('load_type', LOAD_TYPES)
+def test_summary_modes_agree(load_type):
+    # Including the constant-power stall, a NaN row in both modes
+    config = DEFAULT_CONFIG.replace(load_type=load_type)
+    rows = summarize(config), stream_summary(config)
+    assert set(rows[1]) == set(STREAMING_COLUMNS)
+    for column in SUMMARY_COLUMNS:
+        assert rows[1][column] == pytest.approx(rows[0][column], rel=1e-4, abs=1e-4,
+                                                nan_ok=True), column
+
+
+@pytest.mark.parametrize('task, columns', [(summarize, SUMMARY_COLUMNS),
+                                           (stream_summary, STREAMING_COLUMNS)])
+def test_failed_scenario_is_nan(task, columns):
+    row = task(DEFAULT_CONFIG.replace(load_type='constant_power'))
+    assert set(row) == set(columns)
+    assert all(math.isnan(value) for value in row.values())
+
+
+def test_parse_spec():
+    assert parse_spec('100,150') == [100.0, 150.0]
+    assert parse_spec('10:20:5') == [10.0, 15.0, 20.0]
+    with pytest.raises(ValueError):
+        parse_spec('10:20:0')
@@ -0,0 +1,47 @@
+# =============================================================================
+# Start and running charges (tariff.py, costs.py)
+# =============================================================================
+
+import numpy as np
+import pytest
+
+from vfd_simulation import DEFAULT_CONFIG, calculate_costs
+from vfd_simulation.simulation import StartTrajectory
+from vfd_simulation.tariff import EXAMPLE_TOU_TARIFF
+
+TARIFFS = (None, EXAMPLE_TOU_TARIFF)
+
+
+def _flat_start(config, duration=20.0):
+    # A start drawing the running load's input power for its whole length
+    time = np.linspace(0, duration, 201)
+    zeros = np.zeros_like(time)
+    return StartTrajectory(time, zeros, zeros, zeros, zeros,
+                           power_in=np.full_like(time, config.power_kw / config.efficiency))
+
+
+def test_flat_rate_start_cost():
+    config = DEFAULT_CONFIG
+    costs = calculate_costs(config, 9_000.0, 14_000.0)
+    rate = config.energy_cost_per_kwh * config.starts_per_year / 3600
+    assert costs.vfd_startup_cost == pytest.approx(9_000.0 * rate)
+    assert costs.ss_startup_cost == pytest.approx(14_000.0 * rate)
+    assert costs.vfd_annual_loss_cost == pytest.approx(
+        config.vfd_continuous_loss_pct * config.power_kw * config.annual_hours
+        * config.energy_cost_per_kwh)
+
+
+@pytest.mark.parametrize('tariff', TARIFFS)
+def test_start_interval_billed_once(tariff):
+    # A start at running power and then the run itself never peak above
+    # running power, so the start adds energy but no demand charge
+    config = DEFAULT_CONFIG.replace(tariff=tariff)
+    start = _flat_start(config)
+    costs = calculate_costs(config, start, start)
+    assert costs.ss_demand_cost == pytest.approx(0.0, abs=1e-6)
+    energy_kj = config.power_kw / config.efficiency * 20.0
+    expected = energy_kj / 3600 * config.starts_per_year * config.energy_cost_per_kwh
+    if tariff is None:
+        assert costs.ss_startup_cost == pytest.approx(expected)
+    else:
+        assert costs.ss_startup_cost > 0
@@ -0,0 +1,38 @@
+# =============================================================================
+# VFD-Motor-Simulation
+# =============================================================================
+# Importable simulation package. simulate(config) runs the v4.0.0 VFD vs
+# Soft Starter comparison and returns the trajectories and cost summary
+# without writing files, printing or plotting; the vfd_simulation_v*.py
+# scripts and `python -m vfd_simulation` are thin wrappers around it.
+#
+# Usage:
+#   from vfd_simulation import SimulationConfig, simulate
+#   result = simulate(SimulationConfig(load_type='fan_pump'))
+#   print(result.vfd.peak_current, result.costs.payback_years)
+# =============================================================================
+
+from .config import DEFAULT_CONFIG, LOAD_TYPES, METHODS, SOLVERS, SimulationConfig
+from .costs import CostSummary, calculate_costs
+from .metrics import calculate_metrics
+from .simulation import (
+    SimulationResult, StartTrajectory, resample_start, simulate, simulate_start,
+)
+
+__version__ = '4.0.0'
+
+__all__ = [
+    'CostSummary',
+    'DEFAULT_CONFIG',
+    'LOAD_TYPES',
+    'METHODS',
+    'SOLVERS',
+    'SimulationConfig',
+    'SimulationResult',
+    'StartTrajectory',
+    'calculate_costs',
+    'calculate_metrics',
+    'resample_start',
+    'simulate',
+    'simulate_start',
+]
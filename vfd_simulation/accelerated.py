@@ -0,0 +1,396 @@
+# =============================================================================
+# VFD-Motor-Simulation: Numba-Accelerated Backend
+# =============================================================================
+# solver='numba' integrates a start with a fixed-step RK4 and evaluates the
+# metrics in one pass, all JIT-compiled by Numba. The kernels work on plain
+# floats: everything fixed for a start is packed into a parameter vector
+# (start_parameters) and the load type and method become integer codes.
+#
+# Numba is optional. Without it simulate_start falls back to the default
+# odeint + NumPy path; HAVE_NUMBA tells which one runs. The first call in a
+# process compiles the kernels (cached on disk by Numba afterwards).
+#
+# RK4 steps are RK4_MAX_STEP long (shorter in the VFD's stiff sub-1 Hz
+# phase) whatever the number of output points; outputs are interpolated.
+# With the default configuration the speed is within ~1e-4 rad/s of a
+# tight-tolerance reference for the constant-torque and fan/pump loads
+# (benchmarks/bench_accelerated.py); lighter, faster-ramped drives can see
+# ~1e-3 rad/s, so lower RK4_MAX_STEP for those.
+#
+# The kernels always evaluate the torque-slip and load curves exactly:
+# compiled, the rational expression is cheaper than a table lookup, so
+# config.lookup_tolerance is ignored here.
+#
+# For Monte Carlo and sweep studies, accelerated_batch runs many starts in
+# one kernel call, two at a time, with the same results as accelerated_start.
+#
+# Usage:
+#   time, omega_rad, metrics = accelerated_start('vfd', config)
+#   time, omega_rad, metrics = accelerated_batch('vfd', configs)   (n x ...)
+# =============================================================================
+
+import numpy as np
+
+from .config import DEFAULT_CONFIG
+from .models import TORQUE_A, TORQUE_B, TORQUE_C
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+HAVE_NUMBA = njit is not None
+
+# RK4 step (s), independent of the output grid
+RK4_MAX_STEP = 0.05
+
+# RK4 is stable for step x |d(d_omega_dt)/d(omega_rad)| up to ~2.8
+RK4_STABILITY = 2.0
+
+# Relative gap left around a model switch (see _integrate_rk4)
+SWITCH_GAP = 1e-12
+
+METHOD_CODES = {'vfd': 0, 'soft_starter': 1}
+LOAD_CODES = {'constant_torque': 0, 'fan_pump': 1, 'constant_power': 2}  # others: 0
+
+# Parameter vector layout
+(P_METHOD, P_LOAD, P_BASE_LOAD, P_RAMP, P_BASE_FREQ, P_POLES, P_RATED_TORQUE,
+ P_V_BOOST, P_SYNC_SPEED, P_DAMPING, P_INERTIA, P_VOLTAGE, P_INITIAL_VOLTAGE,
+ P_FLA, P_POWER_FACTOR,
+ # Reciprocals and products used by _rhs
+ P_INV_RAMP, P_SYNC_PER_HZ, P_INV_SYNC_SPEED, P_INV_INERTIA, P_INV_BOOST_FREQ,
+ P_LOW_FREQ_GAIN) = range(21)
+N_PARAMETERS = 21
+
+# Rows of the metrics array, in calculate_metrics' return order
+METRICS = ('current', 'torque', 'slip', 'load_torque', 'power_in', 'power_out',
+           'efficiency', 'voltage')
+
+
+def _jit(func):
+    return njit(cache=True)(func) if HAVE_NUMBA else func
+
+def _inline(func):
+    # Helpers of the kernels, inlined into each caller
+    return njit(inline='always')(func) if HAVE_NUMBA else func
+
+
+def start_parameters(method, config=DEFAULT_CONFIG, base_load_torque=None, ramp_time=None):
+    if base_load_torque is None:
+        base_load_torque = config.load_torque
+    if ramp_time is None:
+        ramp_time = config.vfd_ramp_time if method == 'vfd' else config.soft_start_ramp_time
+
+    params = np.empty(N_PARAMETERS)
+    params[P_METHOD] = METHOD_CODES[method]
+    params[P_LOAD] = LOAD_CODES.get(config.load_type, 0)
+    params[P_BASE_LOAD] = base_load_torque
+    params[P_RAMP] = ramp_time
+    params[P_BASE_FREQ] = config.base_freq
+    params[P_POLES] = config.poles
+    params[P_RATED_TORQUE] = config.rated_torque
+    params[P_V_BOOST] = config.v_boost
+    params[P_SYNC_SPEED] = config.sync_speed_rad
+    params[P_DAMPING] = config.damping
+    params[P_INERTIA] = config.inertia
+    params[P_VOLTAGE] = config.voltage
+    params[P_INITIAL_VOLTAGE] = config.soft_start_initial_voltage
+    params[P_FLA] = config.fla
+    params[P_POWER_FACTOR] = config.power_factor
+
+    params[P_INV_RAMP] = 1 / ramp_time
+    params[P_SYNC_PER_HZ] = (120 / config.poles) * (2 * np.pi / 60)  # rad/s per Hz
+    params[P_INV_SYNC_SPEED] = 1 / config.sync_speed_rad
+    params[P_INV_INERTIA] = 1 / config.inertia
+    params[P_INV_BOOST_FREQ] = 1 / (config.base_freq * 0.15)
+    params[P_LOW_FREQ_GAIN] = config.rated_torque * 2.5 * (1 + config.v_boost * 5)
+    return params
+
+# =============================================================================
+# KERNELS
+# =============================================================================
+# _point_metrics repeats calculate_metrics operation for operation (identical
+# results). _rhs is the model of make_vfd_dynamics/make_soft_start_dynamics
+# rearranged to two divisions per call, since RK4's stages are sequential and
+# each division adds its latency to every step.
+#
+# The kernels take the parameter vector as a tuple (tuple(params)) and inline
+# their helpers: an array argument costs an atomic reference count increment
+# and decrement at every helper call, several times the arithmetic of _rhs.
+
+@_inline
+def _parameter_tuple(row):
+    # tuple(row) for one N_PARAMETERS row of a batch, spelled out so Numba
+    # knows its length
+    return (row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
+            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
+            row[19], row[20])
+
+@_inline
+def _clip_unit(x):
+    return 0.0 if x < 0 else 1.0 if x > 1.0 else x
+
+@_inline
+def _load_torque(speed_ratio, params):
+    base = params[P_BASE_LOAD]
+    speed_ratio = _clip_unit(speed_ratio)
+    load_code = params[P_LOAD]
+    if load_code == 1:  # fan_pump
+        return base * speed_ratio**2
+    if load_code == 2:  # constant_power
+        if speed_ratio < 0.1:
+            return base * 0.1 / 0.1
+        return base * 1.0 / speed_ratio
+    return base * (0.3 + 0.7 * speed_ratio)
+
+@_inline
+def _torque_ratio(slip):
+    return (TORQUE_A * slip) / (slip**2 + TORQUE_B * slip + TORQUE_C)
+
+@_inline
+def _vfd_freq(t, params):
+    ramp_time = params[P_RAMP]
+    return params[P_BASE_FREQ] * (t / ramp_time) if t <= ramp_time else params[P_BASE_FREQ]
+
+@_inline
+def _soft_start_voltage_ratio(t, params):
+    if t <= params[P_RAMP]:
+        initial = params[P_INITIAL_VOLTAGE]
+        return initial + (1 - initial) * (t * params[P_INV_RAMP])
+    return 1.0
+
+@_inline
+def _rhs(omega_rad, t, params):
+    if params[P_METHOD] == 0:  # vfd
+        freq_ratio = t * params[P_INV_RAMP] if t <= params[P_RAMP] else 1.0
+        freq = params[P_BASE_FREQ] * freq_ratio
+        sync_speed_rad = freq * params[P_SYNC_PER_HZ]
+        if freq < 1.0:
+            if sync_speed_rad < 0.1:
+                return 0.0
+            slip = _clip_unit(1.0 - omega_rad / sync_speed_rad)
+            torque_em = params[P_LOW_FREQ_GAIN] * slip
+        else:
+            slip = _clip_unit(1.0 - omega_rad / sync_speed_rad)
+            torque_em = params[P_RATED_TORQUE] * _torque_ratio(slip) * freq_ratio
+            boost_position = freq * params[P_INV_BOOST_FREQ]
+            if boost_position < 1.0:
+                torque_em *= 1 + params[P_V_BOOST] * (1 - boost_position)
+    else:  # soft starter
+        voltage_ratio = _soft_start_voltage_ratio(t, params)
+        slip = _clip_unit(1.0 - omega_rad * params[P_INV_SYNC_SPEED])
+        torque_em = params[P_RATED_TORQUE] * _torque_ratio(slip) * (voltage_ratio * voltage_ratio)
+
+    effective_load = _load_torque(omega_rad * params[P_INV_SYNC_SPEED], params)
+    return (torque_em - effective_load - params[P_DAMPING] * omega_rad) * params[P_INV_INERTIA]
+
+@_inline
+def _rk4_step(omega_rad, t, dt, k1, params):
+    # k1 is the slope at (t, omega_rad), carried over from the previous step
+    k2 = _rhs(omega_rad + 0.5 * dt * k1, t + 0.5 * dt, params)
+    k3 = _rhs(omega_rad + 0.5 * dt * k2, t + 0.5 * dt, params)
+    k4 = _rhs(omega_rad + dt * k3, t + dt, params)
+    return omega_rad + dt / 6 * (k1 + 2 * k2 + 2 * k3 + k4)
+
+@_inline
+def _step_limit(t, max_step, params):
+    if params[P_METHOD] != 0 or t >= params[P_RAMP] / params[P_BASE_FREQ]:
+        return max_step
+    # Below 1 Hz the VFD model drives the slip with a gain proportional to
+    # 1/sync speed, which makes the first fraction of a second stiff; keep
+    # the step inside RK4's stability limit there
+    sync_speed_rad = max(_vfd_freq(t, params) * params[P_SYNC_PER_HZ], 0.1)
+    gain = params[P_LOW_FREQ_GAIN] / (sync_speed_rad * params[P_INERTIA])
+    return min(max_step, RK4_STABILITY / gain)
+
+@_inline
+def _hermite(t, t0, t1, y0, y1, slope0, slope1):
+    # Cubic Hermite interpolation inside one step
+    h = t1 - t0
+    s = (t - t0) / h
+    s2 = s * s
+    s3 = s2 * s
+    return ((2 * s3 - 3 * s2 + 1) * y0 + (s3 - 2 * s2 + s) * h * slope0
+            + (3 * s2 - 2 * s3) * y1 + (s3 - s2) * h * slope1)
+
+@_inline
+def _switch_times(params):
+    # The VFD model switches on when its sync speed reaches 0.1 rad/s and its
+    # torque jumps where the drive passes 1 Hz; the soft starter has neither
+    if params[P_METHOD] != 0:
+        return -1.0, -1.0
+    hz_per_second = params[P_BASE_FREQ] / params[P_RAMP]
+    return 0.1 / params[P_SYNC_PER_HZ] / hz_per_second, 1.0 / hz_per_second
+
+@_inline
+def _advance(t, omega_rad, slope, t_end, max_step, switches, params):
+    # One RK4 step from t, where the slope is known. Returns (t_next,
+    # omega_next, slope_next, t_restart, slope_restart): the step's end and
+    # its slope for interpolation, and where the next step starts. A step
+    # never crosses a switch: it stops a relative SWITCH_GAP short of it and
+    # the next one starts just past it, keeping every RK4 stage on one side.
+    t_next = min(t + _step_limit(t, max_step, params), t_end)
+    t_restart = t_next
+    for t_switch in switches:
+        if t < t_switch < t_next:
+            t_next = t_switch * (1 - SWITCH_GAP)
+            t_restart = t_switch * (1 + SWITCH_GAP)
+            break
+
+    omega_next = _rk4_step(omega_rad, t, t_next - t, slope, params)
+    slope_next = _rhs(omega_next, t_next, params)
+    if t_restart == t_next:
+        slope_restart = slope_next
+    else:
+        slope_restart = _rhs(omega_next, t_restart, params)
+    return t_next, omega_next, slope_next, t_restart, slope_restart
+
+@_inline
+def _rk4_lane(lane, time, params, max_step, omega_out):
+    # One step of a start: lane is (t, omega_rad, slope at t, next output
+    # index), starting from (0, 0, _rhs(0, 0, params), 0). Fills the outputs
+    # the step covers and returns the new lane; a finished lane (index ==
+    # time.size) is returned unchanged.
+    t, omega_rad, slope, i = lane
+    if i >= time.size:
+        return lane
+    t_end = time[-1]
+    t_next, omega_next, slope_next, t_restart, slope_restart = \
+        _advance(t, omega_rad, slope, t_end, max_step, _switch_times(params), params)
+    while i < time.size and (time[i] <= t_next or t_next >= t_end):
+        omega_out[i] = _hermite(time[i], t, t_next, omega_rad, omega_next, slope, slope_next)
+        i += 1
+    return t_restart, omega_next, slope_restart, i
+
+@_jit
+def _integrate_rk4(time, params, max_step, omega_out):
+    # Fills omega_out[i] with the speed at time[i], starting from rest.
+    # Steps are independent of the output grid; outputs are interpolated
+    # from the step ends and their slopes.
+    lane = (0.0, 0.0, _rhs(0.0, 0.0, params), 0)
+    while lane[3] < time.size:
+        lane = _rk4_lane(lane, time, params, max_step, omega_out)
+
+@_jit
+def _integrate_rk4_pair(time_a, params_a, omega_a, time_b, params_b, omega_b, max_step):
+    # _integrate_rk4 for two starts, stepped alternately. Each RK4 step is a
+    # chain of dependent divisions; with two independent chains in flight
+    # the CPU overlaps them, ~1.3x the throughput of one start at a time.
+    # Each start keeps its own steps, so the results are unchanged.
+    lane_a = (0.0, 0.0, _rhs(0.0, 0.0, params_a), 0)
+    lane_b = (0.0, 0.0, _rhs(0.0, 0.0, params_b), 0)
+    while lane_a[3] < time_a.size or lane_b[3] < time_b.size:
+        lane_a = _rk4_lane(lane_a, time_a, params_a, max_step, omega_a)
+        lane_b = _rk4_lane(lane_b, time_b, params_b, max_step, omega_b)
+
+@_inline
+def _point_metrics(t, omega_rad, params):
+    # calculate_metrics at one sample, in METRICS order
+    is_vfd = params[P_METHOD] == 0
+    base_freq = params[P_BASE_FREQ]
+    rated_torque = params[P_RATED_TORQUE]
+    voltage = params[P_VOLTAGE]
+    fla = params[P_FLA]
+    if is_vfd:
+        freq = _vfd_freq(t, params)
+        if freq < 0.5:
+            # Drive not yet producing output
+            return 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0
+        sync_speed_rad = (120 * freq / params[P_POLES]) * (2 * np.pi / 60)
+        voltage_i = voltage * (freq / base_freq)
+        if freq < base_freq * 0.1:
+            voltage_i = voltage_i + voltage * params[P_V_BOOST] * (1 - freq / (base_freq * 0.1))
+    else:
+        freq = base_freq
+        sync_speed_rad = params[P_SYNC_SPEED]
+        if t <= params[P_RAMP]:
+            initial = params[P_INITIAL_VOLTAGE]
+            voltage_i = voltage * (initial + (1 - initial) * (t / params[P_RAMP]))
+        else:
+            voltage_i = voltage
+
+    s = (sync_speed_rad - omega_rad) / sync_speed_rad if sync_speed_rad > 0 else 1.0
+    s = _clip_unit(s)
+    torque_ratio = _torque_ratio(s)
+    if is_vfd:
+        torque = rated_torque * torque_ratio * (freq / base_freq)
+        if freq < base_freq * 0.15:
+            torque *= 1 + params[P_V_BOOST] * (1 - freq / (base_freq * 0.15))
+    else:
+        voltage_ratio = voltage_i / voltage
+        torque = rated_torque * torque_ratio * (voltage_ratio ** 2)
+
+    load = _load_torque(omega_rad / params[P_SYNC_SPEED], params)
+    current = np.sqrt((fla * (torque / rated_torque))**2 + (fla * 0.3)**2)
+    if not is_vfd:
+        voltage_ratio = voltage_i / voltage
+        if t < params[P_RAMP] and voltage_ratio > 0.3:
+            current = current * (1.2 / voltage_ratio)
+
+    power_out = (omega_rad * load) / 1000
+    power_in = (np.sqrt(3) * voltage_i * current * params[P_POWER_FACTOR]) / 1000
+    efficiency = power_out / power_in * 100 if power_in > 0 else 0.0
+    return current, torque, s * 100, load, power_in, power_out, efficiency, voltage_i
+
+@_jit
+def _metrics(time, omega, params, out):
+    # Fills out (len(METRICS) x samples) like calculate_metrics
+    for i in range(time.size):
+        current, torque, slip, load, power_in, power_out, efficiency, voltage = \
+            _point_metrics(time[i], omega[i], params)
+        out[0, i] = current
+        out[1, i] = torque
+        out[2, i] = slip
+        out[3, i] = load
+        out[4, i] = power_in
+        out[5, i] = power_out
+        out[6, i] = efficiency
+        out[7, i] = voltage
+
+@_jit
+def _start_batch(time, params, max_step, omega_out, metrics_out):
+    # _integrate_rk4 and _metrics for each row of params (scenario x
+    # N_PARAMETERS), integrating the starts in pairs
+    n = params.shape[0]
+    for row in range(0, n - 1, 2):
+        _integrate_rk4_pair(time[row], _parameter_tuple(params[row]), omega_out[row],
+                            time[row + 1], _parameter_tuple(params[row + 1]),
+                            omega_out[row + 1], max_step)
+    if n % 2:
+        _integrate_rk4(time[n - 1], _parameter_tuple(params[n - 1]), max_step, omega_out[n - 1])
+    for row in range(n):
+        _metrics(time[row], omega_out[row], _parameter_tuple(params[row]), metrics_out[row])
+
+# =============================================================================
+# START SIMULATION
+# =============================================================================
+
+def accelerated_start(method, config=DEFAULT_CONFIG, max_step=RK4_MAX_STEP):
+    # Returns (time, omega_rad, metrics) with metrics a (len(METRICS),
+    # time_points) array. Runs the kernels as plain Python when Numba is
+    # missing, which is slow; simulate_start uses odeint instead in that case.
+    params = tuple(start_parameters(method, config))
+    time = np.linspace(0, params[P_RAMP], config.time_points)
+    omega_rad = np.empty(config.time_points)
+    metrics = np.empty((len(METRICS), config.time_points))
+    _integrate_rk4(time, params, max_step, omega_rad)
+    _metrics(time, omega_rad, params, metrics)
+    return time, omega_rad, metrics
+
+
+def accelerated_batch(method, configs, max_step=RK4_MAX_STEP):
+    # accelerated_start for many configurations in one kernel call, for
+    # Monte Carlo and sweep studies: returns (time, omega_rad, metrics) as
+    # (n, time_points) and (n, len(METRICS), time_points) arrays, row j
+    # identical to accelerated_start(method, configs[j]). The configurations
+    # must share time_points.
+    time_points = {config.time_points for config in configs}
+    if len(time_points) != 1:
+        raise ValueError(f'configs must share time_points, not {sorted(time_points)}')
+    samples = time_points.pop()
+    params = np.array([start_parameters(method, config) for config in configs])
+    time = np.linspace(0, params[:, P_RAMP], samples, axis=1)
+    omega_rad = np.empty((len(configs), samples))
+    metrics = np.empty((len(configs), len(METRICS), samples))
+    _start_batch(time, params, max_step, omega_rad, metrics)
+    return time, omega_rad, metrics
@@ -0,0 +1,168 @@
+# =============================================================================
+# VFD-Motor-Simulation: Augmented-State Start Integration
+# =============================================================================
+# Integrates the start totals as extra ODE states next to the rotor speed:
+#   S_ENERGY_IN    input energy, kJ       d/dt = power_in
+#   S_I2T          I^2t, A^2 s            d/dt = current^2 (rotor heating)
+#   S_ENERGY_OUT   mechanical energy, kJ  d/dt = omega x load torque / 1000
+# with current and power from start_power (calculate_metrics' model), so the
+# totals are exact to the solver tolerance instead of depending on the
+# trapezoidal rule over TIME_POINTS samples. Current and power step where
+# the drive output switches model, so the start is integrated piecewise
+# between those breakpoints, restarting odeint at each one and never
+# stepping past it (tcrit).
+#
+# A segment odeint cannot integrate (e.g. a stall on the constant-power load)
+# raises RuntimeError instead of returning partial totals.
+#
+# With trajectory=False only the state at the breakpoints is kept: nothing
+# is stored per sample, and memory does not grow with the start length or
+# TIME_POINTS. Lookup tables (config.lookup_tolerance) speed up the speed
+# equation only; the integrated power uses the exact curves.
+#
+# Usage:
+#   totals = start_totals('vfd', config)
+#   totals.energy_in_kj, totals.i2t, totals.loss_kj
+#   simulate(config.replace(energy_states=True)).vfd.totals   (trajectory too)
+# =============================================================================
+
+import warnings
+from dataclasses import dataclass
+
+import numpy as np
+from scipy.integrate import ODEintWarning, odeint
+
+from .config import DEFAULT_CONFIG
+from .instrumentation import enabled, record_odeint
+from .metrics import start_power
+from .solvers import start_jacobian, start_ramp_time, start_rhs
+
+# State layout
+S_OMEGA, S_ENERGY_IN, S_I2T, S_ENERGY_OUT = range(4)
+N_STATES = 4
+
+# VFD output frequencies (fraction of base) where the current or power
+# model switches branch: 0.5 Hz and 1 Hz are absolute, see below
+VFD_BREAK_FRACTIONS = (0.1, 0.15, 1.0)
+
+# odeint step limit per output interval; with trajectory=False one interval
+# spans a whole segment between breakpoints
+MAX_STEPS = 100_000
+
+# =============================================================================
+# TOTALS
+# =============================================================================
+
+@dataclass(frozen=True)
+class StartTotals:
+    duration: float  # s
+    final_omega_rad: float  # rad/s
+    energy_in_kj: float  # kJ
+    i2t: float  # A^2 s
+    mechanical_energy_kj: float  # kJ delivered to the load
+    kinetic_energy_kj: float  # kJ stored in the rotating mass at the end
+
+    @property
+    def loss_kj(self):
+        # Input energy neither delivered to the load nor stored as kinetic
+        # energy: motor, starter and damping losses
+        return self.energy_in_kj - self.mechanical_energy_kj - self.kinetic_energy_kj
+
+    @classmethod
+    def from_state(cls, t, state, config=DEFAULT_CONFIG):
+        omega_rad = float(state[S_OMEGA])
+        return cls(float(t), omega_rad, float(state[S_ENERGY_IN]), float(state[S_I2T]),
+                   float(state[S_ENERGY_OUT]), 0.5 * config.inertia * omega_rad**2 / 1000)
+
+# =============================================================================
+# AUGMENTED DYNAMICS
+# =============================================================================
+
+def make_augmented_dynamics(method, config=DEFAULT_CONFIG):
+    # Returns (rhs, jacobian) over the N_STATES state vector
+    ramp_time = start_ramp_time(method, config)
+    rhs = start_rhs(method, config)
+    jac = start_jacobian(method)
+    args = (config.load_torque, config.load_type, ramp_time, config)
+
+    def augmented_rhs(state, t):
+        omega_rad = state[S_OMEGA]
+        current, power_in, power_out = start_power(method, t, omega_rad, ramp_time, config)
+        return [rhs(state, t), power_in, current * current, power_out]
+
+    # The totals do not feed back into the speed, so only the speed row is
+    # needed for the Newton iteration; their d/d(omega) entries are left at
+    # zero, which only makes the iteration a chord method for them
+    jacobian = np.zeros((N_STATES, N_STATES))
+
+    def augmented_jacobian(state, t):
+        jacobian[S_OMEGA, S_OMEGA] = jac(state, t, *args)[0][0]
+        return jacobian
+
+    return augmented_rhs, augmented_jacobian
+
+
+def start_breakpoints(method, config=DEFAULT_CONFIG):
+    # Times where current or power change formula discontinuously, ending
+    # with the ramp time
+    ramp_time = start_ramp_time(method, config)
+    if method == 'vfd':
+        freqs = [0.5, 1.0] + [config.base_freq * fraction for fraction in VFD_BREAK_FRACTIONS]
+        times = [ramp_time * freq / config.base_freq for freq in freqs]
+    else:
+        times = [ramp_time]
+        initial = config.soft_start_initial_voltage
+        if initial < 0.3:  # the reduced-voltage current correction starts at 30%
+            times.append(ramp_time * (0.3 - initial) / (1 - initial))
+    return np.unique([t for t in times if 0 < t <= ramp_time])
+
+# =============================================================================
+# SOLVE
+# =============================================================================
+
+def solve_augmented(method, config=DEFAULT_CONFIG, trajectory=True):
+    # Returns (time, states): states is (len(time), N_STATES). time is
+    # linspace(0, ramp_time, time_points) with trajectory=True, else 0 and
+    # the breakpoints only.
+    breakpoints = start_breakpoints(method, config)
+    edges = np.concatenate(([0.0], breakpoints))
+    time = np.linspace(0, edges[-1], config.time_points) if trajectory else edges
+    rhs, jacobian = make_augmented_dynamics(method, config)
+
+    states = np.empty((len(time), N_STATES))
+    state = states[0] = np.zeros(N_STATES)
+    infos = []
+    for start, end in zip(edges[:-1], edges[1:]):
+        inside = np.flatnonzero((time > start) & (time <= end))
+        segment = np.concatenate(([start], time[inside]))
+        if segment[-1] < end:
+            segment = np.append(segment, end)
+        # A failed segment would leave the totals short of the whole start,
+        # so it is an error rather than odeint's warning
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', ODEintWarning)
+            solution, info = odeint(rhs, state, segment, Dfun=jacobian, tcrit=[end],
+                                    mxstep=MAX_STEPS, full_output=True)
+        if info['message'] != 'Integration successful.':
+            raise RuntimeError(f'odeint failed for the {method} start between {start:g} s '
+                               f'and {end:g} s: {info["message"]}')
+        infos.append(info)
+        states[inside] = solution[1:len(inside) + 1]
+        state = solution[-1]
+
+    if enabled():
+        # One record for the whole start
+        record_odeint(method, time, {
+            'nst': [sum(info['nst'][-1] for info in infos)],
+            'nfe': [sum(info['nfe'][-1] for info in infos)],
+            'nje': [sum(info['nje'][-1] for info in infos)],
+            'hu': np.concatenate([info['hu'] for info in infos]),
+            'mused': np.concatenate([info['mused'] for info in infos]),
+        })
+    return time, states
+
+
+def start_totals(method, config=DEFAULT_CONFIG):
+    # Totals of one start without storing its trajectory
+    time, states = solve_augmented(method, config, trajectory=False)
+    return StartTotals.from_state(time[-1], states[-1], config)
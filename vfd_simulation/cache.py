@@ -0,0 +1,311 @@
+# =============================================================================
+# VFD-Motor-Simulation: On-Disk Result Cache
+# =============================================================================
+# Content-addressed cache of v4 results. The key is a SHA-256 of every
+# configuration field that affects the trajectories (motor, load, ramps,
+# TIME_POINTS, solver and its event settings), the solver backend constants,
+# the model version and a hash of the model source (MODEL_MODULES), so any
+# change to the numerics misses instead of serving results computed by an
+# older model. The cost-model fields are left out of the key:
+# costs are recomputed from the cached trajectories on every hit, so
+# changing a tariff still hits.
+#
+# Each entry is one uncompressed .npz holding both trajectories in float64,
+# bit-identical to a fresh run. Total size is bounded by LRU eviction: a hit
+# refreshes the entry's modification time and the oldest entries go first.
+# Hit/miss/eviction counts are kept in memory and added to the totals in
+# stats.json next to the entries on every write, on close() (or leaving a
+# with block), and when the cache is garbage-collected or the process exits.
+# A truncated or corrupt entry is a miss and is deleted.
+# solve_ivp results come back without their dense output (dense=None).
+#
+# Usage:
+#   with ResultCache() as cache:                 (~/.cache/vfd_simulation)
+#       result = cache.simulate(config)
+#   python -m vfd_simulation.cache            (statistics report)
+#   python -m vfd_simulation.cache --clear
+# =============================================================================
+
+import argparse
+import hashlib
+import json
+import os
+import tempfile
+import weakref
+import zipfile
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+from . import __version__
+from .augmented import StartTotals
+from .costs import calculate_costs
+from .simulation import SimulationResult, StartTrajectory, simulate
+
+DEFAULT_CACHE_DIR = Path.home() / '.cache' / 'vfd_simulation'
+DEFAULT_MAX_BYTES = 500 * 1024**2
+
+# Bump when the entry layout changes
+CACHE_FORMAT = 1
+
+# Modules whose code computes the cached trajectories
+MODEL_MODULES = ('config', 'models', 'metrics', 'solvers', 'accelerated', 'augmented',
+                 'simulation')
+
+# SimulationConfig fields that only feed the cost model
+COST_FIELDS = ('vfd_installed_cost', 'ss_installed_cost', 'annual_hours',
+               'energy_cost_per_kwh', 'vfd_continuous_loss_pct', 'starts_per_year', 'tariff')
+
+# Entry array prefix -> SimulationResult attribute
+TRAJECTORIES = {
+    'vfd': 'vfd',
+    'ss': 'soft_starter',
+}
+
+TRAJECTORY_ARRAYS = ('time', 'omega_rad', 'current', 'torque', 'slip', 'load_torque',
+                     'power_in', 'power_out', 'efficiency', 'voltage', 'frequency')
+
+STATS_FILE = 'stats.json'
+COUNTERS = ('hits', 'misses', 'evictions')
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+    size_bytes: int = 0
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+# =============================================================================
+# KEYS
+# =============================================================================
+
+def solver_settings(config):
+    # Backend constants that change the result for config.solver
+    from . import solvers
+    settings = {'ivp_method': solvers.IVP_METHOD, 'ivp_rtol': solvers.IVP_RTOL,
+                'ivp_atol': solvers.IVP_ATOL, 'horizon_factor': solvers.HORIZON_FACTOR,
+                'stall_min_speed': solvers.STALL_MIN_SPEED}
+    if config.solver == 'numba':
+        from . import accelerated
+        # Without Numba the 'numba' solver runs odeint, a different result
+        settings.update(have_numba=accelerated.HAVE_NUMBA,
+                        rk4_max_step=accelerated.RK4_MAX_STEP)
+    return settings
+
+@lru_cache(maxsize=None)
+def model_source_hash():
+    # SHA-256 of the MODEL_MODULES sources, line endings normalized so a
+    # CRLF and an LF checkout share entries
+    digest = hashlib.sha256()
+    for name in MODEL_MODULES:
+        source = Path(__file__).with_name(f'{name}.py').read_bytes()
+        digest.update(source.replace(b'\r\n', b'\n'))
+    return digest.hexdigest()
+
+def config_key(config):
+    fields = {name: value for name, value in asdict(config).items() if name not in COST_FIELDS}
+    payload = {'model_version': __version__, 'model_source': model_source_hash(),
+               'cache_format': CACHE_FORMAT, 'config': fields,
+               'solver_settings': solver_settings(config)}
+    text = json.dumps(payload, sort_keys=True, default=repr)
+    return hashlib.sha256(text.encode()).hexdigest()
+
+# =============================================================================
+# CACHE
+# =============================================================================
+
+class ResultCache:
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        # Counts not yet added to stats.json. The finalizer holds no
+        # reference to the cache, so closed or dropped caches are collected.
+        self.session = CacheStats()
+        self._unsaved = dict.fromkeys(COUNTERS, 0)
+        self._finalizer = weakref.finalize(self, _save_counts, self.directory, self._unsaved)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.save_stats()
+
+    def _path(self, key):
+        return self.directory / f'{key}.npz'
+
+    def get(self, config):
+        path = self._path(config_key(config))
+        try:
+            with np.load(path) as entry:
+                arrays = {name: entry[name] for name in entry.files}
+            os.utime(path)  # LRU: mark as recently used
+        except FileNotFoundError:
+            self._count('misses')
+            return None
+        except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile):
+            # Truncated or corrupt (e.g. a copy cut short): drop the entry
+            path.unlink(missing_ok=True)
+            self._count('misses')
+            return None
+        self._count('hits')
+        return _result_from_arrays(config, arrays)
+
+    def put(self, result):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(config_key(result.config))
+        # Write to a temporary file and rename, so a reader never sees half
+        # an entry and concurrent writers of the same key are harmless
+        fd, temp_name = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as file:
+                np.savez(file, **_result_arrays(result))
+            os.replace(temp_name, path)
+        except BaseException:
+            Path(temp_name).unlink(missing_ok=True)
+            raise
+        self._evict()
+        self.save_stats()
+
+    def simulate(self, config):
+        result = self.get(config)
+        if result is None:
+            result = simulate(config)
+            self.put(result)
+        return result
+
+    def entries(self):
+        # [(path, stat)] oldest first
+        if not self.directory.is_dir():
+            return []
+        entries = [(path, path.stat()) for path in self.directory.glob('*.npz')]
+        return sorted(entries, key=lambda entry: entry[1].st_mtime)
+
+    def stats(self):
+        # Totals over every process that used this directory
+        totals = _load_totals(self.directory)
+        entries = self.entries()
+        return CacheStats(**{name: totals[name] + self._unsaved[name] for name in COUNTERS},
+                          entries=len(entries),
+                          size_bytes=sum(stat.st_size for _, stat in entries))
+
+    def clear(self):
+        for path, _ in self.entries():
+            path.unlink(missing_ok=True)
+        (self.directory / STATS_FILE).unlink(missing_ok=True)
+        self.session = CacheStats()
+        self._unsaved.update(dict.fromkeys(COUNTERS, 0))
+
+    def save_stats(self):
+        _save_counts(self.directory, self._unsaved)
+
+    def _evict(self):
+        entries = self.entries()
+        size = sum(stat.st_size for _, stat in entries)
+        for path, stat in entries:
+            if size <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            size -= stat.st_size
+            self._count('evictions')
+
+    def _count(self, counter):
+        setattr(self.session, counter, getattr(self.session, counter) + 1)
+        self._unsaved[counter] += 1
+
+def _load_totals(directory):
+    try:
+        totals = json.loads((directory / STATS_FILE).read_text())
+    except (OSError, ValueError):
+        totals = {}
+    return {name: totals.get(name, 0) for name in COUNTERS}
+
+def _save_counts(directory, unsaved):
+    # Adds the unsaved counts to stats.json and zeroes them in place
+    if not any(unsaved.values()):
+        return
+    directory.mkdir(parents=True, exist_ok=True)
+    # Read-modify-write without locking: concurrent processes may lose an
+    # update, which only affects the report
+    totals = _load_totals(directory)
+    for name, count in unsaved.items():
+        totals[name] += count
+    stats_path = directory / STATS_FILE
+    temp_path = stats_path.with_suffix(f'.{os.getpid()}.tmp')
+    temp_path.write_text(json.dumps(totals))
+    os.replace(temp_path, stats_path)
+    unsaved.update(dict.fromkeys(COUNTERS, 0))
+
+# =============================================================================
+# ENTRY LAYOUT
+# =============================================================================
+
+def _result_arrays(result):
+    # One (columns x time_points) array per trajectory: a handful of large
+    # members loads several times faster than one member per column
+    arrays = {}
+    metadata = {'model_version': __version__, 'key': config_key(result.config)}
+    for prefix, attribute in TRAJECTORIES.items():
+        trajectory = getattr(result, attribute)
+        columns = [name for name in TRAJECTORY_ARRAYS if getattr(trajectory, name) is not None]
+        arrays[prefix] = np.array([getattr(trajectory, name) for name in columns], dtype=np.float64)
+        metadata[prefix] = {'columns': columns, 'events': trajectory.events,
+                            'end_reason': trajectory.end_reason,
+                            'totals': trajectory.totals and asdict(trajectory.totals)}
+    arrays['metadata'] = np.array(json.dumps(metadata))
+    return arrays
+
+def _result_from_arrays(config, arrays):
+    metadata = json.loads(arrays['metadata'][()])
+    trajectories = {}
+    for prefix, attribute in TRAJECTORIES.items():
+        entry = metadata[prefix]
+        columns = dict(zip(entry['columns'], arrays[prefix]))
+        totals = entry.get('totals')
+        trajectories[attribute] = StartTrajectory(**columns, events=entry['events'],
+                                                  end_reason=entry['end_reason'],
+                                                  totals=totals and StartTotals(**totals))
+    vfd, soft_starter = trajectories['vfd'], trajectories['soft_starter']
+    costs = calculate_costs(config, vfd, soft_starter)
+    return SimulationResult(config, vfd, soft_starter, costs)
+
+# =============================================================================
+# REPORTING / COMMAND LINE
+# =============================================================================
+
+def print_cache_stats(stats, directory=DEFAULT_CACHE_DIR):
+    print(f"Result cache:  {directory}")
+    print(f"  Entries:     {stats.entries:,} ({stats.size_bytes / 1024**2:.1f} MB)")
+    print(f"  Hits:        {stats.hits:,}")
+    print(f"  Misses:      {stats.misses:,}")
+    print(f"  Hit Rate:    {stats.hit_rate:.1%}")
+    print(f"  Evictions:   {stats.evictions:,}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m vfd_simulation.cache',
+                                     description='Inspect or clear the v4 result cache.')
+    parser.add_argument('--dir', default=DEFAULT_CACHE_DIR, type=Path,
+                        help='cache directory (default: %(default)s)')
+    parser.add_argument('--clear', action='store_true', help='delete every entry and the statistics')
+    args = parser.parse_args(argv)
+
+    with ResultCache(args.dir) as cache:
+        if args.clear:
+            cache.clear()
+            print(f"✓ Cleared {args.dir}")
+        else:
+            print_cache_stats(cache.stats(), args.dir)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,194 @@
+# =============================================================================
+# VFD-Motor-Simulation: Command Line Interface
+# =============================================================================
+# Quick Start:
+#   python -m vfd_simulation                      (v4: VFD vs Soft Starter)
+#   python -m vfd_simulation --model v3 --no-csv  (v3: VFD vs DOL)
+#   python -m vfd_simulation --load-type fan_pump --csv results.csv
+#   python -m vfd_simulation --headless           (numbers only, no matplotlib)
+#   python -m vfd_simulation --export run.npz     (columnar binary export)
+#   python -m vfd_simulation --cache              (reuse results across runs)
+#   python -m vfd_simulation --tariff tou.json    (time-of-use and demand charges)
+#   python -m vfd_simulation --instrument runs.jsonl  (phase timings, solver stats)
+#   python -m vfd_simulation --profile            (time and memory hotspots)
+# =============================================================================
+
+import argparse
+from contextlib import nullcontext
+from datetime import datetime
+
+from . import report
+from .config import DEFAULT_CONFIG, LOAD_TYPES, SOLVERS
+from .instrumentation import instrument, phase, write_record
+from .legacy import simulate_v2, simulate_v3
+from .simulation import simulate
+
+MODELS = ('v2', 'v3', 'v4')
+
+CSV_PREFIXES = {
+    'v3': 'vfd_simulation',
+    'v4': 'vfd_vs_softstarter',
+}
+
+
+def default_csv_filename(model='v4'):
+    return f'{CSV_PREFIXES[model]}_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv'
+
+
+def build_parser(model='v4'):
+    parser = argparse.ArgumentParser(
+        prog='vfd_simulation',
+        description='Simulate an induction motor start and compare starting methods.')
+    parser.add_argument('--model', choices=MODELS, default=model,
+                        help='v4: VFD vs soft starter, v3: VFD vs DOL, v2: VFD only '
+                             '(default: %(default)s)')
+    parser.add_argument('--load-type', choices=LOAD_TYPES,
+                        help='override the configured load type')
+    parser.add_argument('--solver', choices=SOLVERS,
+                        help='v4 only: ODE backend; solve_ivp ends each start at its first '
+                             'event (reached speed, stall, over-current); numba runs a '
+                             'JIT-compiled RK4 (odeint if Numba is not installed)')
+    parser.add_argument('--energy-states', action='store_true',
+                        help='v4 only (odeint): integrate energy, I²t and mechanical energy '
+                             'as ODE states instead of summing the sampled power')
+    parser.add_argument('--csv', metavar='FILENAME', dest='csv_filename',
+                        help='CSV export filename (default: timestamped)')
+    parser.add_argument('--no-csv', action='store_false', dest='export_csv',
+                        help='skip the CSV export')
+    parser.add_argument('--export', metavar='FILENAME', dest='columnar_filename',
+                        help='v4 only: columnar export, format from the extension '
+                             '(.npz, or .parquet/.arrow with pyarrow)')
+    parser.add_argument('--export-float32', action='store_true',
+                        help='v4 only: write the --export columns as float32 (half the size, '
+                             '~7 significant digits) instead of float64')
+    parser.add_argument('--cache', nargs='?', const='', metavar='DIR', dest='cache_dir',
+                        help='v4 only: reuse results from the on-disk cache for an '
+                             'identical configuration (default DIR: ~/.cache/vfd_simulation)')
+    parser.add_argument('--tariff', metavar='FILENAME',
+                        help="v4 only: bill costs with this tariff JSON file ('example' for "
+                             'the built-in time-of-use tariff) instead of a flat rate')
+    parser.add_argument('--instrument', metavar='FILENAME',
+                        help="append per-phase wall times, solver statistics and bytes written "
+                             "for this run to FILENAME as one JSON line ('-' for stderr)")
+    parser.add_argument('--profile', nargs='?', const='', metavar='FILENAME',
+                        help='run under cProfile, then again under tracemalloc, and print '
+                             'ranked time and memory hotspots; FILENAME also saves the pstats '
+                             'data. The figure is built but not shown')
+    parser.add_argument('--headless', action='store_false', dest='show_plots',
+                        help='print the summary only; matplotlib is never imported')
+    return parser
+
+
+def main(argv=None, config=None, model='v4', export_csv=True, csv_filename=None,
+         show_plots=True, columnar_filename=None):
+    parser = build_parser(model)
+    args = parser.parse_args(argv)
+    config = config or DEFAULT_CONFIG
+    if args.load_type:
+        config = config.replace(load_type=args.load_type)
+    if args.solver:
+        config = config.replace(solver=args.solver)
+    export_csv = export_csv and args.export_csv
+    csv_filename = args.csv_filename or csv_filename
+    show_plots = show_plots and args.show_plots
+    columnar_filename = args.columnar_filename or columnar_filename
+    if columnar_filename and args.model != 'v4':
+        parser.error('--export is only available for the v4 model')
+    if args.export_float32 and not columnar_filename:
+        parser.error('--export-float32 needs --export')
+    if args.cache_dir is not None and args.model != 'v4':
+        parser.error('--cache is only available for the v4 model')
+    if args.energy_states and args.model != 'v4':
+        parser.error('--energy-states is only available for the v4 model')
+    if args.energy_states and config.solver != 'odeint':
+        parser.error('--energy-states needs the odeint solver')
+    if args.energy_states:
+        config = config.replace(energy_states=True)
+    if args.tariff and args.model != 'v4':
+        parser.error('--tariff is only available for the v4 model')
+    if args.tariff:
+        from .tariff import EXAMPLE_TOU_TARIFF, read_tariff
+        tariff = EXAMPLE_TOU_TARIFF if args.tariff == 'example' else read_tariff(args.tariff)
+        config = config.replace(tariff=tariff)
+
+    # pyplot and the dashboard figure cost more than the solve itself, so
+    # matplotlib is only imported when a figure is actually requested
+    if show_plots:
+        import matplotlib.pyplot as plt
+        from . import plotting
+
+    if export_csv and args.model in CSV_PREFIXES:
+        csv_filename = csv_filename or default_csv_filename(args.model)
+
+    def run():
+        if args.model == 'v4':
+            if args.cache_dir is not None:
+                from .cache import DEFAULT_CACHE_DIR, ResultCache
+                cache = ResultCache(args.cache_dir or DEFAULT_CACHE_DIR)
+                result = cache.simulate(config)
+            else:
+                result = simulate(config)
+            if export_csv:
+                with phase('csv'):
+                    report.write_comparison_csv(result, csv_filename)
+            if columnar_filename:
+                from .export import write_columns
+                with phase('export'):
+                    write_columns(result, columnar_filename,
+                                  dtype='float32' if args.export_float32 else 'float64')
+            if show_plots:
+                with phase('figure'):
+                    plotting.plot_comparison(result)
+            with phase('report'):
+                report.print_comparison_summary(result)
+            if export_csv:
+                print(f"✓ Simulation data exported to: {csv_filename}\n")
+            if columnar_filename:
+                print(f"✓ Columnar data exported to: {columnar_filename}\n")
+            if args.cache_dir is not None:
+                print(f"✓ Result cache {'hit' if cache.session.hits else 'miss'}: "
+                      f"{cache.directory}\n")
+                cache.close()
+
+        elif args.model == 'v3':
+            result = simulate_v3(config)
+            if export_csv:
+                with phase('csv'):
+                    report.write_vfd_dol_csv(result, csv_filename)
+                print(f"\n✓ Data exported to: {csv_filename}")
+            if show_plots:
+                with phase('figure'):
+                    plotting.plot_vfd_dol(result)
+            with phase('report'):
+                report.print_vfd_dol_summary(result)
+
+        else:
+            result = simulate_v2(config)
+            if show_plots:
+                with phase('figure'):
+                    plotting.plot_vfd_start(config, result)
+            with phase('report'):
+                report.print_vfd_summary(config, result)
+        return result
+
+    # The instrumented run covers the simulation, exports, figure
+    # construction and summary, but not the interactive plt.show()
+    run_context = instrument(args.model, solver=config.solver, time_points=config.time_points) \
+        if args.instrument else nullcontext()
+    with run_context as record:
+        if args.profile is not None:
+            from .profiling import print_profile_report, profile_run, save_profile
+            result, stats, memory, snapshot = profile_run(run, args.model)
+        else:
+            result = run()
+    if args.instrument:
+        write_record(record, args.instrument)
+    if args.profile is not None:
+        print_profile_report(stats, memory, snapshot)
+        if args.profile:
+            save_profile(stats, args.profile)
+            print(f"✓ Profile data saved to: {args.profile}\n")
+
+    if show_plots and args.profile is None:
+        plt.show()
+    return result
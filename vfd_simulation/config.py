@@ -0,0 +1,107 @@
+# =============================================================================
+# VFD-Motor-Simulation: Configuration
+# =============================================================================
+# All motor, load, starter and cost parameters for one simulation run. The
+# defaults reproduce the 800HP constant-torque study of the v4.0.0 script.
+# =============================================================================
+
+from dataclasses import dataclass, replace
+from functools import cached_property
+
+import numpy as np
+
+# Load type selection: 'constant_torque', 'fan_pump', 'constant_power'
+LOAD_TYPES = ('constant_torque', 'fan_pump', 'constant_power')
+
+# Starting methods compared in v4
+METHODS = ('vfd', 'soft_starter')
+
+# ODE solver backends ('numba' falls back to 'odeint' without Numba)
+SOLVERS = ('odeint', 'solve_ivp', 'numba')
+
+
+@dataclass(frozen=True)
+class SimulationConfig:
+    # Motor parameters (for an 800HP induction motor)
+    power_hp: float = 800  # HP
+    voltage: float = 460  # Volts (line-to-line)
+    base_freq: float = 60  # Hz
+    poles: int = 4  # 4-pole motor
+    efficiency: float = 0.95  # Motor efficiency at rated load
+    power_factor: float = 0.88  # Power factor at rated load
+
+    # System dynamics parameters
+    inertia: float = 150  # kg*m^2 (system inertia - motor + load)
+    damping: float = 2.0  # Damping coefficient (N*m*s/rad)
+    load_torque_factor: float = 0.75  # Load torque as fraction of rated (75% load)
+
+    # Starting method parameters
+    vfd_ramp_time: float = 30  # VFD ramp time (seconds)
+    soft_start_ramp_time: float = 20  # Soft starter ramp time (seconds)
+    v_boost: float = 0.15  # Low-frequency voltage boost for VFD (15%)
+    soft_start_initial_voltage: float = 0.3  # Soft starter initial voltage (30%)
+
+    # Load type selection: 'constant_torque', 'fan_pump', 'constant_power'
+    load_type: str = 'constant_torque'
+
+    # Simulation parameters
+    time_points: int = 1000
+    solver: str = 'odeint'  # 'odeint' (fixed grid), 'solve_ivp' (adaptive, with events), 'numba' (JIT RK4)
+
+    # solve_ivp terminal events (None disables an event)
+    speed_tolerance: float = 0.05  # Start complete within 5% of synchronous speed
+    current_limit_fla: float = 4.0  # Over-current trip, multiple of FLA
+
+    # Torque-slip and load curves from interpolated lookup tables, accurate
+    # to this per-unit error (None evaluates them exactly)
+    lookup_tolerance: float = None
+
+    # odeint only: integrate input energy, I^2t and mechanical energy as extra
+    # ODE states alongside the speed (augmented.py) instead of applying the
+    # trapezoidal rule to the sampled power
+    energy_states: bool = False
+
+    # Cost model
+    vfd_installed_cost: float = 70000  # Typical installed cost
+    ss_installed_cost: float = 15000  # Typical installed cost
+    annual_hours: float = 6000  # Running hours per year at rated load
+    energy_cost_per_kwh: float = 0.10
+    vfd_continuous_loss_pct: float = 0.04  # VFD continuous losses (3-5% when running)
+    starts_per_year: int = 2 * 365  # 2 starts per day
+    tariff: object = None  # tariff.Tariff (time-of-use/demand); None bills energy_cost_per_kwh flat
+
+    # -------------------------------------------------------------------------
+    # Derived motor characteristics (cached; the config is immutable)
+    # -------------------------------------------------------------------------
+
+    @cached_property
+    def power_kw(self):
+        return self.power_hp * 0.7457
+
+    @cached_property
+    def sync_speed_rpm(self):
+        return 120 * self.base_freq / self.poles
+
+    @cached_property
+    def sync_speed_rad(self):
+        return self.sync_speed_rpm * (2 * np.pi / 60)
+
+    @cached_property
+    def rated_torque(self):
+        # Nm (assume 3% slip)
+        return (self.power_kw * 1000) / (self.sync_speed_rad * (1 - 0.03))
+
+    @cached_property
+    def fla(self):
+        # Full load current
+        return (self.power_kw * 1000) / (np.sqrt(3) * self.voltage * self.power_factor * self.efficiency)
+
+    @cached_property
+    def load_torque(self):
+        return self.rated_torque * self.load_torque_factor
+
+    def replace(self, **changes):
+        return replace(self, **changes)
+
+
+DEFAULT_CONFIG = SimulationConfig()
@@ -0,0 +1,74 @@
+# =============================================================================
+# VFD-Motor-Simulation: Cost Model
+# =============================================================================
+# Annual costs are billed through the tariff engine (tariff.py): the motor
+# runs annual_hours at rated load with starts_per_year starts spread over the
+# year, and each cost is the increase in the annual bill (energy plus demand
+# charges) over the base running load.
+# =============================================================================
+
+from dataclasses import dataclass
+
+from .tariff import annual_charges
+
+
+@dataclass(frozen=True)
+class CostSummary:
+    vfd_installed_cost: float
+    ss_installed_cost: float
+    vfd_annual_loss_cost: float
+    ss_annual_loss_cost: float
+    vfd_startup_cost: float
+    ss_startup_cost: float
+    vfd_total_annual_cost: float
+    ss_total_annual_cost: float
+    cost_difference: float
+    annual_savings_ss: float
+    payback_years: float
+    vfd_demand_cost: float = 0.0  # demand charges included in the VFD totals
+    ss_demand_cost: float = 0.0  # demand charges included in the soft starter totals
+
+
+def calculate_costs(config, vfd_start, ss_start):
+    # vfd_start/ss_start: StartTrajectory (its power_in profile is billed
+    # interval by interval) or the energy of one start in kJ
+    charges = annual_charges(config, vfd_start, ss_start)
+    ss_base_cost, vfd_base_cost, vfd_running_cost, vfd_cost, ss_cost = \
+        (float(cost) for cost in charges.total_cost)
+    ss_base_demand, vfd_base_demand, _, vfd_demand, ss_demand = \
+        (float(cost) for cost in charges.demand_cost)
+
+    # VFD continuous losses while running (annual_hours at rated load)
+    vfd_annual_loss_cost = vfd_running_cost - vfd_base_cost
+
+    # Soft starter bypassed after startup (zero continuous losses)
+    ss_annual_loss_cost = 0
+
+    # Startup energy and the demand peaks the starts cause
+    vfd_startup_cost = vfd_cost - vfd_running_cost
+    ss_startup_cost = ss_cost - ss_base_cost
+
+    # Total annual operating cost
+    vfd_total_annual_cost = vfd_annual_loss_cost + vfd_startup_cost
+    ss_total_annual_cost = ss_annual_loss_cost + ss_startup_cost
+
+    # Payback period for VFD premium (if used for constant speed only)
+    cost_difference = config.vfd_installed_cost - config.ss_installed_cost
+    annual_savings_ss = vfd_total_annual_cost - ss_total_annual_cost
+    payback_years = cost_difference / annual_savings_ss if annual_savings_ss > 0 else float('inf')
+
+    return CostSummary(
+        vfd_installed_cost=config.vfd_installed_cost,
+        ss_installed_cost=config.ss_installed_cost,
+        vfd_annual_loss_cost=vfd_annual_loss_cost,
+        ss_annual_loss_cost=ss_annual_loss_cost,
+        vfd_startup_cost=vfd_startup_cost,
+        ss_startup_cost=ss_startup_cost,
+        vfd_total_annual_cost=vfd_total_annual_cost,
+        ss_total_annual_cost=ss_total_annual_cost,
+        cost_difference=cost_difference,
+        annual_savings_ss=annual_savings_ss,
+        payback_years=payback_years,
+        vfd_demand_cost=vfd_demand - vfd_base_demand,
+        ss_demand_cost=ss_demand - ss_base_demand,
+    )
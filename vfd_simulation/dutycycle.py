@@ -0,0 +1,320 @@
+# =============================================================================
+# VFD-Motor-Simulation: Annual Duty-Cycle Simulation
+# =============================================================================
+# Drives the cost comparison from a measured duty cycle instead of the fixed
+# annual_hours / starts_per_year assumptions: a profile of speed and load
+# setpoints (typically one year at 1 s, ~31.5 million samples) is streamed
+# through in chunks and energy, losses, starts and cost are accumulated
+# incrementally, so memory use does not depend on the profile length.
+#
+# Profile columns, one row per time step:
+#   speed  speed setpoint as a fraction of base frequency (0 = stopped)
+#   load   load torque at full speed as a fraction of rated torque
+#
+# Operating modes compared, both at the steady-state operating point from
+# the cached efficiency map of config:
+#   VFD           runs at the speed setpoint, and the drive loses
+#                 vfd_continuous_loss_pct of the motor input power
+#   Soft starter  starts the motor, then is bypassed: the motor runs at full
+#                 speed whenever the setpoint is non-zero (flow is
+#                 throttled), with no drive losses
+# Each stopped-to-running transition is a start, drawing the start power
+# profile of the v4 simulation of config. Energy is binned into demand
+# intervals as it streams past and billed with config.tariff (tariff.py).
+#
+# Quick Start:
+#   python -m vfd_simulation.dutycycle profile.npy          (N x 2 array)
+#   python -m vfd_simulation.dutycycle profile.csv --load-type fan_pump
+#   python -m vfd_simulation.dutycycle --synthetic-days 365  (generated profile)
+#   python -m vfd_simulation.dutycycle profile.npy --tariff tou.json
+# =============================================================================
+
+import argparse
+import warnings
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from .config import DEFAULT_CONFIG, LOAD_TYPES
+from .simulation import simulate
+from .steadystate import efficiency_map
+from .tariff import EXAMPLE_TOU_TARIFF, apply_tariff, bin_starts, config_tariff, read_tariff
+
+CHUNK_SIZE = 2**20  # samples per chunk (~16 MB of float64 setpoints)
+TIME_STEP = 1.0  # s per profile sample
+SECONDS_PER_DAY = 86400
+
+
+@dataclass(frozen=True)
+class DutyCycleSummary:
+    samples: int
+    hours: float  # profile length
+    running_hours: float
+    starts: int
+    shaft_energy_kwh: float
+    vfd_energy_kwh: float  # grid input, including starts
+    vfd_loss_kwh: float  # drive losses
+    vfd_start_energy_kwh: float
+    ss_energy_kwh: float
+    ss_start_energy_kwh: float
+    vfd_energy_cost: float
+    ss_energy_cost: float
+    vfd_demand_cost: float
+    ss_demand_cost: float
+    annual_savings_vfd: float  # per year of profile
+    payback_years: float
+
+
+class DutyCycleAccumulator:
+    # Running totals over a profile fed in chunks with update(speed, load).
+    # Energy is also binned into the tariff's demand intervals (one float
+    # per 15 min) and billed when the summary is taken. The VFD and
+    # soft-starter starts (StartTrajectory or kJ per start) default to the
+    # v4 simulation of config.
+    def __init__(self, config=DEFAULT_CONFIG, time_step=TIME_STEP,
+                 vfd_start=None, ss_start=None):
+        if vfd_start is None or ss_start is None:
+            result = simulate(config)
+            vfd_start = result.vfd if vfd_start is None else vfd_start
+            ss_start = result.soft_starter if ss_start is None else ss_start
+        self.config = config
+        self.tariff = config_tariff(config)
+        self.efficiency_map = efficiency_map(config)
+        self.time_step = time_step
+        self.vfd_start = vfd_start
+        self.ss_start = ss_start
+        self.samples = 0
+        self.running_samples = 0
+        self.starts = 0
+        self.start_samples = []
+        self.was_running = False
+        # Power sums in kW x samples
+        self.shaft = 0.0
+        self.vfd_input = 0.0
+        self.vfd_loss = 0.0
+        self.ss_input = 0.0
+        # kWh per demand interval
+        self.vfd_intervals = np.zeros(0)
+        self.ss_intervals = np.zeros(0)
+
+    def update(self, speed, load):
+        config = self.config
+        speed = np.asarray(speed, dtype=float)
+        running = speed > 0
+        if not running.size:
+            return
+
+        # Starts: stopped -> running, including across the chunk boundary
+        started = np.flatnonzero(np.r_[running[0] and not self.was_running,
+                                       running[1:] & ~running[:-1]])
+        self.start_samples.append(self.samples + started)
+        self.starts += started.size
+        self.was_running = bool(running[-1])
+        self.running_samples += int(np.count_nonzero(running))
+
+        load = np.asarray(load, dtype=float)
+        speed = np.where(running, speed, 0.0)
+        shaft, motor_input = self.efficiency_map.lookup(('power_out', 'power_in'), speed, load)
+        ss_input = np.where(running, self.efficiency_map.lookup('power_in', 1.0, load), 0.0)
+        if np.isnan(motor_input.sum()) or np.isnan(ss_input.sum()):
+            raise ValueError("profile includes operating points where the load exceeds "
+                             "the motor's breakdown torque")
+        vfd_input = motor_input * (1 + config.vfd_continuous_loss_pct)
+
+        self.shaft += float(shaft.sum())
+        self.vfd_input += float(vfd_input.sum())
+        self.vfd_loss += float(motor_input.sum()) * config.vfd_continuous_loss_pct
+        self.ss_input += float(ss_input.sum())
+
+        interval = ((self.samples + np.arange(speed.size)) * self.time_step
+                    // self.tariff.interval).astype(np.intp)
+        first = interval[0]
+        kwh_per_kw = self.time_step / 3600
+        self.vfd_intervals = _add_intervals(
+            self.vfd_intervals, first, np.bincount(interval - first, vfd_input) * kwh_per_kw)
+        self.ss_intervals = _add_intervals(
+            self.ss_intervals, first, np.bincount(interval - first, ss_input) * kwh_per_kw)
+        self.samples += speed.size
+
+    def summary(self):
+        config = self.config
+        hours_per_sample = self.time_step / 3600
+        hours = self.samples * hours_per_sample
+
+        # Starts billed in the intervals their power profile falls in
+        intervals = int(np.ceil(self.samples * self.time_step / self.tariff.interval))
+        start_times = np.concatenate(self.start_samples or [np.zeros(0)]) * self.time_step
+        vfd_starts = bin_starts(start_times, self.vfd_start, intervals, self.tariff.interval)
+        ss_starts = bin_starts(start_times, self.ss_start, intervals, self.tariff.interval)
+        charges = apply_tariff(self.tariff, np.stack([
+            self.vfd_intervals[:intervals] + vfd_starts,
+            self.ss_intervals[:intervals] + ss_starts,
+        ]))
+        vfd_cost, ss_cost = charges.total_cost
+
+        # VFD premium paid back by its energy savings, scaled to a year
+        years = hours / (365 * 24) if hours else 0.0
+        annual_savings = float(ss_cost - vfd_cost) / years if years else 0.0
+        cost_difference = config.vfd_installed_cost - config.ss_installed_cost
+        payback_years = cost_difference / annual_savings if annual_savings > 0 else float('inf')
+
+        return DutyCycleSummary(
+            samples=self.samples,
+            hours=hours,
+            running_hours=self.running_samples * hours_per_sample,
+            starts=self.starts,
+            shaft_energy_kwh=self.shaft * hours_per_sample,
+            vfd_energy_kwh=float(charges.energy_kwh[0]),
+            vfd_loss_kwh=self.vfd_loss * hours_per_sample,
+            vfd_start_energy_kwh=float(vfd_starts.sum()),
+            ss_energy_kwh=float(charges.energy_kwh[1]),
+            ss_start_energy_kwh=float(ss_starts.sum()),
+            vfd_energy_cost=float(charges.energy_cost[0]),
+            ss_energy_cost=float(charges.energy_cost[1]),
+            vfd_demand_cost=float(charges.demand_cost[0]),
+            ss_demand_cost=float(charges.demand_cost[1]),
+            annual_savings_vfd=annual_savings,
+            payback_years=payback_years,
+        )
+
+def _add_intervals(totals, first, values):
+    # totals[first:first + len(values)] += values, growing totals as needed
+    end = first + values.size
+    if end > totals.size:
+        totals = np.concatenate([totals, np.zeros(max(end - totals.size, totals.size))])
+    totals[first:end] += values
+    return totals
+
+# =============================================================================
+# PROFILE SOURCES
+# =============================================================================
+# Each yields (speed, load) array pairs of at most chunk_size samples.
+
+def npy_chunks(filename, chunk_size=CHUNK_SIZE):
+    # (N, 2) C-ordered .npy file, read one chunk at a time (a memory map
+    # would leave the whole year resident in the page cache)
+    with open(filename, 'rb') as npyfile:
+        version = np.lib.format.read_magic(npyfile)
+        read_header = (np.lib.format.read_array_header_1_0 if version == (1, 0)
+                       else np.lib.format.read_array_header_2_0)
+        shape, fortran_order, dtype = read_header(npyfile)
+        if len(shape) != 2 or shape[1] < 2 or fortran_order:
+            raise ValueError(f"{filename}: expected a C-ordered (N, 2) array, got {shape}")
+        for start in range(0, shape[0], chunk_size):
+            rows = min(chunk_size, shape[0] - start)
+            chunk = np.fromfile(npyfile, dtype=dtype, count=rows * shape[1]).reshape(rows, shape[1])
+            yield chunk[:, 0].astype(float), chunk[:, 1].astype(float)
+
+def csv_chunks(filename, chunk_size=CHUNK_SIZE):
+    # CSV with a header row and speed, load as its first two columns
+    with open(filename) as csvfile, warnings.catch_warnings():
+        warnings.filterwarnings('ignore', 'loadtxt: input contained no data')
+        csvfile.readline()
+        while True:
+            chunk = np.loadtxt(csvfile, delimiter=',', usecols=(0, 1), max_rows=chunk_size, ndmin=2)
+            if not chunk.size:
+                return
+            yield chunk[:, 0], chunk[:, 1]
+
+def profile_chunks(filename, chunk_size=CHUNK_SIZE):
+    if Path(filename).suffix == '.npy':
+        return npy_chunks(filename, chunk_size)
+    return csv_chunks(filename, chunk_size)
+
+def synthetic_chunks(days=365, time_step=TIME_STEP, chunk_size=CHUNK_SIZE, seed=None):
+    # Generated process duty cycle: runs in shifts with a few stops a day,
+    # speed and load drifting with demand (fan/pump-like 60-100% speed)
+    rng = np.random.default_rng(seed)
+    samples = int(days * SECONDS_PER_DAY / time_step)
+    for start in range(0, samples, chunk_size):
+        t = (start + np.arange(min(chunk_size, samples - start))) * time_step
+        hour = (t / 3600) % 24
+        demand = 0.8 + 0.15 * np.sin(2 * np.pi * (hour - 9) / 24) + 0.03 * rng.standard_normal(t.size)
+        running = (hour >= 6) & (hour < 22) & ((t // 7200) % 13 != 0)  # a stop every 26 h of running
+        speed = np.where(running, np.clip(demand, 0.6, 1.0), 0.0)
+        yield speed, np.full(t.size, DEFAULT_CONFIG.load_torque_factor)
+
+def write_synthetic_profile(filename, days=365, time_step=TIME_STEP, seed=None):
+    # Stream a synthetic profile into an (N, 2) .npy file
+    samples = int(days * SECONDS_PER_DAY / time_step)
+    profile = np.lib.format.open_memmap(filename, mode='w+', dtype=np.float32, shape=(samples, 2))
+    start = 0
+    for speed, load in synthetic_chunks(days, time_step, seed=seed):
+        profile[start:start + speed.size, 0] = speed
+        profile[start:start + speed.size, 1] = load
+        start += speed.size
+    profile.flush()
+
+def simulate_duty_cycle(chunks, config=DEFAULT_CONFIG, time_step=TIME_STEP):
+    accumulator = DutyCycleAccumulator(config, time_step)
+    for speed, load in chunks:
+        accumulator.update(speed, load)
+    return accumulator.summary()
+
+# =============================================================================
+# OUTPUT / COMMAND LINE
+# =============================================================================
+
+def print_duty_cycle_summary(summary, config=DEFAULT_CONFIG):
+    print(f"\nDuty Cycle: {summary.samples:,} samples, {summary.hours:,.0f} h "
+          f"({summary.running_hours:,.0f} h running, {summary.starts:,} starts)")
+    print("-" * 60)
+    print(f"{'':<28}{'VFD':>14}{'Soft Starter':>16}")
+    print(f"{'Energy (kWh)':<28}{summary.vfd_energy_kwh:>14,.0f}{summary.ss_energy_kwh:>16,.0f}")
+    print(f"{'  of which starts (kWh)':<28}{summary.vfd_start_energy_kwh:>14,.0f}"
+          f"{summary.ss_start_energy_kwh:>16,.0f}")
+    print(f"{'  of which drive loss (kWh)':<28}{summary.vfd_loss_kwh:>14,.0f}{0:>16,.0f}")
+    print(f"{'Energy cost':<28}{f'${summary.vfd_energy_cost:,.0f}':>14}"
+          f"{f'${summary.ss_energy_cost:,.0f}':>16}")
+    if summary.vfd_demand_cost or summary.ss_demand_cost:
+        print(f"{'Demand charges':<28}{f'${summary.vfd_demand_cost:,.0f}':>14}"
+              f"{f'${summary.ss_demand_cost:,.0f}':>16}")
+    print("-" * 60)
+    print(f"  Shaft energy:            {summary.shaft_energy_kwh:,.0f} kWh")
+    print(f"  VFD savings per year:    ${summary.annual_savings_vfd:,.0f}")
+    print(f"  VFD premium payback:     {summary.payback_years:.1f} years "
+          f"(${config.vfd_installed_cost - config.ss_installed_cost:,.0f})")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m vfd_simulation.dutycycle',
+                                     description='Annual energy and cost from a duty-cycle profile.')
+    parser.add_argument('profile', nargs='?',
+                        help='(N, 2) .npy or CSV of speed, load setpoints per time step')
+    parser.add_argument('--synthetic-days', type=float,
+                        help='use a generated profile of this many days instead of a file')
+    parser.add_argument('--write-synthetic', metavar='FILENAME',
+                        help='write the generated profile to this .npy file and exit')
+    parser.add_argument('--time-step', type=float, default=TIME_STEP,
+                        help='seconds per sample (default: %(default)s)')
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE,
+                        help='samples per chunk (default: %(default)s)')
+    parser.add_argument('--load-type', choices=LOAD_TYPES, default=DEFAULT_CONFIG.load_type)
+    parser.add_argument('--tariff', metavar='FILENAME',
+                        help="tariff JSON file ('example' for the built-in time-of-use tariff; "
+                             'default: flat energy_cost_per_kwh)')
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args(argv)
+
+    if args.write_synthetic:
+        write_synthetic_profile(args.write_synthetic, args.synthetic_days or 365, args.time_step,
+                                args.seed)
+        print(f"✓ Synthetic profile written to: {args.write_synthetic}")
+        return None
+    if args.synthetic_days:
+        chunks = synthetic_chunks(args.synthetic_days, args.time_step, args.chunk_size, args.seed)
+    elif args.profile:
+        chunks = profile_chunks(args.profile, args.chunk_size)
+    else:
+        parser.error('give a profile file or --synthetic-days')
+
+    config = DEFAULT_CONFIG.replace(load_type=args.load_type)
+    if args.tariff:
+        config = config.replace(tariff=EXAMPLE_TOU_TARIFF if args.tariff == 'example'
+                                else read_tariff(args.tariff))
+    summary = simulate_duty_cycle(chunks, config, args.time_step)
+    print_duty_cycle_summary(summary, config)
+    return summary
+
+if __name__ == '__main__':
+    main()
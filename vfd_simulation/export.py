@@ -0,0 +1,147 @@
+# =============================================================================
+# VFD-Motor-Simulation: Columnar Binary Export
+# =============================================================================
+# Writes a v4 result as typed columns in one bulk write, with the run
+# metadata (model version, configuration, cost summary) in the file header.
+# The format follows the file extension:
+#   .parquet          Parquet, zstd-compressed       (requires pyarrow)
+#   .arrow / .feather Arrow IPC file, zstd-compressed (requires pyarrow)
+#   .npz              compressed NumPy archive        (no extra dependency)
+# NPZ stores each trajectory as one (column, sample) block so a read is a
+# single decompress per starter; read_columns splits it back into columns.
+#
+# Usage:
+#   write_columns(result, 'run.npz')
+#   write_columns(result, 'run.npz', dtype=np.float32)   (half the size)
+#   columns, metadata = read_columns('run.npz')
+#   columns['vfd_current_a'].max(), metadata['config']['inertia']
+# =============================================================================
+
+import json
+from dataclasses import asdict
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+from . import __version__
+from .instrumentation import record_file
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+# Key of the JSON metadata: schema metadata for Arrow/Parquet, an extra
+# string array for NPZ
+METADATA_KEY = 'vfd_simulation'
+
+# Column prefix -> SimulationResult attribute
+TRAJECTORIES = {
+    'vfd': 'vfd',
+    'ss': 'soft_starter',
+}
+
+FORMATS = {
+    '.parquet': 'parquet',
+    '.arrow': 'arrow',
+    '.feather': 'arrow',
+    '.npz': 'npz',
+}
+
+# Column name -> StartTrajectory attribute
+TRAJECTORY_COLUMNS = {
+    'time_s': 'time',
+    'speed_rpm': 'omega_rpm',
+    'current_a': 'current',
+    'torque_nm': 'torque',
+    'load_torque_nm': 'load_torque',
+    'slip_pct': 'slip',
+    'power_in_kw': 'power_in',
+    'power_out_kw': 'power_out',
+    'efficiency_pct': 'efficiency',
+    'voltage_v': 'voltage',
+}
+
+# =============================================================================
+# COLUMNS AND METADATA
+# =============================================================================
+
+def result_columns(result, dtype=np.float64):
+    # float64 keeps the solver's full precision; dtype=np.float32 halves the
+    # size and keeps ~7 significant digits
+    columns = {}
+    for prefix, trajectory_name in TRAJECTORIES.items():
+        trajectory = getattr(result, trajectory_name)
+        for name, attribute in TRAJECTORY_COLUMNS.items():
+            columns[f'{prefix}_{name}'] = np.asarray(getattr(trajectory, attribute), dtype=dtype)
+    return columns
+
+def result_metadata(result):
+    return {
+        'model_version': __version__,
+        'generated': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        'config': asdict(result.config),
+        'costs': asdict(result.costs),
+        'columns': list(TRAJECTORY_COLUMNS),
+    }
+
+def _format(filename, file_format):
+    if file_format is None:
+        suffix = Path(filename).suffix.lower()
+        if suffix not in FORMATS:
+            raise ValueError(f'cannot infer export format from {filename!r}; '
+                             f'use one of {", ".join(FORMATS)}')
+        file_format = FORMATS[suffix]
+    if file_format in ('parquet', 'arrow') and pa is None:
+        raise ImportError(f'{file_format} export requires pyarrow; '
+                          'install it or use a .npz filename')
+    return file_format
+
+# =============================================================================
+# WRITE / READ
+# =============================================================================
+
+def write_columns(result, filename, file_format=None, dtype=np.float64):
+    file_format = _format(filename, file_format)
+    columns = result_columns(result, dtype)
+    metadata = json.dumps(result_metadata(result))
+
+    if file_format == 'npz':
+        blocks = {prefix: np.stack([columns[f'{prefix}_{name}'] for name in TRAJECTORY_COLUMNS])
+                  for prefix in TRAJECTORIES}
+        # A 0-d unicode array loads back without allow_pickle
+        np.savez_compressed(filename, **blocks, **{METADATA_KEY: np.array(metadata)})
+        record_file(filename)
+        return
+
+    table = pa.table(columns).replace_schema_metadata({METADATA_KEY: metadata})
+    if file_format == 'parquet':
+        pq.write_table(table, filename, compression='zstd')
+    else:
+        options = pa.ipc.IpcWriteOptions(compression='zstd')
+        with pa.OSFile(str(filename), 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema, options=options) as writer:
+                writer.write_table(table)
+    record_file(filename)
+
+def read_columns(filename, file_format=None):
+    # Returns ({column: ndarray}, metadata dict)
+    file_format = _format(filename, file_format)
+
+    if file_format == 'npz':
+        with np.load(filename) as archive:
+            metadata = json.loads(archive[METADATA_KEY][()])
+            blocks = {prefix: archive[prefix] for prefix in TRAJECTORIES}
+        columns = {f'{prefix}_{name}': blocks[prefix][i]
+                   for prefix in TRAJECTORIES for i, name in enumerate(metadata['columns'])}
+        return columns, metadata
+
+    if file_format == 'parquet':
+        table = pq.read_table(filename)
+    else:
+        table = pa.ipc.open_file(pa.memory_map(str(filename))).read_all()
+    metadata = json.loads(table.schema.metadata[METADATA_KEY.encode()])
+    columns = {name: table.column(name).to_numpy() for name in table.column_names}
+    return columns, metadata
@@ -0,0 +1,330 @@
+# =============================================================================
+# VFD-Motor-Simulation: Fleet Simulation on a Shared Bus
+# =============================================================================
+# Integrates many motors on one bus (shared voltage, frequency and poles from
+# the config), each with its own size, inertia, start method and start time,
+# in a single odeint call: every motor is one component of the state vector,
+# as in batch.py. A motor is at rest and draws no current before its start
+# time, ramps with its own VFD or soft-starter profile, then keeps running.
+# Motors are integrated in time since their own start and shifted onto the
+# bus time grid, so 1000 motors take about a second on one core.
+#
+# The bus current is the sum of the motor currents. Adding RMS magnitudes
+# ignores the phase differences between motors, so it is an upper bound on
+# the true bus current (the conservative figure for sizing). A motor the
+# solver cannot integrate (e.g. a stall on the constant-power load) is a
+# row of NaN, left out of the bus totals and listed as failed.
+#
+# Quick Start:
+#   python -m vfd_simulation.fleet motors.csv
+#   python -m vfd_simulation.fleet motors.csv --csv bus.csv --time-step 0.05
+#
+# motors.csv columns: power_hp, inertia, method, start_time, and optionally
+# name, load_type, load_factor, ramp_time (blank = configured default; a
+# missing start_time is 0).
+# =============================================================================
+
+import argparse
+import csv
+import warnings
+from dataclasses import dataclass
+
+import numpy as np
+from scipy.integrate import ODEintWarning, odeint
+
+from .batch import batch_load_torque, scenario_codes
+from .config import DEFAULT_CONFIG, LOAD_TYPES, METHODS
+from .metrics import calculate_metrics, trapezoid
+from .models import TORQUE_A, TORQUE_B, TORQUE_C
+
+# Output grid spacing (s) when no time grid is given
+FLEET_TIME_STEP = 0.1
+
+# Seconds simulated after the last start's ramp ends
+FLEET_SETTLE_TIME = 5.0
+
+
+@dataclass(frozen=True)
+class Motor:
+    power_hp: float
+    inertia: float  # kg*m^2
+    method: str = 'vfd'  # 'vfd' or 'soft_starter'
+    start_time: float = 0.0  # s
+    load_type: str = None  # None: config.load_type
+    load_factor: float = None  # None: config.load_torque_factor
+    ramp_time: float = None  # None: configured ramp for the method
+    name: str = ''
+
+
+@dataclass
+class FleetResult:
+    motors: list
+    time: np.ndarray  # s
+    omega_rad: np.ndarray  # rad/s, (n_motors, n_time)
+    current: np.ndarray  # A, (n_motors, n_time)
+    power_in: np.ndarray  # kW, (n_motors, n_time)
+
+    @property
+    def failed(self):
+        # Motors the solver could not integrate
+        return [motor for motor, row in zip(self.motors, self.omega_rad) if np.isnan(row).all()]
+
+    @property
+    def bus_current(self):
+        return np.nansum(self.current, axis=0)
+
+    @property
+    def bus_power(self):
+        return np.nansum(self.power_in, axis=0)
+
+    @property
+    def peak_current(self):
+        return np.max(self.bus_current)
+
+    @property
+    def peak_time(self):
+        return self.time[np.argmax(self.bus_current)]
+
+    @property
+    def peak_demand_kw(self):
+        return np.max(self.bus_power)
+
+    @property
+    def motor_energy_kj(self):
+        return trapezoid(self.power_in, self.time, axis=1)
+
+    @property
+    def energy_kwh(self):
+        return trapezoid(self.bus_power, self.time) / 3600
+
+# =============================================================================
+# FLEET PREPARATION
+# =============================================================================
+
+def fleet_parameters(motors, config=DEFAULT_CONFIG):
+    # Per-motor arrays for the vectorized RHS. The bus fixes voltage,
+    # frequency and poles; rated torque and FLA follow each motor's size the
+    # same way SimulationConfig derives them.
+    n = len(motors)
+    method_code = scenario_codes([motor.method for motor in motors], METHODS, n, 'method')
+    vfd = method_code == 0
+    power_kw = np.array([motor.power_hp for motor in motors], dtype=float) * 0.7457
+    rated_torque = (power_kw * 1000) / (config.sync_speed_rad * (1 - 0.03))
+    load_factor = np.array([config.load_torque_factor if motor.load_factor is None
+                            else motor.load_factor for motor in motors], dtype=float)
+    ramp_time = np.array([
+        motor.ramp_time if motor.ramp_time is not None
+        else config.vfd_ramp_time if is_vfd else config.soft_start_ramp_time
+        for motor, is_vfd in zip(motors, vfd)], dtype=float)
+    load_code = scenario_codes([config.load_type if motor.load_type is None else motor.load_type
+                                for motor in motors], LOAD_TYPES, n, 'load type')
+
+    # Constant-torque and fan/pump loads as a quadratic in speed ratio, as in
+    # batch._rhs_parameters
+    coeffs = np.array([[0.3, 0.7, 0.0], [0.0, 0.0, 1.0], [0.0, 0.0, 0.0]])
+    constant_power = load_code == 2
+    return {
+        'config': config,
+        'vfd': vfd,
+        'power_hp': power_kw / 0.7457,
+        'rated_torque': rated_torque,
+        'base_load_torque': rated_torque * load_factor,
+        'load_coeffs': coeffs[load_code].T.copy(),
+        'load_code': load_code,
+        'constant_power': constant_power if np.any(constant_power) else None,
+        'inertia': np.array([motor.inertia for motor in motors], dtype=float),
+        'start_time': np.array([motor.start_time for motor in motors], dtype=float),
+        'ramp_time': ramp_time,
+    }
+
+# =============================================================================
+# FLEET DYNAMICS
+# =============================================================================
+
+def fleet_dynamics(omega_rad, local_time, params):
+    # The reference start dynamics vectorized over motors, in time since each
+    # motor's start: the stiff first moments of every start coincide, so the
+    # step count does not grow with the number of motors
+    config = params['config']
+    progress = np.minimum(local_time / params['ramp_time'], 1.0)
+
+    # VFD: frequency ramp with low-frequency boost; soft starter: full
+    # frequency at a ramped voltage
+    freq = config.base_freq * progress
+    vfd_sync_speed = (120 * freq / config.poles) * (2 * np.pi / 60)
+    sync_speed_rad = np.where(params['vfd'], np.maximum(vfd_sync_speed, 0.1), config.sync_speed_rad)
+    slip = np.clip((sync_speed_rad - omega_rad) / sync_speed_rad, 0, 1.0)
+    a, b, c = TORQUE_A, TORQUE_B, TORQUE_C
+    torque_ratio = (a * slip) / (slip**2 + b * slip + c)
+
+    boost_freq = config.base_freq * 0.15
+    vfd_scale = (freq / config.base_freq) * np.where(
+        freq < boost_freq, 1 + config.v_boost * (1 - freq / boost_freq), 1.0)
+    vfd_ratio = np.where(freq < 1.0, 2.5 * slip * (1 + config.v_boost * 5), torque_ratio * vfd_scale)
+    initial = config.soft_start_initial_voltage
+    voltage_ratio = initial + (1 - initial) * progress
+    torque_em = params['rated_torque'] * np.where(params['vfd'], vfd_ratio,
+                                                  torque_ratio * voltage_ratio**2)
+
+    effective_load = batch_load_torque(omega_rad, params)
+    d_omega_dt = (torque_em - effective_load - config.damping * omega_rad) / params['inertia']
+
+    # The VFD holds the motor until its output reaches 0.1 rad/s
+    return np.where(params['vfd'] & (vfd_sync_speed < 0.1), 0.0, d_omega_dt)
+
+# =============================================================================
+# FLEET SIMULATION
+# =============================================================================
+
+def fleet_time(motors, config=DEFAULT_CONFIG, time_step=FLEET_TIME_STEP):
+    # linspace from 0 past the end of the last ramp, about time_step apart
+    params = fleet_parameters(motors, config)
+    t_end = np.max(params['start_time'] + params['ramp_time']) + FLEET_SETTLE_TIME
+    return np.linspace(0, t_end, int(np.ceil(t_end / time_step)) + 1)
+
+def simulate_fleet(motors, config=DEFAULT_CONFIG, time=None, rtol=1e-6, atol=1e-6):
+    # Integrates all motors together and evaluates their current and input
+    # power on the common time grid (default: fleet_time). Tolerances as in
+    # batch.simulate_batch.
+    params = fleet_parameters(motors, config)
+    time = fleet_time(motors, config) if time is None else np.asarray(time, dtype=float)
+
+    # Integrate on a uniform local-time grid as fine as the output grid and
+    # long enough for the earliest start, then shift each motor onto the
+    # bus time grid by linear interpolation (at rest before its start)
+    local_step = np.min(np.diff(time)) if time.size > 1 else FLEET_TIME_STEP
+    horizon = max(time[-1] - np.min(params['start_time']), local_step)
+    local_time = np.linspace(0, horizon, int(np.ceil(horizon / local_step)) + 1)
+    local_omega = np.empty((len(motors), local_time.size))
+    _solve_motors(list(motors), np.arange(len(motors)), local_time, local_omega, rtol, atol, config)
+
+    position = (time[np.newaxis, :] - params['start_time'][:, np.newaxis]) / local_time[1]
+    index = np.clip(position.astype(np.intp), 0, local_time.size - 2)
+    fraction = np.clip(position - index, 0.0, 1.0)
+    rows = np.arange(len(motors))[:, np.newaxis]
+    omega_rad = local_omega[rows, index] * (1 - fraction) + local_omega[rows, index + 1] * fraction
+    omega_rad[position < 0] = 0.0
+
+    current, power_in = fleet_metrics(time, omega_rad, params)
+    failed = np.isnan(local_omega[:, -1])
+    omega_rad[failed] = current[failed] = power_in[failed] = np.nan
+    return FleetResult(list(motors), time, omega_rad, current, power_in)
+
+def _solve_motors(motors, rows, local_time, local_omega, rtol, atol, config):
+    params = fleet_parameters([motors[row] for row in rows], config)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', ODEintWarning)
+        solution, info = odeint(fleet_dynamics, np.zeros(rows.size), local_time, args=(params,),
+                                ml=0, mu=0, rtol=rtol, atol=atol, mxstep=50000,
+                                full_output=True)
+
+    if info['message'] == 'Integration successful.':
+        local_omega[rows] = solution.T
+    elif rows.size == 1:
+        local_omega[rows] = np.nan
+    else:
+        # As in batch._solve_rows: bisect so only the motors the solver cannot
+        # get through are lost, not the whole fleet
+        half = rows.size // 2
+        _solve_motors(motors, rows[:half], local_time, local_omega, rtol, atol, config)
+        _solve_motors(motors, rows[half:], local_time, local_omega, rtol, atol, config)
+
+def fleet_metrics(time, omega_rad, params):
+    # (current, power_in) from calculate_metrics per (size, method, load
+    # type) group on each motor's local time; zero before a motor starts
+    config = params['config']
+    local_time = time[np.newaxis, :] - params['start_time'][:, np.newaxis]
+    current, power_in = np.zeros_like(omega_rad), np.zeros_like(omega_rad)
+
+    groups = np.stack([params['power_hp'], params['vfd'], params['load_code']], axis=1)
+    for power_hp, is_vfd, load_code in np.unique(groups, axis=0):
+        rows = np.all(groups == (power_hp, is_vfd, load_code), axis=1)
+        results = calculate_metrics(local_time[rows], omega_rad[rows],
+                                    'vfd' if is_vfd else 'soft_starter',
+                                    params['ramp_time'][rows, np.newaxis],
+                                    params['base_load_torque'][rows, np.newaxis],
+                                    LOAD_TYPES[int(load_code)], config.replace(power_hp=power_hp))
+        current[rows], power_in[rows] = results[0], results[4]
+
+    not_started = local_time < 0
+    current[not_started] = 0
+    power_in[not_started] = 0
+    return current, power_in
+
+# =============================================================================
+# INPUT / OUTPUT
+# =============================================================================
+
+def read_motors(filename):
+    # Motor list from a CSV file; blank optional fields use the defaults
+    optional = {'start_time': float, 'load_type': str, 'load_factor': float, 'ramp_time': float,
+                'name': str}
+    motors = []
+    with open(filename, newline='') as csvfile:
+        for row in csv.DictReader(csvfile):
+            extra = {field: convert(row[field].strip()) for field, convert in optional.items()
+                     if (row.get(field) or '').strip()}
+            motors.append(Motor(power_hp=float(row['power_hp']), inertia=float(row['inertia']),
+                                method=row['method'].strip(), **extra))
+    return motors
+
+def write_fleet_csv(result, filename):
+    with open(filename, 'w', newline='') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(['Time_s', 'Bus_Current_A', 'Bus_Power_kW', 'Motors_Started'])
+        started = (result.time[np.newaxis, :] >=
+                   np.array([motor.start_time for motor in result.motors])[:, np.newaxis]).sum(axis=0)
+        for row in zip(result.time.tolist(), result.bus_current.tolist(),
+                       result.bus_power.tolist(), started.tolist()):
+            writer.writerow([f'{row[0]:.3f}', f'{row[1]:.1f}', f'{row[2]:.1f}', row[3]])
+
+def print_fleet_summary(result):
+    print(f"\nFleet: {len(result.motors)} motors, "
+          f"{sum(motor.power_hp for motor in result.motors):,.0f} HP total")
+    print("-" * 60)
+    print(f"  Peak Bus Current:     {result.peak_current:,.0f} A at {result.peak_time:.1f} s")
+    print(f"  Peak Demand:          {result.peak_demand_kw:,.0f} kW")
+    print(f"  Energy:               {result.energy_kwh:,.1f} kWh over {result.time[-1]:.0f} s")
+    failed = [motor.name or f'motor {index + 1}' for index, motor in enumerate(result.motors)
+              if np.isnan(result.omega_rad[index]).all()]
+    if failed:
+        print(f"  Not integrated (left out of the totals): {', '.join(failed)}")
+    print("-" * 60)
+
+    # The motors carrying the most current at the peak
+    at_peak = result.current[:, np.argmax(result.bus_current)]
+    print("  Largest contributors at the peak:")
+    integrated = np.flatnonzero(~np.isnan(at_peak))
+    for index in integrated[np.argsort(at_peak[integrated])[::-1][:5]]:
+        motor = result.motors[index]
+        label = motor.name or f'motor {index + 1}'
+        print(f"    {label:<20}{motor.power_hp:>6.0f} HP  {motor.method:<13}"
+              f"start {motor.start_time:>7.1f} s  {at_peak[index]:>8,.0f} A")
+
+# =============================================================================
+# COMMAND LINE
+# =============================================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m vfd_simulation.fleet',
+                                     description='Aggregate bus current of a fleet of motor starts.')
+    parser.add_argument('motors', help='CSV of motors (power_hp, inertia, method, start_time, ...)')
+    parser.add_argument('--time-step', type=float, default=FLEET_TIME_STEP,
+                        help='output grid spacing in seconds (default: %(default)s)')
+    parser.add_argument('--load-type', choices=LOAD_TYPES,
+                        help='default load type for motors that do not give one')
+    parser.add_argument('--csv', metavar='FILENAME', dest='csv_filename',
+                        help='write the bus current and power time series')
+    args = parser.parse_args(argv)
+
+    config = DEFAULT_CONFIG.replace(load_type=args.load_type) if args.load_type else DEFAULT_CONFIG
+    motors = read_motors(args.motors)
+    result = simulate_fleet(motors, config, fleet_time(motors, config, args.time_step))
+    print_fleet_summary(result)
+    if args.csv_filename:
+        write_fleet_csv(result, args.csv_filename)
+        print(f"✓ Bus time series exported to: {args.csv_filename}")
+    return result
+
+if __name__ == '__main__':
+    main()
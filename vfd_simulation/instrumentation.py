@@ -0,0 +1,187 @@
+# =============================================================================
+# VFD-Motor-Simulation: Run Instrumentation
+# =============================================================================
+# Records, for one run, the wall time of each phase (solve, metrics, costs,
+# csv, export, figure, report), the ODE solver statistics of every start
+# (RHS and Jacobian evaluations, steps, step sizes) and the bytes written to
+# each output file, and emits them as one JSON record. While tracemalloc is
+# tracing (--profile), each phase also records its allocation peak.
+#
+# Off unless a run is wrapped in instrument(): every hook checks a single
+# module global and returns, phase() hands back a shared no-op context
+# manager, and the solvers only ask odeint for full_output while a record
+# is active, so uninstrumented runs do the same work as before.
+#
+# Usage:
+#   with instrument('v4') as record:
+#       result = simulate(config)
+#   write_record(record, 'runs.jsonl')      # one JSON line per run
+#   python -m vfd_simulation --instrument runs.jsonl
+#   python -m vfd_simulation.sweep --inertia 100,150,200 --instrument -
+# =============================================================================
+
+import json
+import os
+import sys
+import time as timer
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+
+import numpy as np
+
+# Record of the run in progress, or None when instrumentation is off
+_active = None
+
+_NO_PHASE = nullcontext()
+
+# =============================================================================
+# RECORDS
+# =============================================================================
+
+@dataclass
+class SolverStats:
+    method: str  # 'vfd', 'soft_starter'
+    backend: str  # 'odeint', 'solve_ivp'
+    rhs_evals: int
+    jacobian_evals: int
+    steps: int
+    step_min: float  # s
+    step_mean: float  # s
+    step_max: float  # s
+    method_switches: int = 0  # odeint (LSODA) Adams <-> BDF switches
+
+
+@dataclass
+class RunRecord:
+    label: str
+    started: str = field(default_factory=lambda: datetime.now().isoformat(timespec='seconds'))
+    tags: dict = field(default_factory=dict)
+    wall_time: float = 0.0  # s
+    phases: dict = field(default_factory=dict)  # phase -> s (summed over repeats)
+    solver: list = field(default_factory=list)  # SolverStats per start
+    bytes_written: dict = field(default_factory=dict)  # filename -> bytes
+    # Only while tracemalloc is tracing
+    memory_peak: int = 0  # bytes traced at the run's peak
+    memory_peaks: dict = field(default_factory=dict)  # phase -> peak bytes above its start
+
+    def as_dict(self):
+        return asdict(self)
+
+# =============================================================================
+# HOOKS
+# =============================================================================
+
+def enabled():
+    return _active is not None
+
+
+def _update_memory_peak(record):
+    # Folds the tracemalloc peak since the last reset into the run's peak
+    record.memory_peak = max(record.memory_peak, tracemalloc.get_traced_memory()[1])
+
+
+class _Phase:
+    __slots__ = ('record', 'name', 'start', 'base')
+
+    def __init__(self, record, name):
+        self.record = record
+        self.name = name
+        self.base = None
+
+    def __enter__(self):
+        if tracemalloc.is_tracing():
+            _update_memory_peak(self.record)
+            tracemalloc.reset_peak()
+            self.base = tracemalloc.get_traced_memory()[0]
+        self.start = timer.perf_counter()
+
+    def __exit__(self, *exc):
+        phases = self.record.phases
+        phases[self.name] = phases.get(self.name, 0.0) + timer.perf_counter() - self.start
+        if self.base is not None and tracemalloc.is_tracing():
+            _update_memory_peak(self.record)
+            peaks = self.record.memory_peaks
+            peak = tracemalloc.get_traced_memory()[1] - self.base
+            peaks[self.name] = max(peaks.get(self.name, 0), peak)
+
+
+def phase(name):
+    # with phase('solve'): ... adds the block's wall time to the record
+    if _active is None:
+        return _NO_PHASE
+    return _Phase(_active, name)
+
+
+def record_odeint(method, time, info):
+    # info is odeint's full_output dict. odeint reports the last step size
+    # used before each output point ('hu'), not every step, so step_min and
+    # step_max are taken over those; step_mean is the span over the steps.
+    if _active is None:
+        return
+    steps = int(info['nst'][-1])
+    used = info['hu'][info['hu'] > 0]
+    _active.solver.append(SolverStats(
+        method, 'odeint',
+        rhs_evals=int(info['nfe'][-1]),
+        jacobian_evals=int(info['nje'][-1]),
+        steps=steps,
+        step_min=float(used.min()) if used.size else 0.0,
+        step_mean=float((time[-1] - time[0]) / steps) if steps else 0.0,
+        step_max=float(used.max()) if used.size else 0.0,
+        method_switches=int(np.count_nonzero(np.diff(info['mused']))),
+    ))
+
+
+def record_solve_ivp(method, solution):
+    # solve_ivp keeps every accepted step time in solution.t
+    if _active is None:
+        return
+    steps = np.diff(solution.t)
+    _active.solver.append(SolverStats(
+        method, 'solve_ivp',
+        rhs_evals=int(solution.nfev),
+        jacobian_evals=int(solution.njev),
+        steps=len(steps),
+        step_min=float(steps.min()) if steps.size else 0.0,
+        step_mean=float(steps.mean()) if steps.size else 0.0,
+        step_max=float(steps.max()) if steps.size else 0.0,
+    ))
+
+
+def record_file(filename):
+    # Call after a file has been written and closed
+    if _active is None:
+        return
+    _active.bytes_written[str(filename)] = os.path.getsize(filename)
+
+# =============================================================================
+# RUNS
+# =============================================================================
+
+@contextmanager
+def instrument(label='run', **tags):
+    # Makes a new RunRecord the active one for the block; wall_time covers
+    # the whole block. Nested runs restore the outer record on exit.
+    global _active
+    outer, record = _active, RunRecord(label, tags=tags)
+    _active = record
+    start = timer.perf_counter()
+    try:
+        yield record
+    finally:
+        record.wall_time = timer.perf_counter() - start
+        if tracemalloc.is_tracing():
+            _update_memory_peak(record)
+        _active = outer
+
+
+def write_record(record, filename):
+    # Appends the record as one JSON line; '-' writes it to stderr
+    line = json.dumps(record.as_dict() if isinstance(record, RunRecord) else record)
+    if filename == '-':
+        print(line, file=sys.stderr)
+        return
+    with open(filename, 'a') as jsonfile:
+        jsonfile.write(line + '\n')
@@ -0,0 +1,221 @@
+# =============================================================================
+# VFD-Motor-Simulation: v2.0.0 and v3.0.0 Models
+# =============================================================================
+# The earlier scripts post-process the VFD start differently from v4 (line
+# voltage for input power, 100% slip before the drive starts) and v3 compares
+# against a DOL start instead of a soft starter. v2 also predates the load
+# models and uses a fixed load profile. Both are kept here so the old scripts
+# reproduce their published numbers.
+# =============================================================================
+
+from dataclasses import dataclass
+
+import numpy as np
+from scipy.integrate import odeint
+
+from .config import DEFAULT_CONFIG, SimulationConfig
+from .instrumentation import enabled, phase, record_odeint
+from .metrics import trapezoid
+from .models import (
+    TORQUE_A, TORQUE_B, TORQUE_C, get_load_torque_array, vfd_freq_array,
+    make_vfd_dynamics, vfd_freq_func, vfd_motor_jacobian,
+)
+from .simulation import StartTrajectory
+
+# =============================================================================
+# v2 MOTOR DYNAMICS MODEL
+# =============================================================================
+
+def v2_motor_dynamics(state, t, load_torque, ramp_time, config=DEFAULT_CONFIG):
+    omega_rad = state[0]
+    freq = vfd_freq_func(t, ramp_time, config)
+
+    # Handle very low frequency startup
+    if freq < 1.0:  # Below 1 Hz
+        # At very low frequencies, provide starting torque
+        sync_speed_rad = (120 * freq / config.poles) * (2 * np.pi / 60)
+        if sync_speed_rad < 0.1:
+            return [0]
+        slip = (sync_speed_rad - omega_rad) / sync_speed_rad
+        slip = np.clip(slip, 0, 1.0)
+        # Provide higher torque at startup with voltage boost
+        torque_em = config.rated_torque * 2.5 * slip * (1 + config.v_boost * 5)
+        d_omega_dt = (torque_em - load_torque * 0.3 - config.damping * omega_rad) / config.inertia
+        return [d_omega_dt]
+
+    # Calculate slip for normal operation
+    sync_speed_rad = (120 * freq / config.poles) * (2 * np.pi / 60)
+    slip = (sync_speed_rad - omega_rad) / sync_speed_rad
+
+    # Limit slip to reasonable range
+    slip = np.clip(slip, 0, 1.0)
+
+    # Electromagnetic torque using torque-slip characteristic
+    a = TORQUE_A
+    b = TORQUE_B
+    c = TORQUE_C
+
+    torque_ratio = (a * slip) / (slip**2 + b * slip + c)
+    torque_em = config.rated_torque * torque_ratio
+
+    # Scale torque with frequency for V/f control
+    freq_ratio = freq / config.base_freq
+    torque_em *= freq_ratio
+
+    # Add voltage boost effect at low frequencies (1-10 Hz)
+    if freq < config.base_freq * 0.15:
+        boost_factor = 1 + config.v_boost * (1 - freq / (config.base_freq * 0.15))
+        torque_em *= boost_factor
+
+    # Reduce load torque at low speeds (many loads are speed-dependent)
+    speed_ratio = omega_rad / config.sync_speed_rad if config.sync_speed_rad > 0 else 0
+    effective_load = load_torque * (0.3 + 0.7 * speed_ratio)
+
+    # Equation of motion
+    d_omega_dt = (torque_em - effective_load - config.damping * omega_rad) / config.inertia
+    return [d_omega_dt]
+
+# =============================================================================
+# v2/v3 VFD POST-PROCESSING
+# =============================================================================
+
+def calculate_vfd_metrics(time, omega_rad, ramp_time, config=DEFAULT_CONFIG):
+    # Returns frequency, slip, torque, load torque, current, power out,
+    # power in and efficiency. Input power uses the line voltage, and slip
+    # reads 100% until the drive output reaches 0.5 Hz.
+    freq = vfd_freq_array(time, ramp_time, config)
+    active = freq >= 0.5
+
+    sync_speed_rad = (120 * freq / config.poles) * (2 * np.pi / 60)
+    sync_safe = np.where(sync_speed_rad > 0, sync_speed_rad, 1.0)
+    s = np.where(sync_speed_rad > 0, (sync_speed_rad - omega_rad) / sync_safe, 1.0)
+    s = np.clip(s, 0, 1.0)
+    slip = np.where(active, s * 100, 100)
+
+    # Calculate electromagnetic torque
+    a, b, c = TORQUE_A, TORQUE_B, TORQUE_C
+    torque_ratio = (a * s) / (s**2 + b * s + c)
+    torque = config.rated_torque * torque_ratio * (freq / config.base_freq)
+    boost_factor = 1 + config.v_boost * (1 - freq / (config.base_freq * 0.15))
+    torque *= np.where(freq < config.base_freq * 0.15, boost_factor, 1.0)
+    torque = np.where(freq < 1.0, config.rated_torque * 2.5 * s * (1 + config.v_boost * 5), torque)
+
+    # Calculate load torque based on type
+    if config.sync_speed_rad > 0:
+        speed_ratio = omega_rad / config.sync_speed_rad
+    else:
+        speed_ratio = np.zeros_like(omega_rad)
+    load_torque = get_load_torque_array(speed_ratio, config.load_torque, config.load_type)
+
+    # Calculate current
+    torque_component = config.fla * (torque / config.rated_torque)
+    magnetizing_component = config.fla * 0.3
+    current = np.sqrt(torque_component**2 + magnetizing_component**2)
+
+    # Calculate power and efficiency
+    power_out = (omega_rad * load_torque) / 1000  # kW
+    power_in = (np.sqrt(3) * config.voltage * current * config.power_factor) / 1000  # kW
+    efficiency = np.zeros_like(power_in)
+    np.divide(power_out, power_in, out=efficiency, where=power_in > 0)
+    efficiency *= 100
+
+    for array in (torque, load_torque, current, power_out, power_in, efficiency):
+        array[~active] = 0
+
+    return freq, slip, torque, load_torque, current, power_out, power_in, efficiency
+
+# =============================================================================
+# DOL (DIRECT-ON-LINE) STARTING SIMULATION
+# =============================================================================
+
+def simulate_dol_start(config=DEFAULT_CONFIG):
+    dol_time = np.linspace(0, 5, 500)  # DOL typically takes 2-5 seconds
+
+    # Exponential approach to rated speed
+    tau = 2.0  # Time constant
+    speed_ratio = 1 - np.exp(-dol_time / tau)
+    dol_omega = config.sync_speed_rpm * 0.97 * speed_ratio
+
+    # Current decreases as motor accelerates
+    slip_ratio = 1 - speed_ratio * 0.97
+    dol_current = config.fla * (1 + 5.5 * slip_ratio)
+    dol_torque = config.rated_torque * (2.5 * slip_ratio + 1.0)
+
+    # Standstill: typical inrush current and starting torque
+    at_rest = dol_time == 0
+    dol_omega[at_rest] = 0
+    dol_current[at_rest] = config.fla * 6.5
+    dol_torque[at_rest] = config.rated_torque * 2.5
+
+    return dol_time, dol_omega, dol_current, dol_torque
+
+# =============================================================================
+# v2/v3 SIMULATIONS
+# =============================================================================
+
+@dataclass
+class VfdDolResult:
+    config: SimulationConfig
+    vfd: StartTrajectory
+    dol_time: np.ndarray  # s
+    dol_omega_rpm: np.ndarray  # RPM
+    dol_current: np.ndarray  # A
+    dol_torque: np.ndarray  # Nm
+
+    @property
+    def dol_power(self):
+        return (np.sqrt(3) * self.config.voltage * self.dol_current * self.config.power_factor) / 1000
+
+    @property
+    def dol_energy_kj(self):
+        return trapezoid(self.dol_power, self.dol_time)
+
+    @property
+    def avg_efficiency(self):
+        # Average efficiency during ramp
+        efficiency = self.vfd.efficiency
+        return np.mean(efficiency[efficiency > 0])
+
+
+def _vfd_trajectory(time, omega_rad, config):
+    freq, slip, torque, load, current, power_out, power_in, efficiency = \
+        calculate_vfd_metrics(time, omega_rad, config.vfd_ramp_time, config)
+    return StartTrajectory(time, omega_rad, current, torque, slip, load_torque=load,
+                           power_in=power_in, power_out=power_out,
+                           efficiency=efficiency, frequency=freq)
+
+
+def _odeint(dynamics, time, **kwargs):
+    # VFD start from rest; records solver statistics when instrumented
+    full_output = enabled()
+    solution = odeint(dynamics, [0], time, full_output=full_output, **kwargs)
+    if full_output:
+        solution, info = solution
+        record_odeint('vfd', time, info)
+    return solution
+
+
+def simulate_v3(config=DEFAULT_CONFIG):
+    # VFD start with the selected load type, compared against a DOL start
+    time = np.linspace(0, config.vfd_ramp_time, config.time_points)
+    args = (config.load_torque, config.load_type, config.vfd_ramp_time, config)
+    with phase('solve'):
+        solution = _odeint(make_vfd_dynamics(*args), time,
+                           Dfun=lambda y, t: vfd_motor_jacobian(y, t, *args))
+    with phase('metrics'):
+        vfd = _vfd_trajectory(time, solution[:, 0], config)
+        dol = simulate_dol_start(config)
+    return VfdDolResult(config, vfd, *dol)
+
+
+def simulate_v2(config=DEFAULT_CONFIG):
+    # VFD start against the fixed v2 load profile. power_out holds the
+    # electromagnetic power (torque x speed) that v2 integrates for energy.
+    time = np.linspace(0, config.vfd_ramp_time, config.time_points)
+    with phase('solve'):
+        solution = _odeint(v2_motor_dynamics, time,
+                           args=(config.load_torque, config.vfd_ramp_time, config))
+    with phase('metrics'):
+        vfd = _vfd_trajectory(time, solution[:, 0], config)
+        vfd.power_out = (vfd.torque * vfd.omega_rad) / 1000  # kW
+    return vfd
@@ -0,0 +1,141 @@
+# =============================================================================
+# VFD-Motor-Simulation: Performance Metrics
+# =============================================================================
+
+import numpy as np
+
+from .config import DEFAULT_CONFIG
+from .models import (
+    TORQUE_A, TORQUE_B, TORQUE_C, get_load_torque, get_load_torque_array,
+    get_load_torque_table_array, soft_start_voltage_array, soft_start_voltage_func,
+    torque_ratio_table, vfd_freq_array, vfd_freq_func, vfd_voltage_array, vfd_voltage_func,
+)
+
+# np.trapz was renamed np.trapezoid in NumPy 2.0
+trapezoid = getattr(np, 'trapezoid', None) or np.trapz
+
+# =============================================================================
+# CALCULATE PERFORMANCE METRICS
+# =============================================================================
+
+def calculate_metrics(time, omega_rad, method='vfd', ramp_time=30,
+                      base_load_torque=None, load_type=None, config=DEFAULT_CONFIG):
+    # time/omega_rad may be 2-D (scenario x sample) with ramp_time and
+    # base_load_torque given as (n_scenarios, 1) columns
+    time = np.asarray(time, dtype=float)
+    omega_rad = np.asarray(omega_rad, dtype=float)
+    if base_load_torque is None:
+        base_load_torque = config.load_torque
+    if load_type is None:
+        load_type = config.load_type
+
+    if method == 'vfd':
+        freq = vfd_freq_array(time, ramp_time, config)
+        # Below 0.5 Hz the drive is treated as not yet producing output
+        active = freq >= 0.5
+        sync_speed_rad = (120 * freq / config.poles) * (2 * np.pi / 60)
+        voltage_array = vfd_voltage_array(freq, config)
+    else:  # soft starter
+        active = np.ones(np.shape(omega_rad), dtype=bool)
+        sync_speed_rad = np.full(np.shape(omega_rad), config.sync_speed_rad)
+        voltage_array = soft_start_voltage_array(time, ramp_time, config)
+
+    # Inactive samples have zero sync speed; give them a dummy denominator and
+    # zero them out at the end
+    sync_safe = np.where(sync_speed_rad > 0, sync_speed_rad, 1.0)
+    s = np.where(sync_speed_rad > 0, (sync_speed_rad - omega_rad) / sync_safe, 1.0)
+    s = np.clip(s, 0, 1.0)
+    slip = s * 100
+
+    # Calculate torque
+    if config.lookup_tolerance is not None:
+        torque_ratio = torque_ratio_table(config.lookup_tolerance)(s)
+    else:
+        a, b, c = TORQUE_A, TORQUE_B, TORQUE_C
+        torque_ratio = (a * s) / (s**2 + b * s + c)
+
+    if method == 'vfd':
+        freq_ratio = freq / config.base_freq
+        torque = config.rated_torque * torque_ratio * freq_ratio
+        boost = 1 + config.v_boost * (1 - freq / (config.base_freq * 0.15))
+        torque *= np.where(freq < config.base_freq * 0.15, boost, 1.0)
+    else:  # soft starter
+        voltage_ratio = voltage_array / config.voltage
+        torque = config.rated_torque * torque_ratio * (voltage_ratio ** 2)
+
+    # Calculate load torque
+    if config.sync_speed_rad > 0:
+        speed_ratio = omega_rad / config.sync_speed_rad
+    else:
+        speed_ratio = np.zeros_like(omega_rad)
+    if config.lookup_tolerance is not None:
+        load_torque_array = get_load_torque_table_array(speed_ratio, base_load_torque, load_type,
+                                                        config.lookup_tolerance)
+    else:
+        load_torque_array = get_load_torque_array(speed_ratio, base_load_torque, load_type)
+
+    # Calculate current (simplified model)
+    torque_component = config.fla * (torque / config.rated_torque)
+    magnetizing_component = config.fla * 0.3
+    current = np.sqrt(torque_component**2 + magnetizing_component**2)
+
+    # For soft starter, current is higher due to reduced voltage operation
+    if method == 'soft_starter':
+        voltage_ratio = voltage_array / config.voltage
+        # Current increases as voltage decreases (maintaining power)
+        ramping = (time < ramp_time) & (voltage_ratio > 0.3)
+        current = np.where(ramping, current * (1.2 / voltage_ratio), current)
+
+    # Calculate power
+    power_out = (omega_rad * load_torque_array) / 1000
+    power_in = (np.sqrt(3) * voltage_array * current * config.power_factor) / 1000
+
+    efficiency = np.zeros_like(power_in)
+    np.divide(power_out, power_in, out=efficiency, where=power_in > 0)
+    efficiency *= 100
+
+    if method == 'vfd':
+        for array in (current, torque, slip, load_torque_array, power_in,
+                      power_out, efficiency, voltage_array):
+            array[~active] = 0
+
+    return current, torque, slip, load_torque_array, power_in, power_out, efficiency, voltage_array
+
+def start_current(method, t, omega_rad, ramp_time, config=DEFAULT_CONFIG):
+    # Scalar twin of the current in calculate_metrics, for solver event
+    # functions evaluated one point at a time
+    a, b, c = TORQUE_A, TORQUE_B, TORQUE_C
+    if method == 'vfd':
+        freq = vfd_freq_func(t, ramp_time, config)
+        if freq < 0.5:
+            return 0.0
+        sync_speed_rad = (120 * freq / config.poles) * (2 * np.pi / 60)
+        s = min(max((sync_speed_rad - omega_rad) / sync_speed_rad, 0.0), 1.0)
+        torque_ratio = (a * s) / (s**2 + b * s + c) * (freq / config.base_freq)
+        if freq < config.base_freq * 0.15:
+            torque_ratio *= 1 + config.v_boost * (1 - freq / (config.base_freq * 0.15))
+    else:  # soft starter
+        voltage_ratio = soft_start_voltage_func(t, ramp_time, config) / config.voltage
+        s = min(max((config.sync_speed_rad - omega_rad) / config.sync_speed_rad, 0.0), 1.0)
+        torque_ratio = (a * s) / (s**2 + b * s + c) * voltage_ratio**2
+
+    current = config.fla * np.sqrt(torque_ratio**2 + 0.3**2)
+    if method == 'soft_starter' and t < ramp_time and voltage_ratio > 0.3:
+        current *= 1.2 / voltage_ratio
+    return current
+
+def start_power(method, t, omega_rad, ramp_time, config=DEFAULT_CONFIG):
+    # Scalar twin of the current (A), input power and output power (kW) in
+    # calculate_metrics, for integrating them alongside the speed
+    if method == 'vfd':
+        freq = vfd_freq_func(t, ramp_time, config)
+        if freq < 0.5:
+            return 0.0, 0.0, 0.0
+        voltage = vfd_voltage_func(freq, config)
+    else:  # soft starter
+        voltage = soft_start_voltage_func(t, ramp_time, config)
+    current = start_current(method, t, omega_rad, ramp_time, config)
+    speed_ratio = omega_rad / config.sync_speed_rad if config.sync_speed_rad > 0 else 0.0
+    power_out = omega_rad * get_load_torque(speed_ratio, config.load_torque, config.load_type) / 1000
+    power_in = np.sqrt(3) * voltage * current * config.power_factor / 1000
+    return current, power_in, power_out
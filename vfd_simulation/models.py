@@ -0,0 +1,516 @@
+# =============================================================================
+# VFD-Motor-Simulation: Load, Control and Motor Dynamics Models
+# =============================================================================
+# Scalar functions are what odeint calls one point at a time; the *_array
+# counterparts evaluate a whole trajectory at once for post-processing.
+# =============================================================================
+
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+
+from .config import DEFAULT_CONFIG
+
+# Torque-slip characteristic: T/T_rated = a*s / (s^2 + b*s + c)
+TORQUE_A = 2.5  # Peak torque multiplier
+TORQUE_B = 0.15  # Torque curve shape
+TORQUE_C = 0.08  # Starting torque adjustment
+
+# Lookup tables span [0, 1] with 10 * 2**k intervals, k raised until the
+# tolerance is met: 0.1 is always a grid point, and a finer table's grid
+# contains every point of a coarser one
+LOOKUP_MIN_INTERVALS = 20
+LOOKUP_MAX_INTERVALS = 10 * 2**20
+
+# Below this speed ratio each load type is constant at its zero-speed torque
+# (the constant-power load steps at 10% speed)
+LOW_SPEED_RATIO = {
+    'constant_torque': 0.0,
+    'fan_pump': 0.0,
+    'constant_power': 0.1,
+}
+
+# =============================================================================
+# LOAD TORQUE MODELS
+# =============================================================================
+
+def get_load_torque(speed_ratio, base_torque, load_type='constant_torque'):
+    speed_ratio = max(0, min(speed_ratio, 1.0))
+
+    if load_type == 'constant_torque':
+        # Conveyors, hoists, positive displacement pumps
+        return base_torque * (0.3 + 0.7 * speed_ratio)
+    elif load_type == 'fan_pump':
+        # Centrifugal fans and pumps (torque proportional to speed^2)
+        return base_torque * speed_ratio**2
+    elif load_type == 'constant_power':
+        # Machine tools, winders
+        if speed_ratio < 0.1:
+            return base_torque * 0.1 / 0.1  # Avoid division by zero
+        return base_torque * 1.0 / speed_ratio
+    else:
+        return base_torque * (0.3 + 0.7 * speed_ratio)
+
+def get_load_torque_array(speed_ratio, base_torque, load_type='constant_torque'):
+    speed_ratio = np.clip(speed_ratio, 0, 1.0)
+
+    if load_type == 'fan_pump':
+        return base_torque * speed_ratio**2
+    elif load_type == 'constant_power':
+        return np.where(speed_ratio < 0.1, base_torque * 0.1 / 0.1,
+                        base_torque * 1.0 / np.maximum(speed_ratio, 0.1))
+    else:  # constant_torque and unknown types
+        return base_torque * (0.3 + 0.7 * speed_ratio)
+
+def get_load_torque_slope(speed_ratio, base_torque, load_type='constant_torque'):
+    # d(load torque)/d(speed_ratio); zero where the speed ratio is clipped
+    if speed_ratio < 0 or speed_ratio > 1.0:
+        return 0.0
+
+    if load_type == 'fan_pump':
+        return base_torque * 2 * speed_ratio
+    elif load_type == 'constant_power':
+        if speed_ratio < 0.1:
+            return 0.0
+        return -base_torque * 1.0 / speed_ratio**2
+    else:  # constant_torque and unknown types
+        return base_torque * 0.7
+
+def get_load_torque_slope_array(speed_ratio, base_torque, load_type='constant_torque'):
+    speed_ratio = np.asarray(speed_ratio, dtype=float)
+    inside = (speed_ratio >= 0) & (speed_ratio <= 1.0)
+
+    if load_type == 'fan_pump':
+        slope = base_torque * 2 * speed_ratio
+    elif load_type == 'constant_power':
+        slope = np.where(speed_ratio < 0.1, 0.0,
+                         -base_torque * 1.0 / np.maximum(speed_ratio, 0.1)**2)
+    else:  # constant_torque and unknown types
+        slope = base_torque * 0.7 * np.ones_like(speed_ratio)
+    return np.where(inside, slope, 0.0)
+
+# =============================================================================
+# VFD CONTROL FUNCTIONS
+# =============================================================================
+
+def vfd_freq_func(t, ramp_time, config=DEFAULT_CONFIG):
+    if t <= ramp_time:
+        return config.base_freq * (t / ramp_time)
+    return config.base_freq
+
+def vfd_voltage_func(freq, config=DEFAULT_CONFIG):
+    base_voltage = config.voltage * (freq / config.base_freq)
+    if freq < config.base_freq * 0.1:  # Below 10% of base frequency
+        boost = config.voltage * config.v_boost * (1 - freq / (config.base_freq * 0.1))
+        return base_voltage + boost
+    return base_voltage
+
+def vfd_freq_array(time, ramp_time, config=DEFAULT_CONFIG):
+    return np.where(time <= ramp_time, config.base_freq * (time / ramp_time), config.base_freq)
+
+def vfd_voltage_array(freq, config=DEFAULT_CONFIG):
+    base_voltage = config.voltage * (freq / config.base_freq)
+    boost = config.voltage * config.v_boost * (1 - freq / (config.base_freq * 0.1))
+    return np.where(freq < config.base_freq * 0.1, base_voltage + boost, base_voltage)
+
+# =============================================================================
+# SOFT STARTER CONTROL FUNCTIONS
+# =============================================================================
+
+def soft_start_voltage_func(t, ramp_time, config=DEFAULT_CONFIG):
+    if t <= ramp_time:
+        # Voltage ramp from initial to full
+        initial = config.soft_start_initial_voltage
+        voltage_ratio = initial + (1 - initial) * (t / ramp_time)
+        return config.voltage * voltage_ratio
+    return config.voltage
+
+def soft_start_voltage_array(time, ramp_time, config=DEFAULT_CONFIG):
+    initial = config.soft_start_initial_voltage
+    voltage_ratio = initial + (1 - initial) * (time / ramp_time)
+    return np.where(time <= ramp_time, config.voltage * voltage_ratio, config.voltage)
+
+# =============================================================================
+# MOTOR DYNAMICS MODELS
+# =============================================================================
+
+def vfd_motor_dynamics(state, t, base_load_torque, load_type, ramp_time, config=DEFAULT_CONFIG):
+    omega_rad = state[0]
+    freq = vfd_freq_func(t, ramp_time, config)
+
+    # Handle very low frequency startup
+    if freq < 1.0:
+        sync_speed_rad = (120 * freq / config.poles) * (2 * np.pi / 60)
+        if sync_speed_rad < 0.1:
+            return [0]
+        slip = (sync_speed_rad - omega_rad) / sync_speed_rad
+        slip = np.clip(slip, 0, 1.0)
+        torque_em = config.rated_torque * 2.5 * slip * (1 + config.v_boost * 5)
+        speed_ratio = omega_rad / config.sync_speed_rad if config.sync_speed_rad > 0 else 0
+        effective_load = get_load_torque(speed_ratio, base_load_torque, load_type)
+        d_omega_dt = (torque_em - effective_load - config.damping * omega_rad) / config.inertia
+        return [d_omega_dt]
+
+    # Calculate slip for normal operation
+    sync_speed_rad = (120 * freq / config.poles) * (2 * np.pi / 60)
+    slip = (sync_speed_rad - omega_rad) / sync_speed_rad
+    slip = np.clip(slip, 0, 1.0)
+
+    # Electromagnetic torque using torque-slip characteristic
+    a = TORQUE_A
+    b = TORQUE_B
+    c = TORQUE_C
+
+    torque_ratio = (a * slip) / (slip**2 + b * slip + c)
+    torque_em = config.rated_torque * torque_ratio
+
+    # Scale torque with frequency for V/f control
+    freq_ratio = freq / config.base_freq
+    torque_em *= freq_ratio
+
+    # Add voltage boost effect at low frequencies
+    if freq < config.base_freq * 0.15:
+        boost_factor = 1 + config.v_boost * (1 - freq / (config.base_freq * 0.15))
+        torque_em *= boost_factor
+
+    # Calculate effective load based on load type
+    speed_ratio = omega_rad / config.sync_speed_rad if config.sync_speed_rad > 0 else 0
+    effective_load = get_load_torque(speed_ratio, base_load_torque, load_type)
+
+    # Equation of motion
+    d_omega_dt = (torque_em - effective_load - config.damping * omega_rad) / config.inertia
+    return [d_omega_dt]
+
+def soft_start_motor_dynamics(state, t, base_load_torque, load_type, ramp_time, config=DEFAULT_CONFIG):
+    omega_rad = state[0]
+    voltage = soft_start_voltage_func(t, ramp_time, config)
+    voltage_ratio = voltage / config.voltage
+
+    # Motor runs at full frequency, reduced voltage
+    sync_speed_rad = config.sync_speed_rad
+    slip = (sync_speed_rad - omega_rad) / sync_speed_rad
+    slip = np.clip(slip, 0, 1.0)
+
+    # Torque proportional to voltage squared for reduced voltage operation
+    a = TORQUE_A
+    b = TORQUE_B
+    c = TORQUE_C
+
+    torque_ratio = (a * slip) / (slip**2 + b * slip + c)
+    # Key difference: torque scales with V^2 in soft starter
+    torque_em = config.rated_torque * torque_ratio * (voltage_ratio ** 2)
+
+    speed_ratio = omega_rad / config.sync_speed_rad if config.sync_speed_rad > 0 else 0
+    effective_load = get_load_torque(speed_ratio, base_load_torque, load_type)
+
+    d_omega_dt = (torque_em - effective_load - config.damping * omega_rad) / config.inertia
+    return [d_omega_dt]
+
+# =============================================================================
+# COMPILED MOTOR DYNAMICS
+# =============================================================================
+# make_vfd_dynamics / make_soft_start_dynamics resolve the load model and all
+# per-scenario constants once and return rhs(state, t) -> float for the
+# solvers. The hot path is plain float arithmetic: no string comparisons, no
+# np.clip, no list per call. The operations and their order match the
+# reference functions above, so the solutions are bit-identical.
+
+def make_load_torque(base_torque, load_type='constant_torque'):
+    # Returns load(speed_ratio) -> float for an unclipped speed ratio
+    if load_type == 'fan_pump':
+        def load(speed_ratio):
+            speed_ratio = 0 if speed_ratio < 0 else 1.0 if speed_ratio > 1.0 else speed_ratio
+            return base_torque * speed_ratio**2
+    elif load_type == 'constant_power':
+        low_speed_torque = base_torque * 0.1 / 0.1
+        def load(speed_ratio):
+            if speed_ratio < 0.1:
+                return low_speed_torque
+            return base_torque * 1.0 / (1.0 if speed_ratio > 1.0 else speed_ratio)
+    else:  # constant_torque and unknown types
+        def load(speed_ratio):
+            speed_ratio = 0 if speed_ratio < 0 else 1.0 if speed_ratio > 1.0 else speed_ratio
+            return base_torque * (0.3 + 0.7 * speed_ratio)
+    return load
+
+def make_vfd_dynamics(base_load_torque, load_type, ramp_time, config=DEFAULT_CONFIG):
+    load = make_load_torque(base_load_torque, load_type)
+    base_freq = config.base_freq
+    poles = config.poles
+    rad_per_rpm = 2 * np.pi / 60
+    rated_torque = config.rated_torque
+    low_freq_gain = rated_torque * 2.5
+    low_freq_boost = 1 + config.v_boost * 5
+    v_boost = config.v_boost
+    boost_freq = base_freq * 0.15
+    motor_sync_speed = config.sync_speed_rad
+    damping = config.damping
+    inertia = config.inertia
+    a, b, c = TORQUE_A, TORQUE_B, TORQUE_C
+
+    def rhs(state, t):
+        omega_rad = state[0]
+        freq = base_freq * (t / ramp_time) if t <= ramp_time else base_freq
+        sync_speed_rad = (120 * freq / poles) * rad_per_rpm
+
+        if freq < 1.0:
+            if sync_speed_rad < 0.1:
+                return 0.0
+            slip = (sync_speed_rad - omega_rad) / sync_speed_rad
+            slip = 0 if slip < 0 else 1.0 if slip > 1.0 else slip
+            torque_em = low_freq_gain * slip * low_freq_boost
+        else:
+            slip = (sync_speed_rad - omega_rad) / sync_speed_rad
+            slip = 0 if slip < 0 else 1.0 if slip > 1.0 else slip
+            torque_em = rated_torque * ((a * slip) / (slip**2 + b * slip + c))
+            torque_em *= freq / base_freq
+            if freq < boost_freq:
+                torque_em *= 1 + v_boost * (1 - freq / boost_freq)
+
+        effective_load = load(omega_rad / motor_sync_speed)
+        return (torque_em - effective_load - damping * omega_rad) / inertia
+    return rhs
+
+def make_soft_start_dynamics(base_load_torque, load_type, ramp_time, config=DEFAULT_CONFIG):
+    load = make_load_torque(base_load_torque, load_type)
+    voltage = config.voltage
+    initial = config.soft_start_initial_voltage
+    rated_torque = config.rated_torque
+    sync_speed_rad = config.sync_speed_rad
+    damping = config.damping
+    inertia = config.inertia
+    a, b, c = TORQUE_A, TORQUE_B, TORQUE_C
+
+    def rhs(state, t):
+        omega_rad = state[0]
+        if t <= ramp_time:
+            voltage_ratio = (voltage * (initial + (1 - initial) * (t / ramp_time))) / voltage
+        else:
+            voltage_ratio = 1.0
+        slip = (sync_speed_rad - omega_rad) / sync_speed_rad
+        slip = 0 if slip < 0 else 1.0 if slip > 1.0 else slip
+        torque_ratio = (a * slip) / (slip**2 + b * slip + c)
+        torque_em = rated_torque * torque_ratio * (voltage_ratio ** 2)
+        effective_load = load(omega_rad / sync_speed_rad)
+        return (torque_em - effective_load - damping * omega_rad) / inertia
+    return rhs
+
+# =============================================================================
+# LOOKUP TABLES
+# =============================================================================
+# Dense tables of torque ratio vs slip and load factor (per unit of base load
+# torque) vs speed ratio, interpolated linearly on a uniform grid, so a lookup
+# is an index computation and one multiply-add. Tables are built once per
+# tolerance (and load type) and shared by every configuration using them.
+
+@dataclass(frozen=True)
+class LookupTable:
+    values: np.ndarray  # at linspace(0, 1, intervals + 1)
+    slopes: np.ndarray  # values[i + 1] - values[i]; 0 past the last point
+    max_error: float  # largest interpolation error measured while building
+
+    @property
+    def intervals(self):
+        return len(self.values) - 1
+
+    def __call__(self, x):
+        # Interpolate at x (array), clipped to [0, 1]
+        position = np.clip(x, 0.0, 1.0) * self.intervals
+        index = position.astype(np.intp)
+        return self.values[index] + self.slopes[index] * (position - index)
+
+    def resample(self, intervals):
+        # (values, slopes) as lists on a finer grid containing this one's
+        # points; interpolating them gives exactly the same function
+        values = self(np.linspace(0.0, 1.0, intervals + 1))
+        return values.tolist(), np.append(np.diff(values), 0.0).tolist()
+
+def build_lookup_table(func, tolerance):
+    # Tabulate the vectorized func on [0, 1] with the fewest intervals whose
+    # linear interpolation stays within tolerance, checked at the quarter
+    # points of every interval where the error peaks
+    intervals = LOOKUP_MIN_INTERVALS
+    while True:
+        values = func(np.linspace(0.0, 1.0, intervals + 1))
+        table = LookupTable(values, np.append(np.diff(values), 0.0), 0.0)
+        check = np.linspace(0.0, 1.0, 4 * intervals + 1)
+        max_error = float(np.max(np.abs(table(check) - func(check))))
+        if max_error <= tolerance:
+            return LookupTable(table.values, table.slopes, max_error)
+        if intervals >= LOOKUP_MAX_INTERVALS:
+            raise ValueError(f'lookup tolerance {tolerance:g} needs more than '
+                             f'{LOOKUP_MAX_INTERVALS} intervals (error {max_error:.3g})')
+        intervals *= 2
+
+@lru_cache(maxsize=None)
+def torque_ratio_table(tolerance):
+    # T/T_rated vs slip
+    return build_lookup_table(
+        lambda slip: (TORQUE_A * slip) / (slip**2 + TORQUE_B * slip + TORQUE_C), tolerance)
+
+@lru_cache(maxsize=None)
+def load_factor_table(load_type, tolerance):
+    # Load torque per unit of base torque vs speed ratio. Below
+    # LOW_SPEED_RATIO the table continues the curve without its step; callers
+    # use the zero-speed torque there.
+    low_speed_ratio = LOW_SPEED_RATIO.get(load_type, 0.0)
+    return build_lookup_table(
+        lambda speed_ratio: get_load_torque_array(np.maximum(speed_ratio, low_speed_ratio),
+                                                  1.0, load_type), tolerance)
+
+def get_load_torque_table_array(speed_ratio, base_torque, load_type, tolerance):
+    # get_load_torque_array from the load factor table
+    low_speed_torque = get_load_torque(0.0, base_torque, load_type)
+    return np.where(speed_ratio < LOW_SPEED_RATIO.get(load_type, 0.0), low_speed_torque,
+                    base_torque * load_factor_table(load_type, tolerance)(speed_ratio))
+
+def make_vfd_table_dynamics(base_load_torque, load_type, ramp_time, config=DEFAULT_CONFIG):
+    # make_vfd_dynamics with the torque-slip and load curves interpolated
+    # inline from tables accurate to config.lookup_tolerance. Slip is taken
+    # against the ramping synchronous speed, so the two tables are indexed
+    # separately.
+    torque = torque_ratio_table(config.lookup_tolerance)
+    torque_values, torque_slopes = torque.resample(torque.intervals)
+    torque_intervals = float(torque.intervals)
+    load = load_factor_table(load_type, config.lookup_tolerance)
+    load_values = (base_load_torque * load.values).tolist()
+    load_slopes = (base_load_torque * load.slopes).tolist()
+    load_intervals = float(load.intervals)
+    low_speed_ratio = LOW_SPEED_RATIO.get(load_type, 0.0)
+    low_speed_load = get_load_torque(0.0, base_load_torque, load_type)
+
+    base_freq = config.base_freq
+    poles = config.poles
+    rad_per_rpm = 2 * np.pi / 60
+    rated_torque = config.rated_torque
+    low_freq_gain = rated_torque * 2.5
+    low_freq_boost = 1 + config.v_boost * 5
+    v_boost = config.v_boost
+    boost_freq = base_freq * 0.15
+    motor_sync_speed = config.sync_speed_rad
+    damping = config.damping
+    inertia = config.inertia
+
+    def rhs(state, t):
+        omega_rad = state[0]
+        freq = base_freq * (t / ramp_time) if t <= ramp_time else base_freq
+        sync_speed_rad = (120 * freq / poles) * rad_per_rpm
+
+        if freq < 1.0:
+            if sync_speed_rad < 0.1:
+                return 0.0
+            slip = (sync_speed_rad - omega_rad) / sync_speed_rad
+            slip = 0 if slip < 0 else 1.0 if slip > 1.0 else slip
+            torque_em = low_freq_gain * slip * low_freq_boost
+        else:
+            position = (sync_speed_rad - omega_rad) / sync_speed_rad * torque_intervals
+            position = 0.0 if position < 0 else torque_intervals if position > torque_intervals else position
+            i = int(position)
+            torque_em = rated_torque * (torque_values[i] + torque_slopes[i] * (position - i))
+            torque_em *= freq / base_freq
+            if freq < boost_freq:
+                torque_em *= 1 + v_boost * (1 - freq / boost_freq)
+
+        speed_ratio = omega_rad / motor_sync_speed
+        if speed_ratio < low_speed_ratio:
+            effective_load = low_speed_load
+        else:
+            position = load_intervals if speed_ratio > 1.0 else speed_ratio * load_intervals
+            i = int(position)
+            effective_load = load_values[i] + load_slopes[i] * (position - i)
+        return (torque_em - effective_load - damping * omega_rad) / inertia
+    return rhs
+
+def make_soft_start_table_dynamics(base_load_torque, load_type, ramp_time, config=DEFAULT_CONFIG):
+    # make_soft_start_dynamics with tabulated torque-slip and load curves.
+    # Slip is 1 - speed ratio here, so both tables are resampled onto one
+    # speed-ratio grid (the finer of the two) and share a single index.
+    torque = torque_ratio_table(config.lookup_tolerance)
+    load = load_factor_table(load_type, config.lookup_tolerance)
+    intervals = max(torque.intervals, load.intervals)
+    slip_grid = 1.0 - np.linspace(0.0, 1.0, intervals + 1)
+    torque_values = config.rated_torque * torque(slip_grid)
+    torque_slopes = np.append(np.diff(torque_values), 0.0).tolist()
+    torque_values = torque_values.tolist()
+    load_values, load_slopes = load.resample(intervals)
+    load_values = [base_load_torque * value for value in load_values]
+    load_slopes = [base_load_torque * slope for slope in load_slopes]
+    low_speed_ratio = LOW_SPEED_RATIO.get(load_type, 0.0)
+    low_speed_load = get_load_torque(0.0, base_load_torque, load_type)
+
+    initial = config.soft_start_initial_voltage
+    scale = intervals / config.sync_speed_rad  # grid position per rad/s
+    top = float(intervals)
+    low_speed_omega = low_speed_ratio * config.sync_speed_rad
+    damping = config.damping
+    inertia = config.inertia
+
+    def rhs(state, t):
+        omega_rad = state[0]
+        voltage_ratio = initial + (1 - initial) * (t / ramp_time) if t <= ramp_time else 1.0
+        position = omega_rad * scale
+        position = 0.0 if position < 0 else top if position > top else position
+        i = int(position)
+        fraction = position - i
+        torque_em = (torque_values[i] + torque_slopes[i] * fraction) * (voltage_ratio * voltage_ratio)
+        if omega_rad < low_speed_omega:
+            effective_load = low_speed_load
+        else:
+            effective_load = load_values[i] + load_slopes[i] * fraction
+        return (torque_em - effective_load - damping * omega_rad) / inertia
+    return rhs
+
+# =============================================================================
+# MOTOR DYNAMICS JACOBIANS
+# =============================================================================
+# d(d_omega_dt)/d(omega_rad) of the dynamics above, branch for branch, as the
+# 1x1 matrix odeint's Dfun expects. Slip and speed ratio are clipped to
+# [0, 1]; outside that range their derivative is zero.
+
+def _torque_ratio_slope(slip):
+    # d/ds of a*s / (s^2 + b*s + c)
+    denominator = slip**2 + TORQUE_B * slip + TORQUE_C
+    return TORQUE_A * (TORQUE_C - slip**2) / denominator**2
+
+def _slip_slope(omega_rad, sync_speed_rad):
+    slip = (sync_speed_rad - omega_rad) / sync_speed_rad
+    return -1.0 / sync_speed_rad if 0 <= slip <= 1.0 else 0.0
+
+def _load_slope(omega_rad, base_load_torque, load_type, config):
+    if config.sync_speed_rad <= 0:
+        return 0.0
+    speed_ratio = omega_rad / config.sync_speed_rad
+    return get_load_torque_slope(speed_ratio, base_load_torque, load_type) / config.sync_speed_rad
+
+def vfd_motor_jacobian(state, t, base_load_torque, load_type, ramp_time, config=DEFAULT_CONFIG):
+    omega_rad = state[0]
+    freq = vfd_freq_func(t, ramp_time, config)
+    sync_speed_rad = (120 * freq / config.poles) * (2 * np.pi / 60)
+
+    if freq < 1.0:
+        if sync_speed_rad < 0.1:
+            return [[0.0]]
+        d_torque = config.rated_torque * 2.5 * (1 + config.v_boost * 5) * \
+            _slip_slope(omega_rad, sync_speed_rad)
+    else:
+        slip = np.clip((sync_speed_rad - omega_rad) / sync_speed_rad, 0, 1.0)
+        d_torque = config.rated_torque * _torque_ratio_slope(slip) * \
+            _slip_slope(omega_rad, sync_speed_rad) * (freq / config.base_freq)
+        if freq < config.base_freq * 0.15:
+            d_torque *= 1 + config.v_boost * (1 - freq / (config.base_freq * 0.15))
+
+    d_load = _load_slope(omega_rad, base_load_torque, load_type, config)
+    return [[(d_torque - d_load - config.damping) / config.inertia]]
+
+def soft_start_motor_jacobian(state, t, base_load_torque, load_type, ramp_time, config=DEFAULT_CONFIG):
+    omega_rad = state[0]
+    voltage_ratio = soft_start_voltage_func(t, ramp_time, config) / config.voltage
+
+    sync_speed_rad = config.sync_speed_rad
+    slip = np.clip((sync_speed_rad - omega_rad) / sync_speed_rad, 0, 1.0)
+    d_torque = config.rated_torque * _torque_ratio_slope(slip) * \
+        _slip_slope(omega_rad, sync_speed_rad) * (voltage_ratio ** 2)
+
+    d_load = _load_slope(omega_rad, base_load_torque, load_type, config)
+    return [[(d_torque - d_load - config.damping) / config.inertia]]
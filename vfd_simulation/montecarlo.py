@@ -0,0 +1,231 @@
+# =============================================================================
+# VFD-Motor-Simulation: Monte Carlo Uncertainty Analysis
+# =============================================================================
+# Samples the nameplate and load parameters from the given distributions,
+# runs the v4 comparison for every sample on a process pool (as sweep.py
+# does for grids) and reports percentiles of peak current and energy per
+# start, plus the probability that each starter exceeds a current limit.
+#
+# Quick Start:
+#   python -m vfd_simulation.montecarlo --samples 100000 \
+#       --efficiency normal:0.95,0.005 --power-factor uniform:0.85,0.90 \
+#       --inertia normal:150,15 --load-torque-factor triangular:0.65,0.75,0.85
+#
+# Distribution specs:
+#   normal:mean,std   uniform:low,high   triangular:low,mode,high   0.95 (fixed)
+# Samples outside a parameter's physical range (PARAMETER_BOUNDS) are clipped
+# to it.
+#
+# The default solver is 'numba' (falls back to odeint without Numba); at
+# ~0.5 ms per sample 1e5 samples take about a minute per core. Samples the
+# solver cannot integrate come back as NaN rows from the sweep; they are
+# counted and left out of the statistics.
+# =============================================================================
+
+import argparse
+import csv
+import warnings
+
+import numpy as np
+
+from .config import DEFAULT_CONFIG, LOAD_TYPES, SOLVERS
+from .sweep import run_sweep
+
+# Uncertain parameters: CLI option -> SimulationConfig field
+UNCERTAIN_PARAMETERS = {
+    'efficiency': 'efficiency',
+    'power-factor': 'power_factor',
+    'inertia': 'inertia',
+    'damping': 'damping',
+    'load-torque-factor': 'load_torque_factor',
+}
+
+# Physical range of each field; samples are clipped to it
+PARAMETER_BOUNDS = {
+    'efficiency': (1e-3, 1.0),
+    'power_factor': (1e-3, 1.0),
+    'inertia': (1e-3, np.inf),  # kg*m^2
+    'damping': (0.0, np.inf),  # N*m*s/rad
+    'load_torque_factor': (0.0, np.inf),
+}
+
+# Distribution name -> number of parameters
+DISTRIBUTIONS = {
+    'normal': 2,  # mean, std
+    'uniform': 2,  # low, high
+    'triangular': 3,  # low, mode, high
+}
+
+REPORT_COLUMNS = (
+    'vfd_peak_current', 'ss_peak_current',  # A
+    'vfd_energy_kj', 'ss_energy_kj',  # kJ per start
+)
+
+DEFAULT_PERCENTILES = (5, 50, 95)
+
+# =============================================================================
+# SAMPLING
+# =============================================================================
+
+def parse_distribution(spec):
+    # 'normal:0.95,0.01' -> ('normal', (0.95, 0.01)); '0.95' -> ('fixed', (0.95,))
+    if ':' not in spec:
+        return 'fixed', (float(spec),)
+    name, _, values = spec.partition(':')
+    if name not in DISTRIBUTIONS:
+        raise ValueError(f'unknown distribution {name!r} in {spec!r}; '
+                         f'use one of {", ".join(DISTRIBUTIONS)}')
+    params = tuple(float(value) for value in values.split(','))
+    if len(params) != DISTRIBUTIONS[name]:
+        raise ValueError(f'{name} takes {DISTRIBUTIONS[name]} values: {spec!r}')
+    return name, params
+
+def draw(distribution, n_samples, rng):
+    name, params = distribution
+    if name == 'fixed':
+        return np.full(n_samples, params[0])
+    if name == 'normal':
+        return rng.normal(params[0], params[1], n_samples)
+    if name == 'uniform':
+        return rng.uniform(params[0], params[1], n_samples)
+    return rng.triangular(params[0], params[1], params[2], n_samples)
+
+def sample_parameters(distributions, n_samples, seed=None):
+    # Returns ({field: samples}, {field: number clipped to PARAMETER_BOUNDS})
+    # for {field: (name, params)}
+    rng = np.random.default_rng(seed)
+    samples, clipped = {}, {}
+    for field, distribution in distributions.items():
+        values = draw(distribution, n_samples, rng)
+        low, high = PARAMETER_BOUNDS[field]
+        clipped[field] = int(np.count_nonzero((values < low) | (values > high)))
+        samples[field] = np.clip(values, low, high)
+    return samples, clipped
+
+# =============================================================================
+# MONTE CARLO EXECUTION
+# =============================================================================
+
+def monte_carlo(distributions, n_samples, base_config=DEFAULT_CONFIG, workers=None, seed=None):
+    # Returns (samples, results, clipped): {field: array} of the sampled
+    # parameters, {column: array} of the sweep summary metrics per sample,
+    # and the clip counts from sample_parameters
+    samples, clipped = sample_parameters(distributions, n_samples, seed)
+    fields = list(samples)
+    configs = [base_config.replace(**dict(zip(fields, values)))
+               for values in zip(*(samples[field].tolist() for field in fields))]
+    summaries = run_sweep(configs, workers)
+    results = {column: np.array([summary[column] for summary in summaries])
+               for column in summaries[0]}
+    return samples, results, clipped
+
+def failed_samples(results, columns=REPORT_COLUMNS):
+    # Number of samples with a NaN result (starts the solver could not integrate)
+    return int(np.count_nonzero(np.isnan(np.stack([results[column] for column in columns])).any(axis=0)))
+
+def percentile_table(results, percentiles=DEFAULT_PERCENTILES, columns=REPORT_COLUMNS):
+    # {column: {'mean', 'std', 'P5', ...}} over the samples that integrated
+    # (NaN throughout if none did)
+    table = {}
+    for column in columns:
+        values = results[column]
+        count = np.count_nonzero(~np.isnan(values))
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)  # all-NaN column
+            row = {'mean': np.nanmean(values),
+                   'std': np.nanstd(values, ddof=1) if count != 1 else 0.0}
+            for percentile, value in zip(percentiles, np.nanpercentile(values, percentiles)):
+                row[f'P{percentile:g}'] = value
+        table[column] = row
+    return table
+
+def exceedance_probability(values, limit):
+    # Returns (probability, 95% confidence half-width) that values > limit,
+    # out of the samples that integrated
+    n = np.count_nonzero(~np.isnan(values))
+    if not n:
+        return np.nan, np.nan
+    probability = np.count_nonzero(values > limit) / n
+    return probability, 1.96 * np.sqrt(probability * (1 - probability) / n)
+
+# =============================================================================
+# OUTPUT
+# =============================================================================
+
+def print_monte_carlo_summary(results, n_samples, current_limit, percentiles=DEFAULT_PERCENTILES,
+                              clipped=None):
+    table = percentile_table(results, percentiles)
+    stats = list(next(iter(table.values())))
+
+    print(f"\nMonte Carlo: {n_samples:,} samples")
+    for field, count in (clipped or {}).items():
+        if count:
+            print(f"  {field}: {count:,} samples clipped to {PARAMETER_BOUNDS[field]}")
+    failed = failed_samples(results)
+    if failed:
+        print(f"  {failed:,} samples failed to integrate (left out of the statistics)")
+    print("-" * (20 + 12 * len(stats)))
+    print(f"{'':<20}" + "".join(f"{stat:>12}" for stat in stats))
+    for column, row in table.items():
+        print(f"{column:<20}" + "".join(f"{row[stat]:>12.1f}" for stat in stats))
+    print("-" * (20 + 12 * len(stats)))
+
+    for label, column in (('VFD', 'vfd_peak_current'), ('Soft starter', 'ss_peak_current')):
+        probability, half_width = exceedance_probability(results[column], current_limit)
+        print(f"P({label} peak current > {current_limit:.0f} A) = "
+              f"{probability:.4f} ± {half_width:.4f} (95% CI)")
+
+def write_monte_carlo_csv(samples, results, filename):
+    columns = {**samples, **results}
+    with open(filename, 'w', newline='') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(columns)
+        for row in zip(*(values.tolist() for values in columns.values())):
+            writer.writerow([f'{value:.6g}' for value in row])
+
+# =============================================================================
+# COMMAND LINE
+# =============================================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m vfd_simulation.montecarlo',
+        description='Monte Carlo distributions of the v4 VFD vs soft starter comparison.')
+    for option in UNCERTAIN_PARAMETERS:
+        parser.add_argument(f'--{option}', metavar='DIST',
+                            help='normal:mean,std | uniform:low,high | triangular:low,mode,high | value')
+    parser.add_argument('--samples', type=int, default=10000)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--current-limit', type=float, default=None, metavar='AMPS',
+                        help='current limit for the exceedance probability '
+                             '(default: current_limit_fla x nominal FLA)')
+    parser.add_argument('--percentiles', default=','.join(map(str, DEFAULT_PERCENTILES)),
+                        help='comma list (default: %(default)s)')
+    parser.add_argument('--load-type', choices=LOAD_TYPES, default=DEFAULT_CONFIG.load_type)
+    parser.add_argument('--solver', choices=SOLVERS, default='numba',
+                        help='ODE backend (default: %(default)s; odeint if Numba is missing)')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='worker processes (default: all cores)')
+    parser.add_argument('--csv', metavar='FILENAME', dest='csv_filename',
+                        help='also write every sample and its results to CSV')
+    args = parser.parse_args(argv)
+
+    distributions = {field: parse_distribution(getattr(args, field))
+                     for field in UNCERTAIN_PARAMETERS.values() if getattr(args, field)}
+    if not distributions:
+        parser.error('give at least one distribution, e.g. --inertia normal:150,15')
+
+    base_config = DEFAULT_CONFIG.replace(load_type=args.load_type, solver=args.solver)
+    current_limit = args.current_limit or base_config.current_limit_fla * base_config.fla
+    percentiles = [float(value) for value in args.percentiles.split(',')]
+
+    samples, results, clipped = monte_carlo(distributions, args.samples, base_config,
+                                            args.workers, args.seed)
+    print_monte_carlo_summary(results, args.samples, current_limit, percentiles, clipped)
+    if args.csv_filename:
+        write_monte_carlo_csv(samples, results, args.csv_filename)
+        print(f"✓ {args.samples:,} samples exported to: {args.csv_filename}")
+    return samples, results
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,264 @@
+# =============================================================================
+# VFD-Motor-Simulation: Dashboards
+# =============================================================================
+
+import matplotlib.pyplot as plt
+
+# =============================================================================
+# v4: VFD vs SOFT STARTER
+# =============================================================================
+
+def plot_comparison(result):
+    config, vfd, ss, costs = result.config, result.vfd, result.soft_starter, result.costs
+    vfd_energy_kj = vfd.energy_kj
+    ss_energy_kj = ss.energy_kj
+
+    fig = plt.figure(figsize=(18, 10))
+    gs = fig.add_gridspec(2, 3, hspace=0.3, wspace=0.3)
+
+    fig.suptitle(f'VFD vs Soft Starter Comparison - {config.power_hp}HP Motor ({config.load_type.replace("_", " ").title()} Load)',
+                 fontsize=16, fontweight='bold')
+
+    # Plot 1: Speed Response
+    ax1 = fig.add_subplot(gs[0, 0])
+    ax1.plot(vfd.time, vfd.omega_rpm, 'b-', linewidth=2.5, label='VFD')
+    ax1.plot(ss.time, ss.omega_rpm, 'g-', linewidth=2.5, label='Soft Starter')
+    ax1.axhline(y=config.sync_speed_rpm, color='gray', linestyle=':', linewidth=1.5, label='Sync Speed')
+    ax1.set_ylabel('Speed (RPM)', fontsize=12, fontweight='bold')
+    ax1.set_xlabel('Time (s)', fontsize=12, fontweight='bold')
+    ax1.set_title('Speed Response\n', fontsize=13, fontweight='bold')
+    ax1.grid(True, alpha=0.3)
+    ax1.legend(loc='lower right', fontsize=10)
+
+    # Plot 2: Current Draw
+    ax2 = fig.add_subplot(gs[0, 1])
+    ax2.plot(vfd.time, vfd.current, 'b-', linewidth=2.5, label='VFD')
+    ax2.plot(ss.time, ss.current, 'g-', linewidth=2.5, label='Soft Starter')
+    ax2.axhline(y=config.fla, color='gray', linestyle='--', linewidth=2, label=f'FLA ({config.fla:.0f}A)')
+    ax2.set_ylabel('Current (A)', fontsize=12, fontweight='bold')
+    ax2.set_xlabel('Time (s)', fontsize=12, fontweight='bold')
+    ax2.set_title('Current Draw\n', fontsize=13, fontweight='bold')
+    ax2.grid(True, alpha=0.3)
+    ax2.legend(loc='upper right', fontsize=10)
+
+    # Plot 3: Peak Current Comparison
+    ax3 = fig.add_subplot(gs[0, 2])
+    methods = ['VFD', 'Soft Starter']
+    peak_currents = [vfd.peak_current, ss.peak_current]
+    colors = ['blue', 'green']
+    bars = ax3.bar(methods, peak_currents, color=colors, alpha=0.7, edgecolor='black', linewidth=2, width=0.5)
+    ax3.axhline(y=config.fla, color='gray', linestyle='--', linewidth=2, label='FLA')
+    ax3.set_ylabel('Peak Current (A)', fontsize=12, fontweight='bold')
+    ax3.set_title('Peak Current Comparison\n', fontsize=13, fontweight='bold')
+    ax3.grid(True, alpha=0.3, axis='y')
+    ax3.legend(fontsize=10)
+    for bar, current in zip(bars, peak_currents):
+        height = bar.get_height()
+        ax3.text(bar.get_x() + bar.get_width()/2., height,
+                f'{current:.0f}A\n({current/config.fla:.2f}×FLA)',
+                ha='center', va='bottom', fontsize=10, fontweight='bold')
+
+    # Plot 4: Torque Profiles
+    ax4 = fig.add_subplot(gs[1, 0])
+    ax4.plot(vfd.time, vfd.torque, 'b-', linewidth=2, label='VFD Motor Torque')
+    ax4.plot(ss.time, ss.torque, 'g-', linewidth=2, label='Soft Starter Motor Torque')
+    ax4.plot(vfd.time, vfd.load_torque, 'orange', linewidth=2, linestyle='--', label='Load Torque')
+    ax4.axhline(y=config.rated_torque, color='red', linestyle=':', linewidth=1.5, label='Rated Torque')
+    ax4.set_ylabel('Torque (Nm)', fontsize=12, fontweight='bold')
+    ax4.set_xlabel('Time (s)', fontsize=12, fontweight='bold')
+    ax4.set_title('Torque Profiles', fontsize=13, fontweight='bold')
+    ax4.grid(True, alpha=0.3)
+    ax4.legend(loc='upper right', fontsize=9)
+
+    # Plot 5: Motor Slip
+    ax5 = fig.add_subplot(gs[1, 1])
+    ax5.plot(vfd.time, vfd.slip, 'b-', linewidth=2.5, label='VFD')
+    ax5.plot(ss.time, ss.slip, 'g-', linewidth=2.5, label='Soft Starter')
+    ax5.set_ylabel('Slip (%)', fontsize=12, fontweight='bold')
+    ax5.set_xlabel('Time (s)', fontsize=12, fontweight='bold')
+    ax5.set_title('Motor Slip During Startup', fontsize=13, fontweight='bold')
+    ax5.grid(True, alpha=0.3)
+    ax5.legend(loc='upper right', fontsize=10)
+
+    # Plot 6: Cost Comparison
+    ax6 = fig.add_subplot(gs[1, 2])
+    ax6.axis('off')
+
+    # Create comparison table
+    comparison_data = [
+        ['Parameter', 'VFD', 'Soft Starter', 'Advantage'],
+        ['Peak Current', f'{vfd.peak_current:.0f}A', f'{ss.peak_current:.0f}A', 'VFD'],
+        ['Current Ratio', f'{vfd.peak_current/config.fla:.2f}×FLA', f'{ss.peak_current/config.fla:.2f}×FLA', 'VFD'],
+        ['Ramp Time', f'{config.vfd_ramp_time}s', f'{config.soft_start_ramp_time}s', 'Soft Starter'],
+        ['Final Speed', f'{vfd.omega_rpm[-1]:.0f} RPM', f'{ss.omega_rpm[-1]:.0f} RPM', 'Tie'],
+        ['Final Slip', f'{vfd.slip[-1]:.2f}%', f'{ss.slip[-1]:.2f}%', 'Tie'],
+        ['Energy/Start', f'{vfd_energy_kj/3600:.2f} kWh', f'{ss_energy_kj/3600:.2f} kWh', 'VFD'],
+        ['Installed Cost', f'${costs.vfd_installed_cost:,}', f'${costs.ss_installed_cost:,}', 'Soft Starter'],
+        ['Annual Op. Cost', f'${costs.vfd_total_annual_cost:,.0f}', f'${costs.ss_total_annual_cost:,.0f}', 'Soft Starter'],
+        ['Ongoing Losses', f'~{config.vfd_continuous_loss_pct*100:.0f}%', '0% (bypassed)', 'Soft Starter'],
+    ]
+
+    table = ax6.table(cellText=comparison_data, cellLoc='left', loc='center',
+                     bbox=[0, 0, 1, 1], colWidths=[0.3, 0.25, 0.25, 0.2])
+    table.auto_set_font_size(False)
+    table.set_fontsize(9)
+    table.scale(1, 1.8)
+
+    # Style the header row
+    for i in range(4):
+        cell = table[(0, i)]
+        cell.set_facecolor('#4472C4')
+        cell.set_text_props(weight='bold', color='white')
+
+    # Color code advantages
+    for i in range(1, len(comparison_data)):
+        if comparison_data[i][3] == 'VFD':
+            table[(i, 1)].set_facecolor('#D6E9F8')  # Light blue
+        elif comparison_data[i][3] == 'Soft Starter':
+            table[(i, 2)].set_facecolor('#E2EFD9')  # Light green
+
+    ax6.set_title('Performance Comparison', fontsize=13, fontweight='bold', pad=20)
+
+    plt.subplots_adjust(left=0.08, right=0.98, top=0.90, bottom=0.06, hspace=0.3, wspace=0.3)
+
+    return fig
+
+# =============================================================================
+# v3: VFD vs DOL
+# =============================================================================
+
+def plot_vfd_dol(result):
+    config, vfd = result.config, result.vfd
+    omega_rpm = vfd.omega_rpm
+
+    fig = plt.figure(figsize=(16, 12))
+    gs = fig.add_gridspec(3, 2, hspace=0.3, wspace=0.3)
+
+    fig.suptitle(f'VFD vs DOL Starting Comparison - {config.power_hp}HP Motor ({config.load_type.replace("_", " ").title()} Load)',
+                 fontsize=14, fontweight='bold')
+
+    # Plot 1: Speed Comparison
+    ax1 = fig.add_subplot(gs[0, 0])
+    ax1.plot(vfd.time, omega_rpm, 'b-', linewidth=2, label='VFD Start')
+    ax1.plot(result.dol_time, result.dol_omega_rpm, 'r--', linewidth=2, label='DOL Start')
+    ax1.set_ylabel('Speed (RPM)', fontsize=11)
+    ax1.set_xlabel('Time (s)', fontsize=11)
+    ax1.set_title('Speed Response Comparison', fontsize=12)
+    ax1.grid(True, alpha=0.3)
+    ax1.legend(loc='lower right')
+    ax1.set_xlim([0, max(config.vfd_ramp_time, 5)])
+
+    # Plot 2: Current Comparison
+    ax2 = fig.add_subplot(gs[0, 1])
+    ax2.plot(vfd.time, vfd.current, 'b-', linewidth=2, label='VFD Start')
+    ax2.plot(result.dol_time, result.dol_current, 'r--', linewidth=2, label='DOL Start')
+    ax2.axhline(y=config.fla, color='green', linestyle=':', linewidth=1.5, label=f'FLA ({config.fla:.0f} A)')
+    ax2.set_ylabel('Current (A)', fontsize=11)
+    ax2.set_xlabel('Time (s)', fontsize=11)
+    ax2.set_title('Current Draw Comparison', fontsize=12)
+    ax2.grid(True, alpha=0.3)
+    ax2.legend(loc='upper right')
+    ax2.set_xlim([0, max(config.vfd_ramp_time, 5)])
+
+    # Plot 3: Torque Profile
+    ax3 = fig.add_subplot(gs[1, 0])
+    ax3.plot(vfd.time, vfd.torque, 'g-', linewidth=2, label='Motor Torque')
+    ax3.plot(vfd.time, vfd.load_torque, 'orange', linewidth=2, label='Load Torque')
+    ax3.axhline(y=config.rated_torque, color='red', linestyle='--', linewidth=1.5,
+               label=f'Rated Torque ({config.rated_torque:.0f} Nm)')
+    ax3.set_ylabel('Torque (Nm)', fontsize=11)
+    ax3.set_xlabel('Time (s)', fontsize=11)
+    ax3.set_title(f'Torque Profile - {config.load_type.replace("_", " ").title()} Load', fontsize=12)
+    ax3.grid(True, alpha=0.3)
+    ax3.legend(loc='upper right')
+    ax3.set_xlim([0, config.vfd_ramp_time])
+
+    # Plot 4: Slip
+    ax4 = fig.add_subplot(gs[1, 1])
+    ax4.plot(vfd.time, vfd.slip, 'darkorange', linewidth=2)
+    ax4.set_ylabel('Slip (%)', fontsize=11)
+    ax4.set_xlabel('Time (s)', fontsize=11)
+    ax4.set_title('Motor Slip During Startup', fontsize=12)
+    ax4.grid(True, alpha=0.3)
+    ax4.set_xlim([0, config.vfd_ramp_time])
+
+    # Plot 5: Power
+    ax5 = fig.add_subplot(gs[2, 0])
+    ax5.plot(vfd.time, vfd.power_in, 'b-', linewidth=2, label='Input Power')
+    ax5.plot(vfd.time, vfd.power_out, 'g-', linewidth=2, label='Output Power')
+    ax5.set_ylabel('Power (kW)', fontsize=11)
+    ax5.set_xlabel('Time (s)', fontsize=11)
+    ax5.set_title('Power During Startup', fontsize=12)
+    ax5.grid(True, alpha=0.3)
+    ax5.legend(loc='upper right')
+    ax5.set_xlim([0, config.vfd_ramp_time])
+
+    # Plot 6: Efficiency
+    ax6 = fig.add_subplot(gs[2, 1])
+    ax6.plot(vfd.time, vfd.efficiency, 'purple', linewidth=2)
+    ax6.axhline(y=config.efficiency*100, color='green', linestyle='--', linewidth=1.5,
+               label=f'Rated Efficiency ({config.efficiency*100:.0f}%)')
+    ax6.set_ylabel('Efficiency (%)', fontsize=11)
+    ax6.set_xlabel('Time (s)', fontsize=11)
+    ax6.set_title('Motor Efficiency During Startup', fontsize=12)
+    ax6.grid(True, alpha=0.3)
+    ax6.legend(loc='lower right')
+    ax6.set_xlim([0, config.vfd_ramp_time])
+    ax6.set_ylim([0, 100])
+
+    return fig
+
+# =============================================================================
+# v2: VFD START
+# =============================================================================
+
+def plot_vfd_start(config, vfd):
+    omega_rpm = vfd.omega_rpm
+
+    fig, axs = plt.subplots(4, 1, figsize=(12, 14))
+    fig.suptitle(f'VFD-Controlled Motor Startup Simulation ({config.power_hp}HP Motor)\n',
+                 fontsize=14, fontweight='bold')
+
+    # Plot 1: Speed
+    axs[0].plot(vfd.time, omega_rpm, 'b-', linewidth=2, label='Motor Speed')
+    axs[0].plot(vfd.time, (vfd.frequency / config.base_freq) * config.sync_speed_rpm, 'r--',
+                linewidth=1.5, label='Synchronous Speed')
+    axs[0].set_ylabel('Speed (RPM)', fontsize=11)
+    axs[0].set_title('Motor Speed Response', fontsize=12)
+    axs[0].grid(True, alpha=0.3)
+    axs[0].legend(loc='lower right')
+    axs[0].set_xlim([0, config.vfd_ramp_time])
+
+    # Plot 2: Torque
+    axs[1].plot(vfd.time, vfd.torque, 'g-', linewidth=2, label='Electromagnetic Torque')
+    axs[1].axhline(y=config.load_torque, color='r', linestyle='--',
+                   linewidth=1.5, label=f'Load Torque ({config.load_torque:.0f} Nm)')
+    axs[1].axhline(y=config.rated_torque, color='orange', linestyle=':',
+                   linewidth=1.5, label=f'Rated Torque ({config.rated_torque:.0f} Nm)')
+    axs[1].set_ylabel('Torque (Nm)', fontsize=11)
+    axs[1].set_title('Torque Profile', fontsize=12)
+    axs[1].grid(True, alpha=0.3)
+    axs[1].legend(loc='upper right')
+    axs[1].set_xlim([0, config.vfd_ramp_time])
+
+    # Plot 3: Current
+    axs[2].plot(vfd.time, vfd.current, 'purple', linewidth=2, label='Motor Current')
+    axs[2].axhline(y=config.fla, color='r', linestyle='--',
+                   linewidth=1.5, label=f'Full Load Current ({config.fla:.0f} A)')
+    axs[2].set_ylabel('Current (A)', fontsize=11)
+    axs[2].set_title('Current Draw', fontsize=12)
+    axs[2].grid(True, alpha=0.3)
+    axs[2].legend(loc='upper right')
+    axs[2].set_xlim([0, config.vfd_ramp_time])
+
+    # Plot 4: Slip
+    axs[3].plot(vfd.time, vfd.slip, 'darkorange', linewidth=2)
+    axs[3].set_ylabel('Slip (%)', fontsize=11)
+    axs[3].set_xlabel('Time (s)', fontsize=11)
+    axs[3].set_title('Motor Slip', fontsize=12)
+    axs[3].grid(True, alpha=0.3)
+    axs[3].set_xlim([0, config.vfd_ramp_time])
+
+    plt.tight_layout()
+
+    return fig
@@ -0,0 +1,211 @@
+# =============================================================================
+# VFD-Motor-Simulation: Profiling Mode
+# =============================================================================
+# Backs the CLI's --profile option. The chosen scenario runs twice:
+#   1. under cProfile (deterministic: every Python call is counted and
+#      timed), for the time reports
+#   2. under tracemalloc with the console output suppressed, for the memory
+#      report (kept out of the first run because tracing every allocation
+#      slows allocation-heavy code, e.g. the RHS, and would skew the ranking)
+# The second run starts with warm caches (efficiency map, tariff calendar),
+# so memory those caches hold is attributed to the first run only.
+#
+# The report ranks:
+#   - the named model functions (MODEL_FUNCTIONS); the solvers integrate the
+#     compiled right-hand sides, so the rhs/load closures built by
+#     make_*_dynamics and make_load_torque count towards the reference
+#     function they reproduce
+#   - the top functions by own time and by cumulative time
+#   - peak traced memory, the allocation peak of each instrumented phase and
+#     the largest allocation sites still live at the end of the run
+#
+# Usage:
+#   python -m vfd_simulation --profile                  (report only)
+#   python -m vfd_simulation --profile run.prof         (also save pstats data)
+# =============================================================================
+
+import cProfile
+import io
+import pstats
+import sys
+import tracemalloc
+from contextlib import redirect_stdout
+from pathlib import Path
+
+from . import costs, export, legacy, metrics, models, report
+from .instrumentation import instrument
+
+# Functions ranked per row of the report
+PROFILE_TOP = 20
+# Frames kept per traced allocation
+TRACEMALLOC_FRAMES = 10
+
+# Report label -> (module, function name) pairs, or (module, factory name,
+# inner function name) for closures. Groups hold functions that never call
+# each other, so their cumulative times add up.
+MODEL_FUNCTIONS = {
+    'vfd_motor_dynamics': [
+        (models, 'vfd_motor_dynamics'),
+        (models, 'make_vfd_dynamics', 'rhs'),
+        (models, 'make_vfd_table_dynamics', 'rhs'),
+    ],
+    'soft_start_motor_dynamics': [
+        (models, 'soft_start_motor_dynamics'),
+        (models, 'make_soft_start_dynamics', 'rhs'),
+        (models, 'make_soft_start_table_dynamics', 'rhs'),
+    ],
+    'v2_motor_dynamics': [(legacy, 'v2_motor_dynamics')],
+    'vfd_motor_jacobian': [(models, 'vfd_motor_jacobian')],
+    'soft_start_motor_jacobian': [(models, 'soft_start_motor_jacobian')],
+    'get_load_torque': [
+        (models, 'get_load_torque'),
+        (models, 'get_load_torque_array'),
+        (models, 'get_load_torque_table_array'),
+        (models, 'make_load_torque', 'load'),
+    ],
+    'calculate_metrics': [
+        (metrics, 'calculate_metrics'),
+        (legacy, 'calculate_vfd_metrics'),
+    ],
+    'calculate_costs': [(costs, 'calculate_costs')],
+    'CSV writer': [
+        (report, 'write_comparison_csv'),
+        (report, 'write_vfd_dol_csv'),
+    ],
+    'columnar export': [(export, 'write_columns')],
+    # Resolved only if plotting was imported (never for --headless)
+    'plot builder': [
+        ('plotting', 'plot_comparison'),
+        ('plotting', 'plot_vfd_dol'),
+        ('plotting', 'plot_vfd_start'),
+    ],
+}
+
+# =============================================================================
+# FUNCTION ATTRIBUTION
+# =============================================================================
+
+def _code_key(code):
+    # pstats keys functions by (filename, first line, name)
+    return code.co_filename, code.co_firstlineno, code.co_name
+
+
+def _inner_codes(code, name):
+    # Code objects of the functions called `name` defined anywhere in code
+    for const in code.co_consts:
+        if hasattr(const, 'co_code'):
+            if const.co_name == name:
+                yield const
+            yield from _inner_codes(const, name)
+
+
+def model_function_keys():
+    # pstats key -> MODEL_FUNCTIONS label
+    keys = {}
+    for label, functions in MODEL_FUNCTIONS.items():
+        for module, name, *inner in functions:
+            if isinstance(module, str):
+                module = sys.modules.get(f'{__package__}.{module}')
+                if module is None:
+                    continue
+            code = getattr(module, name).__code__
+            codes = _inner_codes(code, inner[0]) if inner else [code]
+            for function_code in codes:
+                keys[_code_key(function_code)] = label
+    return keys
+
+
+def model_function_times(stats):
+    # label -> (calls, own time, cumulative time), s
+    keys = model_function_keys()
+    totals = {}
+    for key, (_, calls, own, cumulative, _) in stats.stats.items():
+        label = keys.get(key)
+        if label is not None:
+            previous = totals.get(label, (0, 0.0, 0.0))
+            totals[label] = (previous[0] + calls, previous[1] + own, previous[2] + cumulative)
+    return totals
+
+
+def _function_name(key, labels):
+    filename, line, name = key
+    if filename == '~':  # built-in
+        return name
+    label = labels.get(key)
+    location = f'{Path(filename).name}:{line}({name})'
+    return f'{location} [{label}]' if label and label != name else location
+
+# =============================================================================
+# PROFILED RUNS
+# =============================================================================
+
+def profile_run(run, label='run'):
+    # Returns (run's return value, pstats.Stats, memory RunRecord, snapshot)
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        result = run()
+    finally:
+        profiler.disable()
+    stats = pstats.Stats(profiler)
+
+    tracemalloc.start(TRACEMALLOC_FRAMES)
+    try:
+        with redirect_stdout(io.StringIO()), instrument(label) as record:
+            run()
+        snapshot = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    return result, stats, record, snapshot
+
+# =============================================================================
+# REPORT
+# =============================================================================
+
+def print_profile_report(stats, record, snapshot, top=PROFILE_TOP):
+    labels = model_function_keys()
+    total = stats.total_tt
+    print("=" * 80)
+    print("PROFILE")
+    print("=" * 80)
+    print(f"cProfile: {total:.3f} s in {stats.total_calls:,} calls "
+          f"(times include profiler overhead)\n")
+
+    print(f"{'Model function':<28}{'Calls':>10}{'Own (ms)':>12}{'Cumulative (ms)':>17}{'% of run':>10}")
+    print("-" * 77)
+    times = model_function_times(stats)
+    for label, (calls, own, cumulative) in sorted(times.items(), key=lambda item: -item[1][2]):
+        print(f"{label:<28}{calls:>10,}{own * 1e3:>12.1f}{cumulative * 1e3:>17.1f}"
+              f"{cumulative / total * 100:>9.1f}%")
+
+    for title, column in (('own time', 2), ('cumulative time', 3)):
+        print(f"\nTop {top} functions by {title}")
+        print(f"{'Function':<62}{'Calls':>10}{'Own (ms)':>11}{'Cum (ms)':>11}")
+        print("-" * 94)
+        ranked = sorted(stats.stats.items(), key=lambda item: -item[1][column])[:top]
+        for key, (_, calls, own, cumulative, _) in ranked:
+            name = _function_name(key, labels)
+            if len(name) > 60:
+                name = '...' + name[-57:]
+            print(f"{name:<62}{calls:>10,}{own * 1e3:>11.1f}{cumulative * 1e3:>11.1f}")
+
+    print(f"\nMemory (tracemalloc, second run): peak {record.memory_peak / 1e6:.2f} MB traced")
+    if record.memory_peaks:
+        print(f"{'Phase':<12}{'Peak above start (MB)':>22}")
+        print("-" * 34)
+        for name, peak in sorted(record.memory_peaks.items(), key=lambda item: -item[1]):
+            print(f"{name:<12}{peak / 1e6:>22.2f}")
+
+    print("\nLargest allocation sites still live at the end of the run")
+    print(f"{'Site':<62}{'Blocks':>10}{'Size (kB)':>12}")
+    print("-" * 84)
+    for stat in snapshot.statistics('lineno')[:top]:
+        frame = stat.traceback[0]
+        site = f'{Path(frame.filename).name}:{frame.lineno}'
+        print(f"{site:<62}{stat.count:>10,}{stat.size / 1e3:>12.1f}")
+    print()
+
+
+def save_profile(stats, filename):
+    # pstats data for snakeviz, gprof2dot or pstats.Stats(filename)
+    stats.dump_stats(filename)
@@ -0,0 +1,229 @@
+# =============================================================================
+# VFD-Motor-Simulation: Fixed-Step Real-Time Motor Model
+# =============================================================================
+# For hardware-in-the-loop use at 1-10 kHz: the motor is advanced one fixed
+# step at a time by step(dt), driven by inputs the loop writes each step
+# instead of the built-in ramps:
+#   motor.inputs[I_FREQ]           drive output frequency, Hz (VFD)
+#   motor.inputs[I_VOLTAGE_RATIO]  supply voltage / rated (soft starter)
+#   motor.inputs[I_LOAD_FACTOR]    load torque multiplier (1 = config.load_torque)
+# The torque, load and current models are those of vfd_motor_dynamics /
+# soft_start_motor_dynamics and calculate_metrics.
+#
+# State, inputs, outputs and parameters live in arrays allocated once; each
+# step runs one JIT-compiled kernel that updates them in place, so a step
+# allocates nothing and its cost does not depend on the state (no adaptive
+# step control, no convergence loop). Integrators:
+#   'rk4'          classic fixed-step RK4 (4 RHS evaluations)
+#   'exponential'  exponential Euler on the local linearization (1 RHS + 1
+#                  Jacobian evaluation); stable at any step, first order
+#
+# Without Numba the kernels run as plain Python (~50x slower per step);
+# HAVE_NUMBA tells which one runs. The first step compiles the kernels.
+#
+# Usage:
+#   motor = RealtimeMotor('vfd', config)
+#   while running:
+#       motor.inputs[I_FREQ] = commanded_hz
+#       motor.step(1e-4)
+#       speed, current = motor.state[S_OMEGA], motor.outputs[O_CURRENT]
+# =============================================================================
+
+import math
+
+import numpy as np
+
+from .accelerated import (
+    HAVE_NUMBA, P_BASE_FREQ, P_BASE_LOAD, P_DAMPING, P_FLA, P_INV_BOOST_FREQ,
+    P_INV_INERTIA, P_INV_SYNC_SPEED, P_LOAD, P_LOW_FREQ_GAIN, P_METHOD, P_POWER_FACTOR,
+    P_RATED_TORQUE, P_SYNC_PER_HZ, P_V_BOOST, P_VOLTAGE, _clip_unit, _jit, _load_torque,
+    _torque_ratio, start_parameters,
+)
+from .config import DEFAULT_CONFIG
+from .models import TORQUE_A, TORQUE_B, TORQUE_C
+
+INTEGRATORS = ('rk4', 'exponential')
+
+# State, input and output array layouts
+S_OMEGA, S_TIME = range(2)
+N_STATE = 2
+I_FREQ, I_VOLTAGE_RATIO, I_LOAD_FACTOR = range(3)
+N_INPUTS = 3
+O_TORQUE, O_LOAD_TORQUE, O_CURRENT, O_VOLTAGE, O_POWER_IN, O_SLIP = range(6)
+N_OUTPUTS = 6
+
+# Below this |Jacobian x dt| exponential Euler reduces to explicit Euler
+# (avoids cancellation in expm1(x) / x)
+EXPONENTIAL_LINEAR_LIMIT = 1e-10
+
+# =============================================================================
+# KERNELS
+# =============================================================================
+
+@_jit
+def _motor_torque(omega_rad, inputs, params):
+    # Electromagnetic torque and slip at the current inputs
+    if params[P_METHOD] == 0:  # vfd
+        freq = inputs[I_FREQ]
+        sync_speed_rad = freq * params[P_SYNC_PER_HZ]
+        if sync_speed_rad < 0.1:
+            return 0.0, 1.0
+        slip = _clip_unit(1.0 - omega_rad / sync_speed_rad)
+        if freq < 1.0:
+            return params[P_LOW_FREQ_GAIN] * slip, slip
+        torque_em = params[P_RATED_TORQUE] * _torque_ratio(slip) * (freq / params[P_BASE_FREQ])
+        boost_position = freq * params[P_INV_BOOST_FREQ]
+        if boost_position < 1.0:
+            torque_em *= 1 + params[P_V_BOOST] * (1 - boost_position)
+        return torque_em, slip
+    voltage_ratio = inputs[I_VOLTAGE_RATIO]
+    slip = _clip_unit(1.0 - omega_rad * params[P_INV_SYNC_SPEED])
+    return params[P_RATED_TORQUE] * _torque_ratio(slip) * (voltage_ratio * voltage_ratio), slip
+
+@_jit
+def _rhs(omega_rad, inputs, params):
+    if params[P_METHOD] == 0 and inputs[I_FREQ] * params[P_SYNC_PER_HZ] < 0.1:
+        return 0.0  # drive off: the model holds the rotor (vfd_motor_dynamics)
+    torque_em = _motor_torque(omega_rad, inputs, params)[0]
+    load = _load_torque(omega_rad * params[P_INV_SYNC_SPEED], params) * inputs[I_LOAD_FACTOR]
+    return (torque_em - load - params[P_DAMPING] * omega_rad) * params[P_INV_INERTIA]
+
+@_jit
+def _jacobian(omega_rad, inputs, params):
+    # d(_rhs)/d(omega_rad); slip and speed ratio are clipped to [0, 1] and
+    # have zero derivative outside it
+    if params[P_METHOD] == 0:
+        freq = inputs[I_FREQ]
+        sync_speed_rad = freq * params[P_SYNC_PER_HZ]
+        if sync_speed_rad < 0.1:
+            return 0.0
+        scale = params[P_RATED_TORQUE] * (freq / params[P_BASE_FREQ])
+        boost_position = freq * params[P_INV_BOOST_FREQ]
+        if boost_position < 1.0:
+            scale *= 1 + params[P_V_BOOST] * (1 - boost_position)
+    else:
+        voltage_ratio = inputs[I_VOLTAGE_RATIO]
+        freq = params[P_BASE_FREQ]
+        sync_speed_rad = 1.0 / params[P_INV_SYNC_SPEED]
+        scale = params[P_RATED_TORQUE] * voltage_ratio * voltage_ratio
+
+    slip = 1.0 - omega_rad / sync_speed_rad
+    d_torque = 0.0
+    if 0.0 <= slip <= 1.0:
+        if freq < 1.0:
+            d_slope = params[P_LOW_FREQ_GAIN]
+        else:
+            denominator = slip * slip + TORQUE_B * slip + TORQUE_C
+            d_slope = scale * TORQUE_A * (TORQUE_C - slip * slip) / (denominator * denominator)
+        d_torque = -d_slope / sync_speed_rad
+
+    speed_ratio = omega_rad * params[P_INV_SYNC_SPEED]
+    d_load = 0.0
+    if 0.0 <= speed_ratio <= 1.0:
+        base = params[P_BASE_LOAD] * inputs[I_LOAD_FACTOR]
+        load_code = params[P_LOAD]
+        if load_code == 1:  # fan_pump
+            d_load = base * 2 * speed_ratio
+        elif load_code == 2:  # constant_power
+            if speed_ratio >= 0.1:
+                d_load = -base / (speed_ratio * speed_ratio)
+        else:
+            d_load = base * 0.7
+        d_load *= params[P_INV_SYNC_SPEED]
+    return (d_torque - d_load - params[P_DAMPING]) * params[P_INV_INERTIA]
+
+@_jit
+def _outputs(omega_rad, inputs, params, outputs):
+    # Torque, load, current, voltage and input power (calculate_metrics'
+    # model) at the current state and inputs
+    torque_em, slip = _motor_torque(omega_rad, inputs, params)
+    load = _load_torque(omega_rad * params[P_INV_SYNC_SPEED], params) * inputs[I_LOAD_FACTOR]
+    fla = params[P_FLA]
+    current = math.sqrt((fla * (torque_em / params[P_RATED_TORQUE]))**2 + (fla * 0.3)**2)
+    if params[P_METHOD] == 0:
+        freq = inputs[I_FREQ]
+        base_freq = params[P_BASE_FREQ]
+        voltage = params[P_VOLTAGE] * (freq / base_freq)
+        if freq < base_freq * 0.1:
+            voltage += params[P_VOLTAGE] * params[P_V_BOOST] * (1 - freq / (base_freq * 0.1))
+        if freq < 0.5:
+            current = 0.0
+    else:
+        voltage_ratio = inputs[I_VOLTAGE_RATIO]
+        voltage = params[P_VOLTAGE] * voltage_ratio
+        if 0.3 < voltage_ratio < 1.0:
+            current *= 1.2 / voltage_ratio
+    outputs[O_TORQUE] = torque_em
+    outputs[O_LOAD_TORQUE] = load
+    outputs[O_CURRENT] = current
+    outputs[O_VOLTAGE] = voltage
+    outputs[O_POWER_IN] = math.sqrt(3.0) * voltage * current * params[P_POWER_FACTOR] / 1000
+    outputs[O_SLIP] = slip * 100
+
+@_jit
+def _step_rk4(state, inputs, params, outputs, dt):
+    omega_rad = state[S_OMEGA]
+    k1 = _rhs(omega_rad, inputs, params)
+    k2 = _rhs(omega_rad + 0.5 * dt * k1, inputs, params)
+    k3 = _rhs(omega_rad + 0.5 * dt * k2, inputs, params)
+    k4 = _rhs(omega_rad + dt * k3, inputs, params)
+    state[S_OMEGA] = omega_rad + dt / 6 * (k1 + 2 * k2 + 2 * k3 + k4)
+    state[S_TIME] += dt
+    _outputs(state[S_OMEGA], inputs, params, outputs)
+
+@_jit
+def _step_exponential(state, inputs, params, outputs, dt):
+    # omega' ~ f0 + a (omega - omega0)  =>  omega0 + f0 (exp(a dt) - 1) / a
+    omega_rad = state[S_OMEGA]
+    f0 = _rhs(omega_rad, inputs, params)
+    a = _jacobian(omega_rad, inputs, params) if f0 != 0.0 else 0.0
+    x = a * dt
+    if abs(x) < EXPONENTIAL_LINEAR_LIMIT:
+        state[S_OMEGA] = omega_rad + dt * f0
+    else:
+        state[S_OMEGA] = omega_rad + f0 * dt * (math.expm1(x) / x)
+    state[S_TIME] += dt
+    _outputs(state[S_OMEGA], inputs, params, outputs)
+
+# =============================================================================
+# REAL-TIME MOTOR
+# =============================================================================
+
+class RealtimeMotor:
+    def __init__(self, method='vfd', config=DEFAULT_CONFIG, integrator='rk4', omega_rad=0.0):
+        if integrator not in INTEGRATORS:
+            raise ValueError(f'unknown integrator {integrator!r}; expected one of {INTEGRATORS}')
+        self.method = method
+        self.config = config
+        self.integrator = integrator
+        self.params = start_parameters(method, config)
+        self.state = np.zeros(N_STATE)
+        self.inputs = np.zeros(N_INPUTS)
+        self.outputs = np.zeros(N_OUTPUTS)
+        self._kernel = _step_rk4 if integrator == 'rk4' else _step_exponential
+        self.reset(omega_rad)
+
+    def reset(self, omega_rad=0.0):
+        self.state[S_OMEGA] = omega_rad
+        self.state[S_TIME] = 0.0
+        self.inputs[I_FREQ] = 0.0
+        self.inputs[I_VOLTAGE_RATIO] = 1.0
+        self.inputs[I_LOAD_FACTOR] = 1.0
+        _outputs(omega_rad, self.inputs, self.params, self.outputs)
+
+    def step(self, dt, inputs=None):
+        # Advances by dt (s) and returns the state array. inputs, if given,
+        # is copied into self.inputs first; writing self.inputs in place
+        # instead keeps the step free of any allocation.
+        if inputs is not None:
+            self.inputs[:] = inputs
+        self._kernel(self.state, self.inputs, self.params, self.outputs, dt)
+        return self.state
+
+    def warm_up(self):
+        # Compiles the kernels (first call) without disturbing the state
+        saved = self.state.copy(), self.inputs.copy()
+        self.step(1e-6)
+        self.state[:], self.inputs[:] = saved
+        _outputs(self.state[S_OMEGA], self.inputs, self.params, self.outputs)
+        return HAVE_NUMBA
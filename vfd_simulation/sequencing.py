@@ -0,0 +1,310 @@
+# =============================================================================
+# VFD-Motor-Simulation: Start-Sequence Optimizer
+# =============================================================================
+# Picks a start time and a ramp time (VFD_RAMP_TIME / SOFT_START_RAMP_TIME)
+# for every motor on a bus so the peak combined current is as low as
+# possible, with every ramp finished within a total sequence time.
+#
+# Each motor's current curve is computed once per candidate ramp time (one
+# vectorized fleet run, all starting at t = 0). A schedule's bus current is
+# then the sum of those curves shifted to their start times, so scoring a
+# schedule is array indexing, not a new solve: thousands of candidate
+# schedules are evaluated per second.
+#
+# The search places motors one at a time, largest first, at the start and
+# ramp that keep the running peak lowest, then re-places each motor in turn
+# against all the others until no move helps; random restarts reorder the
+# placement.
+#
+# Quick Start:
+#   python -m vfd_simulation.sequencing motors.csv --sequence-time 120
+#   python -m vfd_simulation.sequencing motors.csv --sequence-time 120 --csv schedule.csv
+# =============================================================================
+
+import argparse
+import csv
+from dataclasses import dataclass, replace
+from functools import cached_property
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from .config import DEFAULT_CONFIG, LOAD_TYPES
+from .fleet import FLEET_SETTLE_TIME, read_motors, simulate_fleet
+
+# Candidate ramp times (s) for motors that do not fix their own
+DEFAULT_RAMP_TIMES = {
+    'vfd': (10, 15, 20, 30, 45, 60),
+    'soft_starter': (5, 10, 15, 20, 30),
+}
+
+SEQUENCE_TIME_STEP = 0.1  # s, current curve resolution
+START_STEP = 1.0  # s, start time resolution
+
+# Schedules per vectorized evaluation (bounds memory at ~8 * n_time bytes each)
+EVALUATION_CHUNK = 512
+
+
+@dataclass
+class StartCurves:
+    motors: list
+    time: np.ndarray  # s since start, uniform
+    ramp_times: np.ndarray  # s, (n_motors, n_ramps); NaN past a motor's choices
+    current: np.ndarray  # A, (n_motors, n_ramps, n_time)
+
+    @property
+    def time_step(self):
+        return self.time[1] - self.time[0]
+
+    @cached_property
+    def windows(self):
+        # (n_motors, n_ramps, n_time + 1, n_time) view: windows[m, r, n_time - k]
+        # is motor m's ramp-r current started k samples in. Shifting is then
+        # a row gather instead of per-element indexing.
+        n_time = self.time.size
+        padded = np.concatenate([np.zeros(self.current.shape), self.current], axis=2)
+        return sliding_window_view(padded, n_time, axis=2)
+
+
+@dataclass
+class Schedule:
+    start_times: np.ndarray  # s
+    ramp_times: np.ndarray  # s
+    peak_current: float  # A
+    peak_time: float  # s
+    evaluated: int  # candidate schedules scored
+
+# =============================================================================
+# CURRENT CURVES
+# =============================================================================
+
+def ramp_choices(motor, ramp_times=None):
+    # The motor's own ramp time if it fixes one, else the candidates for its
+    # start method
+    if motor.ramp_time is not None:
+        return (motor.ramp_time,)
+    return (ramp_times or DEFAULT_RAMP_TIMES)[motor.method]
+
+def configured_ramp(motor, config=DEFAULT_CONFIG):
+    if motor.ramp_time is not None:
+        return motor.ramp_time
+    return config.vfd_ramp_time if motor.method == 'vfd' else config.soft_start_ramp_time
+
+def start_curves(motors, sequence_time, ramp_times=None, config=DEFAULT_CONFIG,
+                 time_step=SEQUENCE_TIME_STEP):
+    # Current of every motor for every candidate ramp, starting at t = 0 and
+    # long enough for a start at t = 0 to run to the end of the sequence
+    choices = [ramp_choices(motor, ramp_times) for motor in motors]
+    n_ramps = max(len(motor_choices) for motor_choices in choices)
+    horizon = sequence_time + FLEET_SETTLE_TIME
+    time = np.linspace(0, horizon, int(round(horizon / time_step)) + 1)
+
+    candidates = [replace(motor, start_time=0.0, ramp_time=float(ramp))
+                  for motor, motor_choices in zip(motors, choices) for ramp in motor_choices]
+    fleet = simulate_fleet(candidates, config, time)
+    if fleet.failed:
+        motor = fleet.failed[0]
+        raise ValueError(f'{motor.name or "a motor"} ({motor.power_hp:g} HP, {motor.method}, '
+                         f'ramp {motor.ramp_time:g} s) cannot be integrated; '
+                         'check its load type')
+
+    ramp_grid = np.full((len(motors), n_ramps), np.nan)
+    current = np.zeros((len(motors), n_ramps, time.size))
+    row = 0
+    for i, motor_choices in enumerate(choices):
+        ramp_grid[i, :len(motor_choices)] = motor_choices
+        current[i, :len(motor_choices)] = fleet.current[row:row + len(motor_choices)]
+        # Unused slots repeat the last choice so any index is safe
+        current[i, len(motor_choices):] = current[i, len(motor_choices) - 1]
+        row += len(motor_choices)
+    return StartCurves(list(motors), time, ramp_grid, current)
+
+# =============================================================================
+# SCHEDULE EVALUATION
+# =============================================================================
+
+def motor_current(curves, motor, start_index, ramp_index):
+    # (n_schedules, n_time) current of one motor started at start_index
+    # (in curve samples) with its ramp_index-th ramp
+    n_time = curves.time.size
+    return curves.windows[motor, ramp_index, n_time - np.minimum(start_index, n_time)]
+
+def bus_current(curves, start_index, ramp_index):
+    # (n_schedules, n_time) bus current for schedules given as
+    # (n_schedules, n_motors) start and ramp indices
+    start_index, ramp_index = np.atleast_2d(start_index), np.atleast_2d(ramp_index)
+    total = np.zeros((start_index.shape[0], curves.time.size))
+    for motor in range(len(curves.motors)):
+        total += motor_current(curves, motor, start_index[:, motor], ramp_index[:, motor])
+    return total
+
+def peak_currents(curves, start_index, ramp_index):
+    # Peak bus current of each schedule, evaluated in chunks
+    start_index, ramp_index = np.atleast_2d(start_index), np.atleast_2d(ramp_index)
+    return np.concatenate([
+        bus_current(curves, start_index[chunk:chunk + EVALUATION_CHUNK],
+                    ramp_index[chunk:chunk + EVALUATION_CHUNK]).max(axis=1)
+        for chunk in range(0, start_index.shape[0], EVALUATION_CHUNK)])
+
+# =============================================================================
+# OPTIMIZATION
+# =============================================================================
+
+def _candidate_moves(curves, motor, sequence_time, start_step):
+    # (start_index, ramp_index) pairs that finish the ramp within the sequence
+    step = max(int(round(start_step / curves.time_step)), 1)
+    starts, ramps = [], []
+    for ramp_index, ramp in enumerate(curves.ramp_times[motor]):
+        if np.isnan(ramp) or ramp > sequence_time:
+            continue
+        last_start = int(np.floor((sequence_time - ramp) / curves.time_step + 1e-9))
+        motor_starts = np.arange(0, last_start + 1, step)
+        starts.append(motor_starts)
+        ramps.append(np.full(motor_starts.size, ramp_index))
+    if not starts:
+        raise ValueError(f'motor {motor + 1}: no ramp time fits in a {sequence_time:g} s sequence')
+    return np.concatenate(starts), np.concatenate(ramps)
+
+def _best_move(curves, motor, others, moves):
+    # Index into moves that minimizes the peak of others + this motor;
+    # ties go to the earliest start, then the shortest ramp (moves order)
+    starts, ramps = moves
+    peaks = np.concatenate([
+        (others[np.newaxis, :] + motor_current(curves, motor, starts[chunk:chunk + EVALUATION_CHUNK],
+                                               ramps[chunk:chunk + EVALUATION_CHUNK])).max(axis=1)
+        for chunk in range(0, starts.size, EVALUATION_CHUNK)])
+    order = np.lexsort((ramps, starts, np.round(peaks, 6)))
+    return order[0], peaks[order[0]]
+
+def optimize_sequence(motors, sequence_time, ramp_times=None, config=DEFAULT_CONFIG,
+                      start_step=START_STEP, restarts=2, max_passes=20, seed=None, curves=None):
+    # Returns the best Schedule found. curves can be passed in to reuse them
+    # across calls with the same motors and sequence time.
+    curves = curves or start_curves(motors, sequence_time, ramp_times, config)
+    n = len(motors)
+    moves = [_candidate_moves(curves, motor, sequence_time, start_step) for motor in range(n)]
+    rng = np.random.default_rng(seed)
+    # Largest possible contribution first, then random orders
+    size_order = np.argsort(-curves.current.max(axis=(1, 2)), kind='stable')
+    orders = [size_order] + [rng.permutation(n) for _ in range(restarts)]
+
+    best, evaluated = None, 0
+    for order in orders:
+        start_index = np.zeros(n, dtype=np.intp)
+        ramp_index = np.zeros(n, dtype=np.intp)
+        placed = np.zeros(curves.time.size)
+
+        # Greedy placement
+        for motor in order:
+            choice, _ = _best_move(curves, motor, placed, moves[motor])
+            evaluated += moves[motor][0].size
+            start_index[motor], ramp_index[motor] = moves[motor][0][choice], moves[motor][1][choice]
+            placed += motor_current(curves, motor, start_index[[motor]], ramp_index[[motor]])[0]
+
+        # Re-place one motor at a time against all the others
+        peak = placed.max()
+        for _ in range(max_passes):
+            improved = False
+            for motor in order:
+                own = motor_current(curves, motor, start_index[[motor]], ramp_index[[motor]])[0]
+                others = placed - own
+                choice, candidate_peak = _best_move(curves, motor, others, moves[motor])
+                evaluated += moves[motor][0].size
+                if candidate_peak < peak - 1e-6:
+                    start_index[motor], ramp_index[motor] = moves[motor][0][choice], moves[motor][1][choice]
+                    placed = others + motor_current(curves, motor, start_index[[motor]],
+                                                    ramp_index[[motor]])[0]
+                    peak = placed.max()
+                    improved = True
+            if not improved:
+                break
+
+        if best is None or peak < best[0] - 1e-6:
+            best = (peak, start_index.copy(), ramp_index.copy(), placed)
+
+    peak, start_index, ramp_index, placed = best
+    return Schedule(start_times=curves.time[start_index],
+                    ramp_times=curves.ramp_times[np.arange(n), ramp_index],
+                    peak_current=float(peak), peak_time=float(curves.time[np.argmax(placed)]),
+                    evaluated=evaluated)
+
+def schedule_indices(curves, start_times, ramp_times):
+    # (start_index, ramp_index) of a schedule given in seconds; each ramp
+    # time must be one of the motor's candidates
+    start_index = np.round(np.asarray(start_times) / curves.time_step).astype(np.intp)
+    ramp_index = np.array([int(np.flatnonzero(curves.ramp_times[motor] == ramp)[0])
+                           for motor, ramp in enumerate(ramp_times)])
+    return start_index, ramp_index
+
+# =============================================================================
+# OUTPUT / COMMAND LINE
+# =============================================================================
+
+def print_schedule(motors, schedule, sequence_time, reference_peak=None):
+    print(f"\nStart Sequence: {len(motors)} motors within {sequence_time:g} s")
+    print("-" * 64)
+    print(f"{'Motor':<20}{'HP':>7}  {'Method':<14}{'Start (s)':>10}{'Ramp (s)':>10}")
+    for index in np.argsort(schedule.start_times, kind='stable'):
+        motor = motors[index]
+        print(f"{motor.name or f'motor {index + 1}':<20}{motor.power_hp:>7.0f}  {motor.method:<14}"
+              f"{schedule.start_times[index]:>10.1f}{schedule.ramp_times[index]:>10.0f}")
+    print("-" * 64)
+    print(f"  Peak Bus Current:     {schedule.peak_current:,.0f} A at {schedule.peak_time:.1f} s")
+    if reference_peak is not None:
+        print(f"  Given Schedule Peak:  {reference_peak:,.0f} A "
+              f"({1 - schedule.peak_current / reference_peak:.0%} lower)")
+    print(f"  Schedules Evaluated:  {schedule.evaluated:,}")
+
+def write_schedule_csv(motors, schedule, filename):
+    with open(filename, 'w', newline='') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(['name', 'power_hp', 'inertia', 'method', 'start_time', 'ramp_time',
+                         'load_type', 'load_factor'])
+        for motor, start_time, ramp_time in zip(motors, schedule.start_times, schedule.ramp_times):
+            writer.writerow([motor.name, f'{motor.power_hp:g}', f'{motor.inertia:g}', motor.method,
+                             f'{start_time:.1f}', f'{ramp_time:g}', motor.load_type or '',
+                             '' if motor.load_factor is None else f'{motor.load_factor:g}'])
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m vfd_simulation.sequencing',
+        description='Choose start and ramp times that minimize the peak bus current.')
+    parser.add_argument('motors', help='CSV of motors (power_hp, inertia, method, ...); '
+                                       'a ramp_time fixes that motor\'s ramp')
+    parser.add_argument('--sequence-time', type=float, required=True,
+                        help='every ramp must finish within this many seconds')
+    parser.add_argument('--start-step', type=float, default=START_STEP,
+                        help='start time resolution in seconds (default: %(default)s)')
+    parser.add_argument('--restarts', type=int, default=2,
+                        help='random placement orders tried after the largest-first one')
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--load-type', choices=LOAD_TYPES,
+                        help='default load type for motors that do not give one')
+    parser.add_argument('--csv', metavar='FILENAME', dest='csv_filename',
+                        help='write the schedule as a motors CSV for vfd_simulation.fleet')
+    args = parser.parse_args(argv)
+
+    config = DEFAULT_CONFIG.replace(load_type=args.load_type) if args.load_type else DEFAULT_CONFIG
+    motors = read_motors(args.motors)
+    curves = start_curves(motors, args.sequence_time, config=config)
+    schedule = optimize_sequence(motors, args.sequence_time, config=config,
+                                 start_step=args.start_step, restarts=args.restarts,
+                                 seed=args.seed, curves=curves)
+
+    # The file's own start times with the configured ramps, for comparison
+    # (when they fit in the sequence)
+    given_starts = np.array([motor.start_time for motor in motors])
+    given_ramps = np.array([configured_ramp(motor, config) for motor in motors])
+    reference_peak = None
+    if np.all(given_starts + given_ramps <= args.sequence_time) and \
+            all(ramp in curves.ramp_times[motor] for motor, ramp in enumerate(given_ramps)):
+        reference_peak = peak_currents(curves, *schedule_indices(curves, given_starts, given_ramps))[0]
+
+    print_schedule(motors, schedule, args.sequence_time, reference_peak)
+    if args.csv_filename:
+        write_schedule_csv(motors, schedule, args.csv_filename)
+        print(f"✓ Schedule exported to: {args.csv_filename}")
+    return schedule
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+# =============================================================================
+# VFD-Motor-Simulation: VFD vs Soft Starter Simulation Entry Point
+# =============================================================================
+# simulate(config) runs both starts, post-processes them and applies the cost
+# model. It has no side effects: no files, no printing, no plotting.
+# config.solver selects the ODE backend (see solvers.py and accelerated.py).
+# =============================================================================
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from .augmented import StartTotals, solve_augmented
+from .config import DEFAULT_CONFIG, SOLVERS, SimulationConfig
+from .costs import CostSummary, calculate_costs
+from .instrumentation import phase
+from .metrics import calculate_metrics, trapezoid
+from .solvers import solve_ivp_events, solve_odeint, start_ramp_time
+
+
+@dataclass
+class StartTrajectory:
+    time: np.ndarray  # s
+    omega_rad: np.ndarray  # rad/s
+    current: np.ndarray  # A
+    torque: np.ndarray  # Nm
+    slip: np.ndarray  # %
+    load_torque: np.ndarray = None  # Nm
+    power_in: np.ndarray = None  # kW
+    power_out: np.ndarray = None  # kW
+    efficiency: np.ndarray = None  # %
+    voltage: np.ndarray = None  # V
+    frequency: np.ndarray = None  # Hz
+    # solve_ivp backend only
+    dense: object = None  # OdeSolution: omega_rad = dense(t)[0]
+    events: dict = None  # event name -> time fired (s) or None
+    end_reason: str = None  # first terminal event, or 'timeout'
+    # config.energy_states only
+    totals: StartTotals = None  # integrated energy, I^2t and mechanical energy
+
+    @property
+    def omega_rpm(self):
+        return self.omega_rad * (60 / (2 * np.pi))
+
+    @property
+    def peak_current(self):
+        return np.max(self.current)
+
+    @property
+    def energy_kj(self):
+        if self.totals is not None:
+            return self.totals.energy_in_kj
+        return trapezoid(self.power_in, self.time)
+
+
+@dataclass
+class SimulationResult:
+    config: SimulationConfig
+    vfd: StartTrajectory
+    soft_starter: StartTrajectory
+    costs: CostSummary
+
+
+def _trajectory(method, time, omega_rad, config, **solver_output):
+    with phase('metrics'):
+        current, torque, slip, load, power_in, power_out, efficiency, voltage = \
+            calculate_metrics(time, omega_rad, method, start_ramp_time(method, config),
+                              config=config)
+    return StartTrajectory(time, omega_rad, current, torque, slip, load,
+                           power_in, power_out, efficiency, voltage, **solver_output)
+
+
+def simulate_start(method, config=DEFAULT_CONFIG):
+    # Integrate and post-process one start ('vfd' or 'soft_starter')
+    if config.solver not in SOLVERS:
+        raise ValueError(f'unknown solver {config.solver!r}; expected one of {SOLVERS}')
+
+    if config.energy_states:
+        if config.solver != 'odeint':
+            raise ValueError(f'energy_states needs the odeint solver, not {config.solver!r}')
+        with phase('solve'):
+            time, states = solve_augmented(method, config)
+        return _trajectory(method, time, states[:, 0], config,
+                           totals=StartTotals.from_state(time[-1], states[-1], config))
+
+    if config.solver == 'numba':
+        # Imported here so other backends never pay for importing Numba
+        from .accelerated import HAVE_NUMBA, accelerated_start
+        if HAVE_NUMBA:
+            # The kernels fuse integration and metrics; timed as one solve
+            with phase('solve'):
+                time, omega_rad, metrics = accelerated_start(method, config)
+            return StartTrajectory(time, omega_rad, *metrics)
+
+    if config.solver in ('odeint', 'numba'):
+        with phase('solve'):
+            time, omega_rad = solve_odeint(method, config)
+        return _trajectory(method, time, omega_rad, config)
+
+    with phase('solve'):
+        time, omega_rad, dense, events, end_reason = solve_ivp_events(method, config)
+    return _trajectory(method, time, omega_rad, config,
+                       dense=dense, events=events, end_reason=end_reason)
+
+
+def resample_start(trajectory, time, method, config=DEFAULT_CONFIG):
+    # Re-evaluate a solve_ivp start on a new time grid (within [0, t_end])
+    # from its dense output
+    time = np.asarray(time, dtype=float)
+    return _trajectory(method, time, trajectory.dense(time)[0], config,
+                       dense=trajectory.dense, events=trajectory.events,
+                       end_reason=trajectory.end_reason)
+
+
+def simulate(config=DEFAULT_CONFIG):
+    vfd = simulate_start('vfd', config)
+    soft_starter = simulate_start('soft_starter', config)
+    with phase('costs'):
+        costs = calculate_costs(config, vfd, soft_starter)
+    return SimulationResult(config, vfd, soft_starter, costs)
@@ -0,0 +1,168 @@
+# =============================================================================
+# VFD-Motor-Simulation: ODE Solver Backends
+# =============================================================================
+# 'odeint' integrates each start on the fixed grid
+# linspace(0, ramp_time, time_points). 'solve_ivp' steps adaptively with
+# dense output and ends the start at the first terminal event:
+#   reached_speed  speed within config.speed_tolerance of synchronous speed
+#   stall          motor decelerating between STALL_MIN_SPEED and the
+#                  running speed, or not accelerating there once the
+#                  starter is at full output
+#   over_current   current above config.current_limit_fla x FLA
+# A start that has none of these by HORIZON_FACTOR x ramp time ends with
+# 'timeout'. The output grid is linspace(0, t_end, time_points); the dense
+# solution can be resampled on any other grid afterwards.
+# Both backends integrate the compiled right-hand sides from models.py
+# (constants and load model resolved once per start; tabulated curves when
+# config.lookup_tolerance is set) and use the analytic Jacobians instead of
+# estimating them by finite differences.
+# =============================================================================
+
+import numpy as np
+from scipy.integrate import odeint, solve_ivp
+
+from .config import DEFAULT_CONFIG
+from .instrumentation import enabled, record_odeint, record_solve_ivp
+from .metrics import start_current
+from .models import (
+    make_soft_start_dynamics, make_soft_start_table_dynamics, make_vfd_dynamics,
+    make_vfd_table_dynamics, soft_start_motor_dynamics, soft_start_motor_jacobian,
+    vfd_motor_dynamics, vfd_motor_jacobian,
+)
+from .steadystate import solve_slip
+
+# solve_ivp settings. LSODA matches odeint's integrator, so the two backends
+# differ only in step control and output handling.
+IVP_METHOD = 'LSODA'
+IVP_RTOL = 1e-6
+IVP_ATOL = 1e-6
+
+# Longest solve_ivp start, as a multiple of the ramp time
+HORIZON_FACTOR = 2.0
+
+# Below this fraction of synchronous speed the model lets the motor sag or
+# roll back while the VFD is under a few hertz or the soft starter is at its
+# initial voltage, and it recovers as the output rises; that is not a stall.
+# Above it, deceleration means the load has overcome the motor (e.g. the
+# constant-power load step at 10% speed, where the solver would otherwise
+# chatter indefinitely).
+STALL_MIN_SPEED = 0.05
+
+# Acceleration also falls to zero at the running point, so deceleration only
+# counts as a stall while the slip is above STALL_SLIP_FACTOR x the
+# steady-state slip at full output (margin for the tabulated curves)
+STALL_SLIP_FACTOR = 2.0
+
+EVENTS = ('reached_speed', 'stall', 'over_current')
+
+# =============================================================================
+# START SETUP
+# =============================================================================
+
+def start_dynamics(method):
+    # Reference dynamics, called with (state, t, *args)
+    return vfd_motor_dynamics if method == 'vfd' else soft_start_motor_dynamics
+
+def start_rhs(method, config=DEFAULT_CONFIG):
+    # Compiled rhs(state, t) -> float for one start
+    if config.lookup_tolerance is not None:
+        make = make_vfd_table_dynamics if method == 'vfd' else make_soft_start_table_dynamics
+    else:
+        make = make_vfd_dynamics if method == 'vfd' else make_soft_start_dynamics
+    return make(config.load_torque, config.load_type, start_ramp_time(method, config), config)
+
+def start_jacobian(method):
+    return vfd_motor_jacobian if method == 'vfd' else soft_start_motor_jacobian
+
+def start_ramp_time(method, config=DEFAULT_CONFIG):
+    return config.vfd_ramp_time if method == 'vfd' else config.soft_start_ramp_time
+
+def stall_max_speed(config=DEFAULT_CONFIG):
+    # Speed (rad/s) above which the start is past the stall region; unbounded
+    # when the load exceeds breakdown torque and there is no running point
+    running_slip = solve_slip(1.0, config.load_torque_factor, config.load_type, config)[0]
+    if np.isnan(running_slip):
+        return np.inf
+    return config.sync_speed_rad * (1 - STALL_SLIP_FACTOR * running_slip)
+
+def start_events(method, ramp_time, config=DEFAULT_CONFIG):
+    # Terminal event functions keyed by name; each one crosses zero from
+    # above when it fires
+    rhs = start_rhs(method, config)
+    events = {}
+
+    if config.speed_tolerance is not None:
+        target_speed = config.sync_speed_rad * (1 - config.speed_tolerance)
+        events['reached_speed'] = lambda t, y: target_speed - y[0]
+
+    min_speed = STALL_MIN_SPEED * config.sync_speed_rad
+    max_speed = stall_max_speed(config)
+    def stall(t, y):
+        if y[0] >= max_speed:
+            return 1.0
+        if y[0] > min_speed or t >= ramp_time:
+            return rhs(y, t)
+        return 1.0
+    events['stall'] = stall
+
+    if config.current_limit_fla is not None:
+        current_limit = config.current_limit_fla * config.fla
+        events['over_current'] = \
+            lambda t, y: current_limit - start_current(method, t, y[0], ramp_time, config)
+
+    for event in events.values():
+        event.terminal = True
+        event.direction = -1
+    return events
+
+# =============================================================================
+# SOLVER BACKENDS
+# =============================================================================
+
+def solve_odeint(method, config=DEFAULT_CONFIG, jacobian=True):
+    # Returns (time, omega_rad) on the fixed output grid. jacobian=False
+    # falls back to odeint's finite-difference Jacobian.
+    ramp_time = start_ramp_time(method, config)
+    time = np.linspace(0, ramp_time, config.time_points)
+    args = (config.load_torque, config.load_type, ramp_time, config)
+    jac = start_jacobian(method)
+    full_output = enabled()
+    solution = odeint(start_rhs(method, config), [0], time,
+                      Dfun=(lambda y, t: jac(y, t, *args)) if jacobian else None,
+                      full_output=full_output)
+    if full_output:
+        solution, info = solution
+        record_odeint(method, time, info)
+    return time, solution[:, 0]
+
+def solve_ivp_events(method, config=DEFAULT_CONFIG, use_events=True, jacobian=True):
+    # Returns (time, omega_rad, dense, event_times, end_reason). dense is the
+    # OdeSolution over [0, t_end]; event_times maps each enabled event to the
+    # time it fired (or None); end_reason is the terminal event's name, or
+    # 'timeout'. use_events=False integrates over the ramp like odeint
+    # (end_reason 'completed'), for comparing the two backends.
+    ramp_time = start_ramp_time(method, config)
+    rhs = start_rhs(method, config)
+    jac = start_jacobian(method)
+    args = (config.load_torque, config.load_type, ramp_time, config)
+    events = start_events(method, ramp_time, config) if use_events else {}
+    t_final = ramp_time * HORIZON_FACTOR if use_events else ramp_time
+
+    solution = solve_ivp(lambda t, y: rhs(y, t), (0, t_final), [0.0],
+                         method=IVP_METHOD, rtol=IVP_RTOL, atol=IVP_ATOL,
+                         jac=(lambda t, y: jac(y, t, *args)) if jacobian else None,
+                         dense_output=True, events=list(events.values()))
+    if solution.status < 0:
+        raise RuntimeError(f'solve_ivp failed for the {method} start: {solution.message}')
+    record_solve_ivp(method, solution)
+
+    event_times = {name: (float(times[0]) if len(times) else None)
+                   for name, times in zip(events, solution.t_events)}
+    fired = {name: t for name, t in event_times.items() if t is not None}
+    if fired:
+        end_reason = min(fired, key=fired.get)
+    else:
+        end_reason = 'timeout' if use_events else 'completed'
+
+    time = np.linspace(0, solution.t[-1], config.time_points)
+    return time, solution.sol(time)[0], solution.sol, event_times, end_reason
@@ -0,0 +1,240 @@
+# =============================================================================
+# VFD-Motor-Simulation: Steady-State Operating Points and Efficiency Map
+# =============================================================================
+# Equilibrium of the v4 VFD motor model at a fixed drive frequency: the slip
+# where electromagnetic torque equals the load torque plus damping, found on
+# the stable side of the torque-slip curve (below breakdown slip). Current,
+# power and efficiency follow the same simplified model as
+# calculate_metrics, so operating points agree with the end of a simulated
+# start.
+#
+# Speed setpoints are drive frequency over base frequency; a setpoint of 1
+# is also the soft starter's bypassed (across-the-line) operating point.
+# Load factors scale the load's full-speed torque as a fraction of rated.
+#
+# Usage:
+#   from vfd_simulation.steadystate import efficiency_map, solve_operating_point
+#   point = solve_operating_point(0.9, 0.75)           # scalars or arrays
+#   energy_map = efficiency_map(config)               # cached per config
+#   power_kw = energy_map.lookup('power_in', speed, load)
+# =============================================================================
+
+import argparse
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+
+from .config import DEFAULT_CONFIG, LOAD_TYPES
+from .models import (
+    TORQUE_A, TORQUE_B, TORQUE_C, _torque_ratio_slope, get_load_torque_array,
+    get_load_torque_slope_array, vfd_voltage_array,
+)
+
+# Breakdown slip of the torque-slip curve: torque rises with slip below it
+BREAKDOWN_SLIP = np.sqrt(TORQUE_C)
+SLIP_TOLERANCE = 1e-12
+MAX_ITERATIONS = 60
+
+# Efficiency map grid: speed setpoint 0-1, load factor 0-MAP_MAX_LOAD
+MAP_SPEED_POINTS = 201
+MAP_LOAD_POINTS = 151
+MAP_MAX_LOAD = 1.5
+
+
+@dataclass(frozen=True)
+class OperatingPoint:
+    # Arrays broadcast from the speed setpoint and load factor; NaN where the
+    # load exceeds breakdown torque (the motor stalls)
+    freq: np.ndarray  # Hz
+    speed_ratio: np.ndarray  # rotor speed / synchronous speed at base frequency
+    slip: np.ndarray  # fraction
+    torque: np.ndarray  # electromagnetic, N·m
+    current: np.ndarray  # A
+    voltage: np.ndarray  # V
+    power_in: np.ndarray  # motor input, kW
+    power_out: np.ndarray  # shaft, kW
+    efficiency: np.ndarray  # %
+
+    @property
+    def stalled(self):
+        return np.isnan(self.slip)
+
+
+def _motor_torque(slip, freq, config):
+    # Electromagnetic torque of vfd_motor_dynamics at fixed frequency, and
+    # its derivative with respect to slip
+    low_freq = freq < 1.0
+    boost = np.where(freq < config.base_freq * 0.15,
+                     1 + config.v_boost * (1 - freq / (config.base_freq * 0.15)), 1.0)
+    scale = config.rated_torque * (freq / config.base_freq) * boost
+    low_scale = config.rated_torque * 2.5 * (1 + config.v_boost * 5)
+
+    torque_ratio = (TORQUE_A * slip) / (slip**2 + TORQUE_B * slip + TORQUE_C)
+    torque = np.where(low_freq, low_scale * slip, scale * torque_ratio)
+    slope = np.where(low_freq, low_scale, scale * _torque_ratio_slope(slip))
+    return torque, slope
+
+def solve_slip(speed_setpoint, load_factor, load_type=None, config=DEFAULT_CONFIG):
+    # Vectorized Newton iteration on the residual
+    #   g(s) = T_em(s) - T_load(speed) - damping * speed
+    # kept inside a [lo, hi] bracket (bisecting whenever a Newton step leaves
+    # it); converges in a handful of iterations over a whole grid at once
+    if load_type is None:
+        load_type = config.load_type
+    speed_setpoint, load_factor = np.broadcast_arrays(
+        np.asarray(speed_setpoint, dtype=float), np.asarray(load_factor, dtype=float))
+    freq = speed_setpoint * config.base_freq
+    sync_speed_rad = (120 * freq / config.poles) * (2 * np.pi / 60)
+    base_torque = config.rated_torque * load_factor
+
+    def residual(slip):
+        omega_rad = sync_speed_rad * (1 - slip)
+        speed_ratio = omega_rad / config.sync_speed_rad
+        torque, torque_slope = _motor_torque(slip, freq, config)
+        load = get_load_torque_array(speed_ratio, base_torque, load_type)
+        load_slope = get_load_torque_slope_array(speed_ratio, base_torque, load_type)
+        g = torque - load - config.damping * omega_rad
+        dg = torque_slope + (load_slope / config.sync_speed_rad + config.damping) * sync_speed_rad
+        return g, dg
+
+    lo = np.zeros(freq.shape)
+    hi = np.where(freq < 1.0, 1.0, BREAKDOWN_SLIP)
+    # No equilibrium below breakdown slip; below 0.5 Hz the drive is off
+    stalled = residual(hi)[0] < 0
+    idle = freq < 0.5
+    slip = 0.5 * hi
+    for _ in range(MAX_ITERATIONS):
+        g, dg = residual(slip)
+        lo = np.where(g < 0, slip, lo)
+        hi = np.where(g >= 0, slip, hi)
+        newton = slip - g / np.where(dg > 0, dg, np.inf)
+        bracketed = (newton >= lo) & (newton <= hi)
+        step = np.where(bracketed, newton, 0.5 * (lo + hi))
+        done = stalled | idle | (np.abs(step - slip) < SLIP_TOLERANCE)
+        slip = step
+        if done.all():
+            break
+
+    return np.where(stalled | idle, np.nan, slip), freq, stalled
+
+def solve_operating_point(speed_setpoint, load_factor, load_type=None, config=DEFAULT_CONFIG):
+    if load_type is None:
+        load_type = config.load_type
+    slip, freq, stalled = solve_slip(speed_setpoint, load_factor, load_type, config)
+    load_factor = np.broadcast_to(np.asarray(load_factor, dtype=float), slip.shape)
+    # Below 0.5 Hz the drive is treated as not producing output (as in
+    # calculate_metrics): the motor is stopped and draws nothing
+    active = freq >= 0.5
+    slip_safe = np.where(active, np.nan_to_num(slip), 0.0)
+
+    sync_speed_rad = (120 * freq / config.poles) * (2 * np.pi / 60)
+    omega_rad = sync_speed_rad * (1 - slip_safe)
+    speed_ratio = omega_rad / config.sync_speed_rad
+    torque = _motor_torque(slip_safe, freq, config)[0]
+    load_torque = get_load_torque_array(speed_ratio, config.rated_torque * load_factor, load_type)
+
+    torque_component = config.fla * (torque / config.rated_torque)
+    magnetizing_component = config.fla * 0.3
+    current = np.sqrt(torque_component**2 + magnetizing_component**2)
+    voltage = vfd_voltage_array(freq, config)
+    power_in = (np.sqrt(3) * voltage * current * config.power_factor) / 1000
+    power_out = (omega_rad * load_torque) / 1000
+    efficiency = np.zeros_like(power_in)
+    np.divide(power_out, power_in, out=efficiency, where=power_in > 0)
+    efficiency *= 100
+
+    fields = [speed_ratio, slip_safe, torque, current, voltage, power_in, power_out, efficiency]
+    fields = [np.where(active, np.where(stalled, np.nan, field), 0.0) for field in fields]
+    return OperatingPoint(freq, *fields)
+
+# =============================================================================
+# EFFICIENCY MAP
+# =============================================================================
+
+@dataclass(frozen=True)
+class EfficiencyMap:
+    # Operating points on a regular (speed setpoint x load factor) grid;
+    # lookup() interpolates bilinearly, O(1) per query
+    speed_setpoints: np.ndarray
+    load_factors: np.ndarray
+    points: OperatingPoint
+
+    def lookup(self, fields, speed_setpoint, load_factor):
+        # One OperatingPoint field name, or a tuple of them (returned as a
+        # list, sharing the grid search). Queries outside the grid are
+        # clamped to its edges.
+        i, wi = _grid_position(self.speed_setpoints, speed_setpoint)
+        j, wj = _grid_position(self.load_factors, load_factor)
+        columns = self.load_factors.size
+        corner = i * columns + j
+        results = []
+        for field in ((fields,) if isinstance(fields, str) else fields):
+            values = getattr(self.points, field).ravel()
+            low_speed = values.take(corner)
+            low_speed += wj * (values.take(corner + 1) - low_speed)
+            high_speed = values.take(corner + columns)
+            high_speed += wj * (values.take(corner + columns + 1) - high_speed)
+            results.append(low_speed + wi * (high_speed - low_speed))
+        return results[0] if isinstance(fields, str) else results
+
+def _grid_position(grid, x):
+    # Cell index and fractional position of x on a uniform grid
+    x = np.clip(np.asarray(x, dtype=float), grid[0], grid[-1])
+    position = (x - grid[0]) * (1 / (grid[1] - grid[0]))
+    index = np.minimum(position.astype(np.intp), grid.size - 2)
+    return index, position - index
+
+@lru_cache(maxsize=16)
+def efficiency_map(config=DEFAULT_CONFIG, speed_points=MAP_SPEED_POINTS,
+                   load_points=MAP_LOAD_POINTS, max_load=MAP_MAX_LOAD):
+    # Solved in a single vectorized pass over the whole grid, once per config
+    speed_setpoints = np.linspace(0, 1.0, speed_points)
+    load_factors = np.linspace(0, max_load, load_points)
+    points = solve_operating_point(speed_setpoints[:, None], load_factors[None, :], config=config)
+    return EfficiencyMap(speed_setpoints, load_factors, points)
+
+def speed_reduction_savings(speed_setpoint, config=DEFAULT_CONFIG):
+    # Percent of full-speed motor input power saved at a reduced speed
+    # setpoint, at the configured load
+    point = solve_operating_point(np.array([speed_setpoint, 1.0]), config.load_torque_factor,
+                                  config=config)
+    return (1 - point.power_in[0] / point.power_in[1]) * 100
+
+# =============================================================================
+# COMMAND LINE
+# =============================================================================
+
+def print_operating_points(speed_setpoints, load_factor, config=DEFAULT_CONFIG):
+    point = solve_operating_point(speed_setpoints, load_factor, config=config)
+    full_speed_power = solve_operating_point(1.0, load_factor, config=config).power_in
+    print(f"\nSteady State: {config.power_hp}HP, {config.load_type.replace('_', ' ')} load, "
+          f"{load_factor:.0%} load factor")
+    print("-" * 78)
+    print(f"{'Setpoint':>9}{'Speed':>9}{'Slip':>8}{'Current':>10}{'P in':>10}{'P out':>10}"
+          f"{'Eff':>8}{'Saved':>9}")
+    print(f"{'(%)':>9}{'(%)':>9}{'(%)':>8}{'(A)':>10}{'(kW)':>10}{'(kW)':>10}{'(%)':>8}{'(%)':>9}")
+    for k, setpoint in enumerate(speed_setpoints):
+        if point.stalled[k]:
+            print(f"{setpoint * 100:>9.0f}   stalled: load exceeds breakdown torque")
+            continue
+        print(f"{setpoint * 100:>9.0f}{point.speed_ratio[k] * 100:>9.1f}{point.slip[k] * 100:>8.2f}"
+              f"{point.current[k]:>10.0f}{point.power_in[k]:>10.0f}{point.power_out[k]:>10.0f}"
+              f"{point.efficiency[k]:>8.1f}{(1 - point.power_in[k] / full_speed_power) * 100:>9.1f}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m vfd_simulation.steadystate',
+                                     description='Steady-state VFD operating points.')
+    parser.add_argument('--speed', type=float, nargs='+',
+                        default=[1.0, 0.9, 0.8, 0.7, 0.6, 0.5],
+                        help='speed setpoints as fractions of base frequency')
+    parser.add_argument('--load', type=float, default=DEFAULT_CONFIG.load_torque_factor,
+                        help='full-speed load torque as a fraction of rated (default: %(default)s)')
+    parser.add_argument('--load-type', choices=LOAD_TYPES, default=DEFAULT_CONFIG.load_type)
+    args = parser.parse_args(argv)
+
+    config = DEFAULT_CONFIG.replace(load_type=args.load_type)
+    print_operating_points(np.array(args.speed), args.load, config)
+
+if __name__ == '__main__':
+    main()
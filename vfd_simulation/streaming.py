@@ -0,0 +1,190 @@
+# =============================================================================
+# VFD-Motor-Simulation: Summary-Only Streaming Mode
+# =============================================================================
+# For sweeps over very many scenarios that only need the headline KPIs of
+# each start:
+#   peak current and when it occurs    running max / argmax
+#   time to speed                      first crossing of (1 - speed_tolerance)
+#                                      x synchronous speed (95% by default),
+#                                      interpolated between samples; nan if
+#                                      the start never gets there
+#   final slip and speed               last sample
+#   energy per start                   running trapezoidal integral of power_in
+# and the scenario's CostSummary from the two start energies. A start that
+# stalls (loses speed over a step between solvers.STALL_MIN_SPEED and the
+# running speed, the solve_ivp stall band) has NaN KPIs, matching the NaN row
+# sweep.summarize gives when odeint cannot integrate it.
+#
+# The start is integrated with the numba backend's RK4 kernels and each
+# sample of linspace(0, ramp_time, time_points) is fed through the
+# accumulators as soon as the step that covers it is done. No speed, current
+# or power array is allocated, so memory per scenario is constant whatever
+# the ramp length or time_points; a finer grid costs time only. The KPIs are
+# those simulate(config.replace(solver='numba')) gives from its arrays, to
+# rounding; config.solver is ignored.
+#
+# Without Numba the kernels run as plain Python (much slower);
+# accelerated.HAVE_NUMBA tells which one runs.
+#
+# Usage:
+#   summary = summarize_scenario(config)
+#   summary.vfd.peak_current, summary.soft_starter.time_to_speed,
+#   summary.costs.payback_years
+#   python -m vfd_simulation.sweep --inertia 100:300:1 --summary-only --csv kpis.csv
+# =============================================================================
+
+import math
+from dataclasses import dataclass
+
+import numpy as np
+
+from .accelerated import (
+    P_RAMP, P_SYNC_SPEED, RK4_MAX_STEP, _advance, _hermite, _jit, _point_metrics, _rhs,
+    _switch_times, start_parameters,
+)
+from .config import DEFAULT_CONFIG, SimulationConfig
+from .costs import CostSummary, calculate_costs
+from .instrumentation import phase
+from .solvers import STALL_MIN_SPEED, STALL_SLIP_FACTOR
+from .steadystate import BREAKDOWN_SLIP
+
+# KPI array layout (the kernel's output, in StartSummary field order)
+(K_PEAK_CURRENT, K_PEAK_CURRENT_TIME, K_TIME_TO_SPEED, K_FINAL_SLIP, K_FINAL_OMEGA,
+ K_ENERGY) = range(6)
+N_KPIS = 6
+
+# =============================================================================
+# SUMMARIES
+# =============================================================================
+
+@dataclass(frozen=True)
+class StartSummary:
+    peak_current: float  # A
+    peak_current_time: float  # s
+    time_to_speed: float  # s, nan if never reached
+    final_slip: float  # %
+    final_omega_rad: float  # rad/s
+    energy_kj: float  # kJ
+
+    @property
+    def stalled(self):
+        return math.isnan(self.peak_current)
+
+
+@dataclass(frozen=True)
+class ScenarioSummary:
+    config: SimulationConfig
+    vfd: StartSummary
+    soft_starter: StartSummary
+    costs: CostSummary
+
+# =============================================================================
+# KERNEL
+# =============================================================================
+
+@_jit
+def _stall_max_speed(params):
+    # solvers.stall_max_speed from the kernel's own RHS: bisect for the
+    # running speed at full output (the end of the ramp) on the stable side
+    # of the torque-slip curve
+    sync_speed_rad = params[P_SYNC_SPEED]
+    t_end = params[P_RAMP]
+    low = sync_speed_rad * (1 - BREAKDOWN_SLIP)
+    high = sync_speed_rad
+    if _rhs(low, t_end, params) < 0:
+        return math.inf
+    for _ in range(60):
+        middle = 0.5 * (low + high)
+        if _rhs(middle, t_end, params) < 0:
+            high = middle
+        else:
+            low = middle
+    return sync_speed_rad * (1 - STALL_SLIP_FACTOR * (1 - low / sync_speed_rad))
+
+@_jit
+def _summarize_rk4(params, samples, max_step, target_speed, out):
+    # Fills out (N_KPIS) from the speed at linspace(0, ramp, samples),
+    # stepping like _integrate_rk4 but keeping only the running KPIs; all
+    # NaN if a step loses speed inside the stall band
+    t_end = params[P_RAMP]
+    min_stall_speed = STALL_MIN_SPEED * params[P_SYNC_SPEED]
+    max_stall_speed = _stall_max_speed(params)
+    interval = t_end / (samples - 1)
+    switches = _switch_times(params)
+
+    peak_current = -math.inf
+    peak_current_time = 0.0
+    time_to_speed = math.nan
+    energy = 0.0
+    previous_time = 0.0
+    previous_omega = 0.0
+    previous_power = 0.0
+    slip = 0.0
+
+    t = 0.0
+    omega_rad = 0.0
+    slope = _rhs(omega_rad, t, params)
+    i = 0
+    while i < samples:
+        t_next, omega_next, slope_next, t_restart, slope_restart = \
+            _advance(t, omega_rad, slope, t_end, max_step, switches, params)
+        if omega_next < omega_rad and min_stall_speed < omega_next < max_stall_speed:
+            for k in range(N_KPIS):
+                out[k] = math.nan
+            return
+        while i < samples:
+            # np.linspace's samples: i x interval, ending exactly on t_end
+            sample_time = t_end if i == samples - 1 else i * interval
+            if sample_time > t_next and t_next < t_end:
+                break
+            sample_omega = _hermite(sample_time, t, t_next, omega_rad, omega_next,
+                                    slope, slope_next)
+            current, _, slip, _, power_in, _, _, _ = \
+                _point_metrics(sample_time, sample_omega, params)
+
+            if current > peak_current:
+                peak_current = current
+                peak_current_time = sample_time
+            if i > 0:
+                energy += 0.5 * (power_in + previous_power) * (sample_time - previous_time)
+                if math.isnan(time_to_speed) and sample_omega >= target_speed:
+                    time_to_speed = previous_time + (sample_time - previous_time) * \
+                        (target_speed - previous_omega) / (sample_omega - previous_omega)
+            previous_time = sample_time
+            previous_omega = sample_omega
+            previous_power = power_in
+            i += 1
+        t, omega_rad, slope = t_restart, omega_next, slope_restart
+
+    out[K_PEAK_CURRENT] = peak_current
+    out[K_PEAK_CURRENT_TIME] = peak_current_time
+    out[K_TIME_TO_SPEED] = time_to_speed
+    out[K_FINAL_SLIP] = slip
+    out[K_FINAL_OMEGA] = previous_omega
+    out[K_ENERGY] = energy
+
+# =============================================================================
+# STREAMING SIMULATION
+# =============================================================================
+
+def summarize_start(method, config=DEFAULT_CONFIG, max_step=RK4_MAX_STEP):
+    if config.time_points < 2:
+        raise ValueError(f'time_points must be at least 2, not {config.time_points}')
+    params = tuple(start_parameters(method, config))
+    if config.speed_tolerance is None:
+        target_speed = math.inf
+    else:
+        target_speed = config.sync_speed_rad * (1 - config.speed_tolerance)
+    kpis = np.empty(N_KPIS)
+    with phase('solve'):
+        _summarize_rk4(params, config.time_points, max_step, target_speed, kpis)
+    return StartSummary(*(float(kpi) for kpi in kpis))
+
+
+def summarize_scenario(config=DEFAULT_CONFIG):
+    # simulate() reduced to the KPIs; costs are billed from the start energies
+    vfd = summarize_start('vfd', config)
+    soft_starter = summarize_start('soft_starter', config)
+    with phase('costs'):
+        costs = calculate_costs(config, vfd.energy_kj, soft_starter.energy_kj)
+    return ScenarioSummary(config, vfd, soft_starter, costs)
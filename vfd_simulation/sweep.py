@@ -0,0 +1,217 @@
+# =============================================================================
+# VFD-Motor-Simulation: Parameter Sweeps
+# =============================================================================
+# Runs the v4 comparison over a grid of configurations on a process pool and
+# keeps only the summary metrics of each run.
+#
+# Quick Start:
+#   python -m vfd_simulation.sweep --vfd-ramp-time 10:40:5 --inertia 100,150,200
+#   python -m vfd_simulation.sweep --v-boost 0:0.3:0.05 --workers 8 --csv sweep.csv
+#   python -m vfd_simulation.sweep --inertia 100:300:50 --instrument runs.jsonl
+#   python -m vfd_simulation.sweep --inertia 100:300:1 --summary-only --csv kpis.csv
+#
+# --summary-only runs each scenario through the streaming KPI kernels
+# (streaming.py) instead of simulate(): no trajectory arrays, constant memory
+# per scenario, and time-to-speed columns added.
+#
+# Grid specs are either a comma-separated list (100,150,200) or an inclusive
+# range start:stop:step (10:40:5).
+# =============================================================================
+
+import argparse
+import csv
+import itertools
+import os
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import numpy as np
+from scipy.integrate import ODEintWarning
+
+from .config import DEFAULT_CONFIG, LOAD_TYPES
+from .instrumentation import instrument, write_record
+from .simulation import simulate
+from .streaming import summarize_scenario
+
+# Swept parameters: CLI option -> SimulationConfig field
+SWEEP_PARAMETERS = {
+    'vfd-ramp-time': 'vfd_ramp_time',
+    'soft-start-ramp-time': 'soft_start_ramp_time',
+    'v-boost': 'v_boost',
+    'soft-start-initial-voltage': 'soft_start_initial_voltage',
+    'inertia': 'inertia',
+    'load-torque-factor': 'load_torque_factor',
+}
+
+SUMMARY_COLUMNS = (
+    'vfd_peak_current', 'ss_peak_current',  # A
+    'vfd_energy_kj', 'ss_energy_kj',  # kJ per start
+    'vfd_final_slip', 'ss_final_slip',  # %
+    'payback_years',
+)
+
+# --summary-only adds the time to (1 - speed_tolerance) x synchronous speed
+STREAMING_COLUMNS = SUMMARY_COLUMNS + ('vfd_time_to_speed', 'ss_time_to_speed')  # s
+
+# =============================================================================
+# GRID CONSTRUCTION
+# =============================================================================
+
+def parse_spec(spec):
+    # '100,150,200' -> [100, 150, 200]; '10:40:5' -> [10, 15, ..., 40]
+    if ':' in spec:
+        start, stop, step = (float(part) for part in spec.split(':'))
+        if step <= 0:
+            raise ValueError(f'range step must be positive: {spec!r}')
+        count = int(np.floor((stop - start) / step + 1e-9)) + 1
+        return [round(start + i * step, 12) for i in range(count)]
+    return [float(value) for value in spec.split(',')]
+
+def expand_grid(grid, base_config=DEFAULT_CONFIG):
+    # Full Cartesian product of {field: values}; the last field varies fastest
+    fields = list(grid)
+    return [base_config.replace(**dict(zip(fields, values)))
+            for values in itertools.product(*(grid[field] for field in fields))]
+
+# =============================================================================
+# SWEEP EXECUTION
+# =============================================================================
+
+def summarize(config):
+    # Simulate one configuration and reduce it to the summary metrics. A
+    # start the solver cannot integrate (odeint warns, solve_ivp raises)
+    # gives a row of NaN, as simulate_batch does.
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter('error', ODEintWarning)
+            result = simulate(config)
+    except (ODEintWarning, RuntimeError):
+        return dict.fromkeys(SUMMARY_COLUMNS, np.nan)
+    return {
+        'vfd_peak_current': result.vfd.peak_current,
+        'ss_peak_current': result.soft_starter.peak_current,
+        'vfd_energy_kj': result.vfd.energy_kj,
+        'ss_energy_kj': result.soft_starter.energy_kj,
+        'vfd_final_slip': result.vfd.slip[-1],
+        'ss_final_slip': result.soft_starter.slip[-1],
+        'payback_years': result.costs.payback_years,
+    }
+
+def stream_summary(config):
+    # summarize() from the streaming kernels, plus the times to speed; a
+    # stalled start gives a row of NaN, as in summarize()
+    result = summarize_scenario(config)
+    if result.vfd.stalled or result.soft_starter.stalled:
+        return dict.fromkeys(STREAMING_COLUMNS, np.nan)
+    return {
+        'vfd_peak_current': result.vfd.peak_current,
+        'ss_peak_current': result.soft_starter.peak_current,
+        'vfd_energy_kj': result.vfd.energy_kj,
+        'ss_energy_kj': result.soft_starter.energy_kj,
+        'vfd_final_slip': result.vfd.final_slip,
+        'ss_final_slip': result.soft_starter.final_slip,
+        'payback_years': result.costs.payback_years,
+        'vfd_time_to_speed': result.vfd.time_to_speed,
+        'ss_time_to_speed': result.soft_starter.time_to_speed,
+    }
+
+def instrumented_summary(config, task=summarize):
+    # task(config) with the run's instrumentation record (phase times,
+    # solver statistics) added under 'instrumentation'
+    with instrument('sweep') as record:
+        summary = task(config)
+    return {**summary, 'instrumentation': record.as_dict()}
+
+def run_sweep(configs, workers=None, chunksize=None, task=summarize):
+    # Returns one summary dict per config, in input order. workers=None uses
+    # every core; workers=1 runs in-process.
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(configs) == 1:
+        return [task(config) for config in configs]
+
+    # A single start takes tens of milliseconds, so hand each worker a few
+    # large chunks rather than paying the IPC round trip per scenario
+    if chunksize is None:
+        chunksize = max(1, len(configs) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(task, configs, chunksize=chunksize))
+
+def sweep(grid, base_config=DEFAULT_CONFIG, workers=None, task=summarize,
+          columns=SUMMARY_COLUMNS):
+    # Returns (rows, columns): one dict per grid point holding the swept
+    # parameter values followed by the task's summary columns
+    configs = expand_grid(grid, base_config)
+    summaries = run_sweep(configs, workers, task=task)
+    rows = [{**{field: getattr(config, field) for field in grid}, **summary}
+            for config, summary in zip(configs, summaries)]
+    return rows, list(grid) + list(columns)
+
+# =============================================================================
+# OUTPUT
+# =============================================================================
+
+def write_sweep_csv(rows, columns, filename):
+    with open(filename, 'w', newline='') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(columns)
+        for row in rows:
+            writer.writerow([f'{row[column]:.6g}' for column in columns])
+
+def print_sweep_table(rows, columns):
+    widths = [max(len(column), 12) for column in columns]
+    print("  ".join(f"{column:>{width}}" for column, width in zip(columns, widths)))
+    print("-" * (sum(widths) + 2 * (len(widths) - 1)))
+    for row in rows:
+        print("  ".join(f"{row[column]:>{width}.4g}" for column, width in zip(columns, widths)))
+
+# =============================================================================
+# COMMAND LINE
+# =============================================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m vfd_simulation.sweep',
+        description='Sweep the v4 VFD vs soft starter comparison over a parameter grid.')
+    for option in SWEEP_PARAMETERS:
+        parser.add_argument(f'--{option}', metavar='SPEC',
+                            help='comma list or start:stop:step range')
+    parser.add_argument('--load-type', choices=LOAD_TYPES, default=DEFAULT_CONFIG.load_type)
+    parser.add_argument('--workers', type=int, default=None,
+                        help='worker processes (default: all cores)')
+    parser.add_argument('--csv', metavar='FILENAME', dest='csv_filename',
+                        help='write the result table to CSV instead of the console')
+    parser.add_argument('--instrument', metavar='FILENAME',
+                        help="append one JSON line per scenario with its phase wall times and "
+                             "solver statistics to FILENAME ('-' for stderr)")
+    parser.add_argument('--summary-only', action='store_true',
+                        help='stream each start through running KPI accumulators (peak current, '
+                             'time to speed, final slip, energy, cost) without trajectory arrays')
+    args = parser.parse_args(argv)
+
+    grid = {field: parse_spec(getattr(args, field))
+            for field in SWEEP_PARAMETERS.values() if getattr(args, field)}
+    if not grid:
+        parser.error('give at least one parameter to sweep, e.g. --inertia 100,150,200')
+
+    base_config = DEFAULT_CONFIG.replace(load_type=args.load_type)
+    task, columns = (stream_summary, STREAMING_COLUMNS) if args.summary_only \
+        else (summarize, SUMMARY_COLUMNS)
+    if args.instrument:
+        task = partial(instrumented_summary, task=task)
+    rows, columns = sweep(grid, base_config, args.workers, task=task, columns=columns)
+    if args.instrument:
+        for row in rows:
+            record = row.pop('instrumentation')
+            record['tags'] = {field: row[field] for field in grid}
+            write_record(record, args.instrument)
+
+    if args.csv_filename:
+        write_sweep_csv(rows, columns, args.csv_filename)
+        print(f"✓ {len(rows)} scenarios exported to: {args.csv_filename}")
+    else:
+        print_sweep_table(rows, columns)
+    return rows
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,269 @@
+# =============================================================================
+# VFD-Motor-Simulation: Tariff Engine (Time-of-Use Energy and Demand Charges)
+# =============================================================================
+# Bills power profiles binned into demand intervals (15 min by default):
+#   energy  each interval's kWh at the rate of the time-of-use period it
+#           falls in
+#   demand  $/kW on each billing month's peak interval demand (average kW
+#           over the interval), overall and/or within a period (e.g. summer
+#           on-peak)
+# Periods are resolved per (month, weekday/weekend, hour of day) into a
+# lookup table, so binning a year of intervals is a single gather, and
+# profiles are billed as (motors x intervals) arrays in one pass.
+#
+# The interval calendar starts at CALENDAR_START, a non-leap year beginning
+# on a Wednesday; config.tariff = None bills energy_cost_per_kwh flat with
+# no demand charge.
+#
+# Command line: python -m vfd_simulation --tariff tariff.json (or 'example')
+#
+# Tariff file (JSON; hours are [start, end) and may wrap past midnight):
+#   {"name": "TOU", "demand_rate": 8.0, "interval_minutes": 15,
+#    "periods": [{"name": "on_peak", "energy_rate": 0.22, "demand_rate": 18,
+#                 "hours": [12, 18], "months": [6, 7, 8, 9], "weekdays_only": true},
+#                {"name": "off_peak", "energy_rate": 0.08}]}
+# =============================================================================
+
+import json
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+
+from .config import DEFAULT_CONFIG
+
+MONTHS = tuple(range(1, 13))
+DEMAND_INTERVAL = 900  # s (15-minute demand intervals)
+CALENDAR_START = np.datetime64('2025-01-01T00:00:00', 's')
+HOURS_PER_YEAR = 8760
+
+# Runs in the annual cost model start at this hour and are spread evenly
+# over the year (two starts a day: 06:00 and 18:00)
+FIRST_START_HOUR = 6
+
+
+@dataclass(frozen=True)
+class TariffPeriod:
+    name: str
+    energy_rate: float  # $/kWh
+    demand_rate: float = 0.0  # $/kW on the month's peak demand within this period
+    hours: tuple = (0, 24)  # [start, end) hour of day
+    months: tuple = MONTHS
+    weekdays_only: bool = False
+
+
+@dataclass(frozen=True)
+class Tariff:
+    periods: tuple  # the first period matching an interval applies
+    demand_rate: float = 0.0  # $/kW on the month's peak demand (any time)
+    interval: float = DEMAND_INTERVAL  # s
+    name: str = ''
+
+    @property
+    def interval_hours(self):
+        return self.interval / 3600
+
+    @property
+    def has_demand_charges(self):
+        return self.demand_rate > 0 or any(period.demand_rate > 0 for period in self.periods)
+
+
+def flat_tariff(energy_rate):
+    return Tariff((TariffPeriod('flat', energy_rate),), name='flat')
+
+# Example commercial/industrial tariff: summer weekday afternoons on-peak,
+# weekday shoulders mid-peak, everything else off-peak
+EXAMPLE_TOU_TARIFF = Tariff(
+    periods=(
+        TariffPeriod('summer_on_peak', 0.22, demand_rate=18.0, hours=(12, 18),
+                     months=(6, 7, 8, 9), weekdays_only=True),
+        TariffPeriod('mid_peak', 0.14, hours=(8, 22), weekdays_only=True),
+        TariffPeriod('off_peak', 0.08),
+    ),
+    demand_rate=8.0,
+    name='example TOU',
+)
+
+def config_tariff(config=DEFAULT_CONFIG):
+    return config.tariff if config.tariff is not None else flat_tariff(config.energy_cost_per_kwh)
+
+def read_tariff(filename):
+    with open(filename) as tariff_file:
+        spec = json.load(tariff_file)
+    periods = tuple(
+        TariffPeriod(period['name'], float(period['energy_rate']),
+                     float(period.get('demand_rate', 0.0)),
+                     tuple(period.get('hours', (0, 24))),
+                     tuple(period.get('months', MONTHS)),
+                     bool(period.get('weekdays_only', False)))
+        for period in spec['periods'])
+    return Tariff(periods, float(spec.get('demand_rate', 0.0)),
+                  60 * float(spec.get('interval_minutes', DEMAND_INTERVAL / 60)),
+                  spec.get('name', str(filename)))
+
+# =============================================================================
+# INTERVAL CALENDAR
+# =============================================================================
+
+@dataclass(frozen=True)
+class TariffCalendar:
+    period: np.ndarray  # tariff period index of each interval
+    month_starts: np.ndarray  # first interval of each billing month
+    energy_rate: np.ndarray  # $/kWh of each interval
+
+
+def period_table(tariff):
+    # Period index for every (month, weekend, hour of day)
+    table = np.full((12, 2, 24), -1, dtype=np.intp)
+    hour = np.arange(24)
+    for index in reversed(range(len(tariff.periods))):
+        period = tariff.periods[index]
+        start, end = period.hours
+        hours = (hour >= start) & (hour < end) if start <= end else (hour >= start) | (hour < end)
+        for month in period.months:
+            table[month - 1, 0, hours] = index
+            if not period.weekdays_only:
+                table[month - 1, 1, hours] = index
+    if (table < 0).any():
+        raise ValueError(f"tariff {tariff.name!r} does not cover every hour; "
+                         "add a catch-all period last")
+    return table
+
+@lru_cache(maxsize=32)
+def tariff_calendar(tariff, intervals, start=CALENDAR_START):
+    times = start + np.arange(intervals) * np.timedelta64(int(tariff.interval), 's')
+    months = times.astype('datetime64[M]')
+    days = times.astype('datetime64[D]')
+    month = months.astype(np.int64) % 12
+    weekend = (days.astype(np.int64) + 3) % 7 >= 5  # 1970-01-01 was a Thursday
+    hour = (times - days).astype('timedelta64[h]').astype(np.intp)
+
+    period = period_table(tariff)[month, weekend.astype(np.intp), hour]
+    month_starts = np.flatnonzero(np.r_[True, months[1:] != months[:-1]])
+    energy_rate = np.array([p.energy_rate for p in tariff.periods])[period]
+    return TariffCalendar(period, month_starts, energy_rate)
+
+# =============================================================================
+# BILLING
+# =============================================================================
+
+@dataclass(frozen=True)
+class TariffCharges:
+    # Per profile (leading axes of the billed array)
+    energy_kwh: np.ndarray
+    energy_cost: np.ndarray  # $
+    demand_cost: np.ndarray  # $
+    peak_demand_kw: np.ndarray  # (..., months) monthly peak interval demand
+
+    @property
+    def total_cost(self):
+        return self.energy_cost + self.demand_cost
+
+
+def apply_tariff(tariff, interval_kwh, start=CALENDAR_START):
+    # interval_kwh: (..., intervals) energy per demand interval, e.g. one
+    # row per motor
+    interval_kwh = np.asarray(interval_kwh, dtype=float)
+    calendar = tariff_calendar(tariff, interval_kwh.shape[-1], start)
+    demand_kw = interval_kwh / tariff.interval_hours
+
+    peak_demand_kw = np.maximum.reduceat(demand_kw, calendar.month_starts, axis=-1)
+    demand_cost = tariff.demand_rate * peak_demand_kw.sum(axis=-1)
+    for index, period in enumerate(tariff.periods):
+        if period.demand_rate > 0:
+            in_period = np.where(calendar.period == index, demand_kw, 0.0)
+            period_peak = np.maximum.reduceat(in_period, calendar.month_starts, axis=-1)
+            demand_cost = demand_cost + period.demand_rate * period_peak.sum(axis=-1)
+
+    return TariffCharges(
+        energy_kwh=interval_kwh.sum(axis=-1),
+        energy_cost=interval_kwh @ calendar.energy_rate,
+        demand_cost=demand_cost,
+        peak_demand_kw=peak_demand_kw,
+    )
+
+def start_energy_curve(start):
+    # (elapsed s, cumulative kWh) of one start: a StartTrajectory's power_in
+    # profile, or a start energy in kJ taken as drawn at once
+    if getattr(start, 'power_in', None) is None:
+        return np.array([0.0, 1e-9]), np.array([0.0, float(start) / 3600])
+    time = np.asarray(start.time, dtype=float)
+    power_kw = np.asarray(start.power_in, dtype=float)
+    energy_kj = np.cumsum(np.diff(time) * 0.5 * (power_kw[1:] + power_kw[:-1]))
+    return time - time[0], np.r_[0.0, energy_kj] / 3600
+
+def start_duration(start, ramp_time):
+    # Length (s) of a start: its trajectory's span, or ramp_time for a start
+    # given as an energy in kJ
+    if getattr(start, 'power_in', None) is None:
+        return float(ramp_time)
+    return float(start.time[-1] - start.time[0])
+
+def bin_starts(start_times, start, intervals, interval=DEMAND_INTERVAL):
+    # kWh per interval of starts beginning at start_times (s); start energy
+    # past the last interval wraps around to the first
+    elapsed, energy_kwh = start_energy_curve(start)
+    start_times = np.asarray(start_times, dtype=float)
+    spanned = int(elapsed[-1] // interval) + 2
+    first = (start_times // interval).astype(np.intp)
+    edges = (first[:, None] + np.arange(spanned + 1)) * interval
+    cumulative = np.interp(edges - start_times[:, None], elapsed, energy_kwh)
+    index = (first[:, None] + np.arange(spanned)) % intervals
+    return np.bincount(index.ravel(), weights=np.diff(cumulative, axis=1).ravel(),
+                       minlength=intervals)
+
+# =============================================================================
+# ANNUAL PROFILE OF THE v4 COST MODEL
+# =============================================================================
+
+def annual_schedule(config=DEFAULT_CONFIG):
+    # starts_per_year runs evenly spaced over the year from FIRST_START_HOUR,
+    # together lasting annual_hours; returns start times (s) and run length (s)
+    starts = max(int(config.starts_per_year), 1)
+    spacing = HOURS_PER_YEAR * 3600 / starts
+    run_time = min(config.annual_hours * 3600 / starts, spacing)
+    start_times = (FIRST_START_HOUR * 3600 + np.arange(starts) * spacing) % (HOURS_PER_YEAR * 3600)
+    return start_times, run_time
+
+def running_hours(config=DEFAULT_CONFIG, interval=DEMAND_INTERVAL, delay=0.0):
+    # Running time (h) in each interval of the year under annual_schedule,
+    # each run beginning delay s after its start time
+    start_times, run_time = annual_schedule(config)
+    start_times = start_times + delay
+    intervals = int(HOURS_PER_YEAR * 3600 // interval)
+    spanned = int(run_time // interval) + 2
+    first = (start_times // interval).astype(np.intp)
+    edges = (first[:, None] + np.arange(spanned + 1)) * interval
+    on_time = np.clip(edges - start_times[:, None], 0, run_time)
+    index = (first[:, None] + np.arange(spanned)) % intervals
+    return np.bincount(index.ravel(), weights=np.diff(on_time, axis=1).ravel(),
+                       minlength=intervals) / 3600
+
+def annual_charges(config, vfd_start, ss_start):
+    # Bills the v4 operating year (motor at rated load for annual_hours,
+    # starts_per_year starts) as: base running load, plus VFD continuous
+    # losses, plus each method's starts. Each run is at rated load from the
+    # end of its start, so the start interval is billed at the start's power
+    # profile only, not at running power as well; the base load therefore
+    # shifts with each method's start duration. Returns the charges of each
+    # profile in the order: soft starter base, vfd base, vfd running, vfd,
+    # soft starter.
+    tariff = config_tariff(config)
+    start_times, _ = annual_schedule(config)
+    base_kw = config.power_kw / config.efficiency
+    loss_kw = config.vfd_continuous_loss_pct * config.power_kw
+    intervals = int(HOURS_PER_YEAR * 3600 // tariff.interval)
+    if config.starts_per_year > 0:
+        vfd_delay = start_duration(vfd_start, config.vfd_ramp_time)
+        ss_delay = start_duration(ss_start, config.soft_start_ramp_time)
+        vfd_starts = bin_starts(start_times, vfd_start, intervals, tariff.interval)
+        ss_starts = bin_starts(start_times, ss_start, intervals, tariff.interval)
+    else:
+        vfd_delay = ss_delay = 0.0
+        vfd_starts = ss_starts = np.zeros(intervals)
+    vfd_hours = running_hours(config, tariff.interval, vfd_delay)
+    ss_base = running_hours(config, tariff.interval, ss_delay) * base_kw
+    vfd_running = vfd_hours * (base_kw + loss_kw)
+    profiles = np.stack([ss_base, vfd_hours * base_kw, vfd_running, vfd_running + vfd_starts,
+                         ss_base + ss_starts])
+    return apply_tariff(tariff, profiles)